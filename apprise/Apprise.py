@@ -24,7 +24,15 @@
 # THE SOFTWARE.
 
 import re
+import atexit
 import logging
+import threading
+from hashlib import md5
+from time import time
+from time import sleep
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+from weakref import WeakSet
 from markdown import markdown
 
 from .common import NotifyType
@@ -34,6 +42,7 @@ from .utils import compat_is_basestring
 from .utils import GET_SCHEMA_RE
 
 from .AppriseAsset import AppriseAsset
+from .profiler import AppriseProfiler
 
 from . import NotifyBase
 from . import plugins
@@ -44,6 +53,36 @@ logger = logging.getLogger(__name__)
 # Build a list of supported plugins
 SCHEMA_MAP = {}
 
+# How each notification in a digest is presented (the heading used when it
+# has a title) and what separates them
+DIGEST_FORMAT_MAP = {
+    NotifyFormat.TEXT: ('{title}\r\n{body}', '\r\n\r\n'),
+    NotifyFormat.MARKDOWN: ('**{title}**\n{body}', '\n\n---\n\n'),
+    NotifyFormat.HTML: ('<b>{title}</b><br/>\r\n{body}', '<hr/>\r\n'),
+}
+
+# A digest takes on the most severe type of the notifications it contains
+DIGEST_SEVERITY_MAP = {
+    NotifyType.INFO: 0,
+    NotifyType.SUCCESS: 1,
+    NotifyType.WARNING: 2,
+    NotifyType.FAILURE: 3,
+}
+
+# The Apprise objects holding onto digests; whatever they hold is sent
+# before we exit
+_DIGESTING = WeakSet()
+
+
+@atexit.register
+def _flush_at_exit():
+    """
+    Sends the digests still waiting to be sent when we exit
+
+    """
+    for apprise in list(_DIGESTING):
+        apprise.flush()
+
 
 # Load our Lookup Matrix
 def __load_matrix():
@@ -95,13 +134,34 @@ class Apprise(object):
     Our Notification Manager
 
     """
-    def __init__(self, servers=None, asset=None):
+
+    # The maximum number of recently sent notifications we track for our
+    # duplicate suppression; the oldest are forgotten first
+    dedup_max_entries = 10000
+
+    # The least amount of time (in seconds) our digests are sent apart from
+    # one another in the background; see digest_window
+    digest_min_delay = 0.01
+
+    def __init__(self, servers=None, asset=None, dedup_window=None,
+                 digest_window=None, digest_max=None):
         """
         Loads a set of server urls while applying the Asset() module to each
         if specified.
 
         If no asset is provided, then the default asset is used.
 
+        If a dedup_window (in seconds) is specified, then a notification
+        identical (same title, body and type) to one already successfully
+        sent to the same server within this window is suppressed.
+
+        If a digest_window (in seconds) is specified, then notifications are
+        held onto (per server) and sent as one combined digest once the
+        window has passed, digest_max notifications were gathered or the
+        digest grows as large as the server allows.  Digests are sent in
+        the background once their window passes; whatever is left is sent
+        when flush() is called (or when Python exits).
+
         """
 
         # Initialize a server list of URLs
@@ -117,6 +177,55 @@ class Apprise(object):
             # Load our default configuration
             self.asset = AppriseAsset()
 
+        # Duplicate suppression
+        self.dedup_window = dedup_window
+
+        # The notifications successfully sent within our dedup_window; our
+        # keys are a fingerprint of the message and the server it was sent to
+        # and our values are the time they expire.  Since every entry lives
+        # for the same amount of time, the oldest entries are always first.
+        self._recent = OrderedDict()
+
+        # The number of notifications suppressed
+        self.suppressed = 0
+
+        # Digest handling
+        self.digest_window = digest_window
+        self.digest_max = digest_max
+
+        # The digests we're building; our keys are the server and our values
+        # are a list of the server, the time our digest was started, the
+        # notifications in it and the length of the body they'll be sent as
+        self._digests = dict()
+
+        # The thread sending our digests once they've waited long enough;
+        # it's only running while we're holding onto digests
+        self._flusher = None
+
+        # We may be notified from several threads at once; our lock guards
+        # our duplicate suppression and digests while each of our servers
+        # has a lock of its own that it's notified under.  Our plugins keep
+        # state (logins, their circuit breaker, their deadline, etc) between
+        # calls so no server is ever notified by two threads at once.
+        self._lock = threading.RLock()
+        self._server_locks = WeakKeyDictionary()
+
+        # Callables invoked before every notification sent to a server; each
+        # is passed the server, title, body and notify_type
+        self.pre_send_hooks = []
+
+        # Callables invoked after every notification sent to a server; each
+        # is passed the server, whether it was successful and the number of
+        # seconds it took
+        self.send_hooks = []
+
+        # Our profiler (see AppriseProfiler); it can also be turned on
+        # through our environment
+        self.profiler = None
+        profiler = AppriseProfiler.from_environment()
+        if profiler is not None:
+            profiler.attach(self)
+
         if servers:
             self.add(servers)
 
@@ -165,6 +274,10 @@ class Apprise(object):
         # Build a list of tags to associate with the newly added notifications
         results['tag'] = set(parse_list(tag))
 
+        if asset:
+            # Our plugin shares our asset
+            results['asset'] = asset
+
         if suppress_exceptions:
             try:
                 # Attempt to create an instance of our plugin using the parsed
@@ -198,7 +311,17 @@ class Apprise(object):
         being added. tagging a service allows you to exclusively access them
         when calling the notify() function.
         """
+        if self.profiler is None:
+            return self._add(servers, asset=asset, tag=tag)
+
+        with self.profiler.profile('add'):
+            return self._add(servers, asset=asset, tag=tag)
 
+    def _add(self, servers, asset=None, tag=None):
+        """
+        Adds one or more server URLs into our list (see add())
+
+        """
         # Initialize our return status
         return_status = True
 
@@ -237,9 +360,53 @@ class Apprise(object):
 
         """
         self.servers[:] = []
+        with self._lock:
+            self._recent.clear()
+            self._digests.clear()
+
+    def _is_duplicate(self, fingerprint, server, now):
+        """
+        Returns True if the message fingerprint provided was successfully
+        sent to the server within our dedup_window (or is waiting to be sent
+        to it as part of a digest).
+
+        """
+        # Forget everything that has expired
+        while self._recent:
+            key, expires = next(iter(self._recent.items()))
+            if expires > now:
+                break
+            del self._recent[key]
+
+        if (fingerprint, server) in self._recent:
+            return True
+
+        digest = self._digests.get(server)
+        return digest is not None and \
+            any(entry[4] == fingerprint for entry in digest[2])
+
+    def _remember(self, fingerprints, server):
+        """
+        Remembers the message fingerprints successfully sent to the server
+        so that they're suppressed for the remainder of our dedup_window.
+
+        """
+        expires = time() + self.dedup_window
+        for fingerprint in fingerprints:
+            if not fingerprint:
+                continue
+
+            # Our entry moves to the end (with the others that expire last)
+            key = (fingerprint, server)
+            self._recent.pop(key, None)
+            self._recent[key] = expires
+
+        while len(self._recent) > self.dedup_max_entries:
+            # Forget our oldest entries
+            self._recent.popitem(last=False)
 
     def notify(self, title, body, notify_type=NotifyType.INFO,
-               body_format=None, tag=None):
+               body_format=None, tag=None, deadline=None):
         """
         Send a notification to all of the plugins previously loaded.
 
@@ -251,8 +418,29 @@ class Apprise(object):
         tagged value are notified.  By default all added services
         are notified (tag=None)
 
+        If a deadline (in seconds) is specified, then this call will not
+        take (much) longer then it; the time remaining is shared with each
+        notification service as they're notified.  Services we don't get
+        to in time are treated as having failed.
+
+        """
+        if self.profiler is None:
+            return self._notify(
+                title, body, notify_type, body_format=body_format, tag=tag,
+                deadline=deadline)
+
+        with self.profiler.profile('notify'):
+            return self._notify(
+                title, body, notify_type, body_format=body_format, tag=tag,
+                deadline=deadline)
+
+    def _notify(self, title, body, notify_type, body_format=None, tag=None,
+                deadline=None):
         """
+        Send a notification to all of the plugins previously loaded (see
+        notify())
 
+        """
         # Initialize our return result
         status = len(self.servers) > 0
 
@@ -262,6 +450,29 @@ class Apprise(object):
         # Tracks conversions
         conversion_map = dict()
 
+        # The current time
+        now = time()
+
+        if deadline is not None:
+            # The time we must be done by
+            deadline += now
+
+        if self.digest_window:
+            # Send any digests that have been waiting long enough
+            if not self._flush(now, deadline=deadline):
+                status = False
+
+        # Our message fingerprint (used for duplicate suppression)
+        fingerprint = None
+        if self.dedup_window:
+            fingerprint = md5()
+            for entry in (title, body, notify_type):
+                if not isinstance(entry, bytes):
+                    entry = (entry or u'').encode('utf-8')
+                fingerprint.update(entry + b'\0')
+
+            fingerprint = fingerprint.hexdigest()
+
         # Build our tag setup
         #   - top level entries are treated as an 'or'
         #   - second level (or more) entries are treated as 'and'
@@ -319,73 +530,358 @@ class Apprise(object):
             # If our code reaches here, we either did not define a tag (it was
             # set to None), or we did define a tag and the logic above
             # determined we need to notify the service it's associated with
+            if fingerprint:
+                with self._lock:
+                    duplicate = self._is_duplicate(fingerprint, server, now)
+                    if duplicate:
+                        self.suppressed += 1
+
+                if duplicate:
+                    # We already sent this message to this server recently
+                    logger.info(
+                        'Suppressed duplicate %s notification '
+                        '(%d suppressed).',
+                        server.service_name, self.suppressed)
+                    continue
+
+            if self.digest_window:
+                # Hold onto our notification so it can be sent as part of a
+                # digest later on
+                if not self._digest(
+                        server, title, body, notify_type, body_format, now,
+                        fingerprint=fingerprint, deadline=deadline):
+                    status = False
+                continue
+
             if server.notify_format not in conversion_map:
-                if body_format == NotifyFormat.MARKDOWN and \
-                        server.notify_format == NotifyFormat.HTML:
+                conversion_map[server.notify_format] = Apprise.convert(
+                    body, body_format, server.notify_format)
 
-                    # Apply Markdown
-                    conversion_map[server.notify_format] = markdown(body)
+            if not self._send(
+                    server, title, conversion_map[server.notify_format],
+                    notify_type, deadline=deadline):
+                status = False
+
+            elif fingerprint:
+                # Only what was actually delivered is suppressed; a failed
+                # notification can be tried again right away
+                with self._lock:
+                    self._remember((fingerprint, ), server)
 
-                elif body_format == NotifyFormat.TEXT and \
-                        server.notify_format == NotifyFormat.HTML:
+        return status
 
-                    # Basic TEXT to HTML format map; supports keys only
-                    re_map = {
-                        # Support Ampersand
-                        r'&': '&amp;',
+    def flush(self, deadline=None):
+        """
+        Sends all of the digests (if any) we're holding onto regardless of
+        how long they've been waiting.
 
-                        # Spaces to &nbsp; for formatting purposes since
-                        # multiple spaces are treated as one an this may not
-                        # be the callers intention
-                        r' ': '&nbsp;',
+        A deadline (in seconds) can be specified just as it can with
+        notify().
 
-                        # Tab support
-                        r'\t': '&nbsp;&nbsp;&nbsp;',
+        """
+        return self._flush(
+            deadline=None if deadline is None else time() + deadline)
 
-                        # Greater than and Less than Characters
-                        r'>': '&gt;',
-                        r'<': '&lt;',
-                    }
+    def _flush(self, now=None, deadline=None):
+        """
+        Sends the digests that have been waiting for at least our
+        digest_window; if no time is specified, then all of them are sent.
 
-                    # Compile our map
-                    re_table = re.compile(
-                        r'(' + '|'.join(map(re.escape, re_map.keys())) + r')',
-                        re.IGNORECASE,
-                    )
+        """
+        ready = []
+        with self._lock:
+            for server, started, entries, _ in list(self._digests.values()):
+                if now is None or now - started >= self.digest_window:
+                    del self._digests[server]
+                    ready.append((server, entries))
+
+        # Our digests are sent without holding our lock
+        status = True
+        for server, entries in ready:
+            if not self._send_digest(server, entries, deadline=deadline):
+                status = False
 
-                    # Execute our map against our body in addition to swapping
-                    # out new lines and replacing them with <br/>
-                    conversion_map[server.notify_format] = \
-                        re.sub(r'\r*\n', '<br/>\r\n',
-                               re_table.sub(lambda x: re_map[x.group()], body))
+        return status
 
-                else:
-                    # Store entry directly
-                    conversion_map[server.notify_format] = body
+    def _flush_when_due(self, delay):
+        """
+        Runs in the background (for as long as we hold onto digests) and
+        sends each digest once it has waited for our digest_window; they
+        would otherwise wait on our next notify() or flush().
 
+        """
+        while True:
+            sleep(delay)
             try:
-                # Send notification
-                if not server.notify(
-                        title=title,
-                        body=conversion_map[server.notify_format],
-                        notify_type=notify_type):
+                self._flush(time())
 
-                    # Toggle our return status flag
-                    status = False
+            except Exception:
+                # Don't let one bad digest stop us from sending the rest
+                logger.exception('Digest Exception')
+
+            with self._lock:
+                if not self._digests:
+                    # We're done until our next digest is started
+                    self._flusher = None
+                    return
+
+                # Sleep until our oldest digest is due
+                delay = min(digest[1] for digest in self._digests.values()) \
+                    + self.digest_window - time()
+                delay = max(delay, self.digest_min_delay)
+
+    def _digest(self, server, title, body, notify_type, body_format, now,
+                fingerprint=None, deadline=None):
+        """
+        Adds a notification to the digest being built for the server
+        specified.  The digest is sent early if it reaches digest_max
+        notifications or if adding to it would exceed the servers
+        body_maxlen.
 
-            except TypeError:
-                # These our our internally thrown notifications
-                # TODO: Change this to a custom one such as AppriseNotifyError
+        """
+        heading, separator = DIGEST_FORMAT_MAP[server.notify_format]
+
+        # Our notification is prepared as it will appear in our digest so
+        # that we know exactly how much room it takes up
+        body = Apprise.convert(body, body_format, server.notify_format)
+        content = body
+        if title:
+            content = heading.format(
+                title=server.escape_html(title)
+                if server.notify_format == NotifyFormat.HTML else title,
+                body=body)
+
+        # The digests ready to be sent
+        ready = []
+        with self._lock:
+            digest = self._digests.get(server)
+            if digest and server.body_maxlen > 0 and digest[3] + \
+                    len(separator) + len(content) > server.body_maxlen:
+                # Our digest is as large as it can be
+                del self._digests[server]
+                ready.append(digest[2])
+                digest = None
+
+            if not digest:
+                digest = [server, now, [], -len(separator)]
+                self._digests[server] = digest
+                _DIGESTING.add(self)
+
+                if self._flusher is None:
+                    # Send our digest in the background once it's due
+                    self._flusher = threading.Thread(
+                        target=self._flush_when_due,
+                        args=(self.digest_window, ))
+                    self._flusher.daemon = True
+                    self._flusher.start()
+
+            digest[2].append(
+                (title, body, notify_type, content, fingerprint))
+            digest[3] += len(separator) + len(content)
+
+            if self.digest_max and len(digest[2]) >= self.digest_max:
+                del self._digests[server]
+                ready.append(digest[2])
+
+        # Our digests are sent without holding our lock
+        status = True
+        for entries in ready:
+            if not self._send_digest(server, entries, deadline=deadline):
                 status = False
 
+        return status
+
+    def _send_digest(self, server, entries, deadline=None):
+        """
+        Combines the notifications provided into one (in the format the
+        server expects) and sends it.
+
+        """
+        if len(entries) == 1:
+            # Nothing to combine
+            title, body, notify_type, _, _ = entries[0]
+            status = self._send(
+                server, title, body, notify_type, deadline=deadline)
+
+        else:
+            # Our digest is of the most severe type it contains
+            notify_type = NotifyType.INFO
+            for entry in entries:
+                if DIGEST_SEVERITY_MAP.get(entry[2], 0) > \
+                        DIGEST_SEVERITY_MAP[notify_type]:
+                    notify_type = entry[2]
+
+            # Servers that can deliver several notifications at once are
+            # sent them as they are (rather then combined into one)
+            batch = None
+            if server.batch_support:
+                batch = [entry[:3] for entry in entries]
+
+            separator = DIGEST_FORMAT_MAP[server.notify_format][1]
+            status = self._send(
+                server, '{} Notifications'.format(len(entries)),
+                separator.join(entry[3] for entry in entries), notify_type,
+                deadline=deadline, batch=batch)
+
+        if status and self.dedup_window:
+            # Our notifications were delivered
+            with self._lock:
+                self._remember([entry[4] for entry in entries], server)
+
+        return status
+
+    def _send(self, server, title, body, notify_type, deadline=None,
+              batch=None):
+        """
+        Sends our notification to the server specified returning True if
+        it was successful; otherwise False.
+
+        If a deadline (in seconds since the epoch) is specified, it is
+        handed to the server for the duration of the notification.
+
+        If a batch (a list of (title, body, notify_type) tuples) is
+        specified, it's what is sent (using the server's notify_batch());
+        our title and body then describe the batch as a whole.
+
+        """
+        with self._lock:
+            lock = self._server_locks.get(server)
+            if lock is None:
+                lock = threading.Lock()
+                self._server_locks[server] = lock
+
+        # Our server is only ever notified by one thread at a time
+        with lock:
+            return self._deliver(
+                server, title, body, notify_type, deadline=deadline,
+                batch=batch)
+
+    def _deliver(self, server, title, body, notify_type, deadline=None,
+                 batch=None):
+        """
+        Delivers our notification to the server specified (see _send()); the
+        caller must hold the server's lock.
+
+        """
+        now = time()
+        if deadline is not None and now >= deadline:
+            # We're out of time
+            logger.warning(
+                'Skipped %s notification; the deadline was reached.' %
+                server.service_name)
+            return False
+
+        if not server.circuit_allows(now):
+            # Don't bother waiting on a server we know to be down
+            logger.warning(
+                'Skipped %s notification; its circuit is open.' %
+                server.service_name)
+            return False
+
+        # Share our deadline with our server
+        server.deadline = deadline
+
+        status = True
+        try:
+            # Our hooks are run in here so that a misbehaving one can't leave
+            # our deadline behind or keep the hooks that follow from running
+            for hook in self.pre_send_hooks:
+                hook(server, title, body, notify_type)
+
+            if batch:
+                # Send all of our notifications at once
+                status = bool(server.notify_batch(batch))
+
+            else:
+                # Send our notification; messages too long for the server
+                # are sent (in order) as several smaller ones if it's
+                # configured to do so
+                for _title, _body in server.split_message(title, body):
+                    if not server.notify(
+                            title=_title, body=_body,
+                            notify_type=notify_type):
+
+                        # There is no point sending the remaining parts of
+                        # our message
+                        status = False
+                        break
+
+        except TypeError:
+            # These our our internally thrown notifications
+            # TODO: Change this to a custom one such as AppriseNotifyError
+            status = False
+
+        except Exception:
+            # A catch all so we don't have to abort early
+            # just because one of our plugins has a bug in it.
+            logging.exception("Notification Exception")
+            status = False
+
+        finally:
+            server.deadline = None
+
+        finished = time()
+        server.circuit_report(status, finished)
+
+        for hook in self.send_hooks:
+            try:
+                hook(server, status, finished - now)
+
             except Exception:
-                # A catch all so we don't have to abort early
-                # just because one of our plugins has a bug in it.
-                logging.exception("Notification Exception")
-                status = False
+                # Like our plugins, a hook with a bug in it doesn't keep the
+                # rest of them (or our remaining servers) from being run
+                logging.exception("Send Hook Exception")
 
         return status
 
+    @staticmethod
+    def convert(body, body_format, notify_format):
+        """
+        Converts the body provided (of the body_format specified) into the
+        notify_format specified (if we know how to)
+
+        """
+        if body_format == NotifyFormat.MARKDOWN and \
+                notify_format == NotifyFormat.HTML:
+
+            # Apply Markdown
+            return markdown(body)
+
+        elif body_format == NotifyFormat.TEXT and \
+                notify_format == NotifyFormat.HTML:
+
+            # Basic TEXT to HTML format map; supports keys only
+            re_map = {
+                # Support Ampersand
+                r'&': '&amp;',
+
+                # Spaces to &nbsp; for formatting purposes since
+                # multiple spaces are treated as one an this may not
+                # be the callers intention
+                r' ': '&nbsp;',
+
+                # Tab support
+                r'\t': '&nbsp;&nbsp;&nbsp;',
+
+                # Greater than and Less than Characters
+                r'>': '&gt;',
+                r'<': '&lt;',
+            }
+
+            # Compile our map
+            re_table = re.compile(
+                r'(' + '|'.join(map(re.escape, re_map.keys())) + r')',
+                re.IGNORECASE,
+            )
+
+            # Execute our map against our body in addition to swapping
+            # out new lines and replacing them with <br/>
+            return re.sub(r'\r*\n', '<br/>\r\n',
+                          re_table.sub(lambda x: re_map[x.group()], body))
+
+        # Store entry directly
+        return body
+
     def details(self):
         """
         Returns the details associated with the Apprise object
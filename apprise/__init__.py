@@ -37,10 +37,15 @@ from .common import NotifyImageSize
 from .common import NOTIFY_IMAGE_SIZES
 from .common import NotifyFormat
 from .common import NOTIFY_FORMATS
+from .common import NotifyOverflow
+from .common import NOTIFY_OVERFLOWS
+from .common import CircuitState
+from .common import CIRCUIT_STATES
 from .plugins.NotifyBase import NotifyBase
 
 from .Apprise import Apprise
 from .AppriseAsset import AppriseAsset
+from .metrics import AppriseMetrics
 
 # Set default logging handler to avoid "No handler found" warnings.
 import logging
@@ -49,9 +54,10 @@ logging.getLogger(__name__).addHandler(NullHandler())
 
 __all__ = [
     # Core
-    'Apprise', 'AppriseAsset', 'NotifyBase',
+    'Apprise', 'AppriseAsset', 'AppriseMetrics', 'NotifyBase',
 
     # Reference
-    'NotifyType', 'NotifyImageSize', 'NotifyFormat', 'NOTIFY_TYPES',
-    'NOTIFY_IMAGE_SIZES', 'NOTIFY_FORMATS',
+    'NotifyType', 'NotifyImageSize', 'NotifyFormat', 'NotifyOverflow',
+    'CircuitState', 'NOTIFY_TYPES', 'NOTIFY_IMAGE_SIZES', 'NOTIFY_FORMATS',
+    'NOTIFY_OVERFLOWS', 'CIRCUIT_STATES',
 ]
@@ -25,12 +25,31 @@
 # THE SOFTWARE.
 
 import click
+import errno
 import logging
+import os
+import socket
+import stat
 import sys
+import threading
+from json import dumps
+from json import loads
+from os.path import expanduser
+
+try:
+    # Python 2.7
+    from Queue import Queue
+    import SocketServer as socketserver
+
+except ImportError:
+    # Python 3.x
+    from queue import Queue
+    import socketserver
 
 from . import NotifyType
 from . import Apprise
 from . import AppriseAsset
+from .profiler import AppriseProfiler
 
 # Logging
 logger = logging.getLogger('apprise.plugins.NotifyBase')
@@ -39,6 +58,10 @@ logger = logging.getLogger('apprise.plugins.NotifyBase')
 # can be specified to get the help menu to come up
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
+# The Unix domain socket our daemon listens on (and our client submits to)
+# by default
+DEFAULT_SOCKET = '~/.apprise.sock'
+
 
 def print_help_msg(command):
     """
@@ -49,6 +72,245 @@ def print_help_msg(command):
         click.echo(command.get_help(ctx))
 
 
+def _stream(a, instream, outstream, workers=4):
+    """
+    Reads newline-delimited JSON records (with an optional title, body, type,
+    tag and id) from the instream provided and sends each of them using our
+    Apprise object.  The result of each is written to our outstream as a
+    newline-delimited JSON record as soon as it's known.
+
+    Up to the number of workers specified are sent concurrently (though
+    Apprise never notifies the same server from two of them at once); we
+    only ever read ahead of them by a bounded amount.
+
+    Returns True if every record was sent successfully; otherwise False.
+
+    """
+    # Records waiting to be sent; a None tells a worker we're done
+    queue = Queue(maxsize=workers * 2)
+
+    # Our results are written from several threads
+    lock = threading.Lock()
+
+    # Track any failures
+    failures = []
+
+    def respond(line, record, status, error=None):
+        response = {'line': line, 'status': status}
+        if isinstance(record, dict) and 'id' in record:
+            response['id'] = record['id']
+
+        if error:
+            response['error'] = error
+            logger.warning('Line %d: %s' % (line, error))
+
+        with lock:
+            if not status:
+                failures.append(line)
+
+            click.echo(dumps(response), file=outstream)
+
+    def worker():
+        while True:
+            entry = queue.get()
+            if entry is None:
+                # We're done
+                return
+
+            line, record = entry
+            try:
+                status = a.notify(
+                    title=record.get('title'),
+                    body=record.get('body'),
+                    notify_type=record.get('type', NotifyType.INFO),
+                    tag=record.get('tag'),
+                )
+
+            except Exception as e:
+                # Don't let one bad record stop the stream
+                respond(line, record, False, str(e))
+                continue
+
+            respond(line, record, status)
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    # We read one line at a time (rather then iterating over our stream)
+    # so that records are sent as soon as they arrive
+    for line, content in enumerate(iter(instream.readline, ''), start=1):
+        if not content.strip():
+            # Ignore blank lines
+            continue
+
+        try:
+            record = loads(content)
+            if not isinstance(record, dict):
+                raise ValueError('a JSON object was expected')
+
+        except ValueError as e:
+            respond(line, None, False, 'Invalid record: %s' % str(e))
+            continue
+
+        queue.put((line, record))
+
+    for _ in threads:
+        queue.put(None)
+
+    for thread in threads:
+        thread.join()
+
+    return not failures
+
+
+def _makefile(sock, mode):
+    """
+    Returns a (UTF-8) text file object for the socket provided
+
+    """
+    try:
+        return sock.makefile(mode, encoding='utf-8')
+
+    except TypeError:
+        # Python 2.7
+        return sock.makefile(mode)
+
+
+class _DaemonHandler(socketserver.BaseRequestHandler):
+    """
+    Handles a connection made to our daemon; it submits records just like
+    those read in --stream mode and gets the results of each back.
+
+    """
+    def handle(self):
+        instream = _makefile(self.request, 'r')
+        outstream = _makefile(self.request, 'w')
+        try:
+            _stream(self.server.apprise, instream, outstream,
+                    workers=self.server.workers)
+
+        except (IOError, OSError) as e:
+            # Our client went away
+            logger.debug('Daemon connection lost: %s', e)
+
+        finally:
+            instream.close()
+            outstream.close()
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Our daemon; every connection is handled in its own thread while sharing
+    a single (long lived) Apprise object.
+
+    """
+    # We listen on a Unix domain socket (where supported)
+    address_family = getattr(socket, 'AF_UNIX', None)
+
+    daemon_threads = True
+
+    def __init__(self, path, apprise, workers=4):
+        self.apprise = apprise
+        self.workers = workers
+
+        if _stale_socket(path):
+            # Remove the socket a daemon that didn't shut down cleanly left
+            # behind; anything else at our path is left for the user
+            os.unlink(path)
+
+        socketserver.TCPServer.__init__(self, path, _DaemonHandler)
+
+    def server_bind(self):
+        """
+        Only we may submit notifications; our socket is created with these
+        permissions (rather then changed once it exists) so there is never
+        a moment where someone else can connect to it.
+
+        """
+        umask = os.umask(0o177)
+        try:
+            socketserver.TCPServer.server_bind(self)
+
+        finally:
+            os.umask(umask)
+
+
+def _stale_socket(path):
+    """
+    Returns True if the path specified is a Unix domain socket that nobody
+    is listening on.
+
+    """
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return False
+
+    except (IOError, OSError):
+        # There is nothing there
+        return False
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+
+    except socket.error as e:
+        return e.errno == errno.ECONNREFUSED
+
+    finally:
+        sock.close()
+
+    # Another daemon is listening
+    return False
+
+
+def _submit(path, lines, outstream=None):
+    """
+    Submits the newline-delimited JSON records provided to the daemon
+    listening on the path specified and returns True if all of them were
+    sent successfully.  The daemon's responses are written to the outstream
+    (if one was specified) as they arrive.
+
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+
+    except socket.error:
+        sock.close()
+        raise
+
+    # Track our responses
+    responses = []
+
+    def reader():
+        instream = _makefile(sock, 'r')
+        for line in iter(instream.readline, ''):
+            responses.append(loads(line))
+            if outstream is not None:
+                click.echo(line.rstrip('\n'), file=outstream)
+        instream.close()
+
+    # Read our responses while we send our records so that neither of us
+    # can block the other
+    thread = threading.Thread(target=reader)
+    thread.start()
+
+    try:
+        for line in lines:
+            sock.sendall(line.encode('utf-8'))
+
+        # Let the daemon know we're done
+        sock.shutdown(socket.SHUT_WR)
+
+    finally:
+        thread.join()
+        sock.close()
+
+    return bool(responses) and all(r.get('status') for r in responses)
+
+
 @click.command(context_settings=CONTEXT_SETTINGS)
 @click.option('--title', '-t', default=None, type=str,
               help='Specify the message title.')
@@ -58,10 +320,37 @@ def print_help_msg(command):
               metavar='TYPE', help='Specify the message type (default=info).')
 @click.option('--theme', '-T', default='default', type=str,
               help='Specify the default theme.')
+@click.option('--stream', '-S', is_flag=True,
+              help='Read newline-delimited JSON records (each with an '
+              'optional title, body, type, tag and id) from STDIN and send '
+              'them as they arrive; the result of each is written to '
+              'STDOUT as newline-delimited JSON.')
+@click.option('--workers', '-w', default=4, type=click.IntRange(min=1),
+              help='The number of records sent concurrently in --stream '
+              'mode (default=4).')
+@click.option('--daemon', '-D', is_flag=True,
+              help='Stay running and send the records submitted to our '
+              'socket (see --socket) by --client.')
+@click.option('--client', '-C', is_flag=True,
+              help='Submit our notification (or with --stream, the records '
+              'read from STDIN) to a running --daemon rather then sending '
+              'it ourselves; no server URLs are needed.')
+@click.option('--socket', '-s', 'socket_path', default=DEFAULT_SOCKET,
+              type=str, metavar='PATH',
+              help='The Unix domain socket used by --daemon and --client '
+              '(default={}).'.format(DEFAULT_SOCKET))
+@click.option('--profile', '-P', is_flag=True,
+              help='Profile where our time goes (per service) and write a '
+              'report of it to STDERR when we\'re done.')
+@click.option('--profile-output', default=None, type=str, metavar='FILE',
+              help='Profile where our time goes and save it (in the pstats '
+              'format) to FILE when we\'re done; if FILE contains {label} '
+              'then a file is saved for each service.')
 @click.option('-v', '--verbose', count=True)
 @click.argument('urls', nargs=-1,
                 metavar='SERVER_URL [SERVER_URL2 [SERVER_URL3]]',)
-def main(title, body, urls, notification_type, theme, verbose):
+def main(title, body, urls, notification_type, theme, stream, workers,
+         daemon, client, socket_path, profile, profile_output, verbose):
     """
     Send a notification to all of the specified servers identified by their
     URLs the content provided within the title, body and notification-type.
@@ -71,8 +360,9 @@ def main(title, body, urls, notification_type, theme, verbose):
     #       want to return a specific error code, you must call sys.exit()
     #       as you will see below.
 
-    # Logging
-    ch = logging.StreamHandler(sys.stdout)
+    # Logging; our results are written to STDOUT in --stream mode
+    ch = logging.StreamHandler(
+        sys.stderr if (stream or daemon) else sys.stdout)
     if verbose > 2:
         logger.setLevel(logging.DEBUG)
 
@@ -86,6 +376,35 @@ def main(title, body, urls, notification_type, theme, verbose):
     ch.setFormatter(formatter)
     logger.addHandler(ch)
 
+    socket_path = expanduser(socket_path)
+
+    if client:
+        # Submit our notification(s) to our daemon
+        if stream:
+            lines = iter(click.get_text_stream('stdin').readline, '')
+            outstream = click.get_text_stream('stdout')
+
+        else:
+            if body is None:
+                # if no body was specified, then read from STDIN
+                body = click.get_text_stream('stdin').read()
+
+            lines = [dumps({
+                'title': title, 'body': body, 'type': notification_type,
+            }) + '\n']
+            outstream = None
+
+        try:
+            if _submit(socket_path, lines, outstream):
+                sys.exit(0)
+
+        except (IOError, OSError) as e:
+            logger.error(
+                'Could not submit to the daemon at %s: %s' % (
+                    socket_path, str(e)))
+
+        sys.exit(1)
+
     if not urls:
         logger.error('You must specify at least one server URL.')
         print_help_msg(main)
@@ -97,10 +416,62 @@ def main(title, body, urls, notification_type, theme, verbose):
     # Create our object
     a = Apprise(asset=asset)
 
+    if profile or profile_output:
+        profiler = AppriseProfiler()
+        profiler.attach(a)
+
+        def report():
+            if profile:
+                profiler.report(stream=click.get_text_stream('stderr'))
+
+            if profile_output:
+                profiler.dump(profile_output)
+
+        # Report on our profile however we exit
+        click.get_current_context().call_on_close(report)
+
     # Load our inventory up
     for url in urls:
         a.add(url)
 
+    if daemon:
+        # Keep our servers (and the connections and logins they've made)
+        # around and send what's submitted to us
+        if _DaemonServer.address_family is None:
+            logger.error('--daemon is not supported on this platform.')
+            sys.exit(1)
+
+        try:
+            server = _DaemonServer(socket_path, a, workers=workers)
+
+        except (IOError, OSError) as e:
+            logger.error(
+                'Could not listen on %s: %s' % (socket_path, str(e)))
+            sys.exit(1)
+
+        logger.info('Listening on %s', socket_path)
+        try:
+            server.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            server.server_close()
+            os.unlink(socket_path)
+
+            # Send whatever our digests (if any) are still holding onto
+            a.flush()
+
+        sys.exit(0)
+
+    if stream:
+        # Send every record we read from STDIN
+        if _stream(a, click.get_text_stream('stdin'),
+                   click.get_text_stream('stdout'), workers=workers):
+            sys.exit(0)
+        sys.exit(1)
+
     if body is None:
         # if no body was specified, then read from STDIN
         body = click.get_text_stream('stdin').read()
@@ -77,3 +77,66 @@ NOTIFY_FORMATS = (
     NotifyFormat.HTML,
     NotifyFormat.MARKDOWN,
 )
+
+
+class NotifyCompression(object):
+    """
+    A list of pre-defined compressions that can be applied to the body of
+    the requests made by the plugins that support it.
+    """
+    GZIP = 'gzip'
+    DEFLATE = 'deflate'
+
+
+NOTIFY_COMPRESSIONS = (
+    NotifyCompression.GZIP,
+    NotifyCompression.DEFLATE,
+)
+
+
+class NotifyOverflow(object):
+    """
+    A list of pre-defined modes of handling messages that exceed the
+    maximum length a notification service supports.
+    """
+    # Leave the message as is and let the upstream server deal with it
+    UPSTREAM = 'upstream'
+
+    # Truncate the message so that it fits
+    TRUNCATE = 'truncate'
+
+    # Truncate the message but note how much of it was left out
+    SUMMARIZE = 'summarize'
+
+    # Split the message into several smaller ones
+    SPLIT = 'split'
+
+
+NOTIFY_OVERFLOWS = (
+    NotifyOverflow.UPSTREAM,
+    NotifyOverflow.TRUNCATE,
+    NotifyOverflow.SUMMARIZE,
+    NotifyOverflow.SPLIT,
+)
+
+
+class CircuitState(object):
+    """
+    The states the circuit breaker protecting each notification service
+    can be in.
+    """
+    # Notifications are sent as normal
+    CLOSED = 'closed'
+
+    # The service is failing; notifications fail immediately
+    OPEN = 'open'
+
+    # We're probing the service to see if it has recovered
+    HALF_OPEN = 'half-open'
+
+
+CIRCUIT_STATES = (
+    CircuitState.CLOSED,
+    CircuitState.OPEN,
+    CircuitState.HALF_OPEN,
+)
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+from weakref import WeakKeyDictionary
+
+# The metrics we export; each is listed with its type and description
+METRICS = (
+    ('apprise_notify_total', 'counter',
+     'The notifications sent to a server (by their status).'),
+    ('apprise_notify_duration_seconds', 'histogram',
+     'The seconds it took to send a notification to a server.'),
+    ('apprise_notify_in_progress', 'gauge',
+     'The notifications currently being sent to a server.'),
+    ('apprise_notify_bytes_total', 'counter',
+     'The bytes of content (title and body) handed to our servers.'),
+    ('apprise_throttle_total', 'counter',
+     'The number of times our servers throttled themselves.'),
+    ('apprise_throttle_seconds_total', 'counter',
+     'The seconds our servers spent throttling themselves.'),
+)
+
+# The upper bounds (in seconds) of our latency histogram buckets by default
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def schema_of(server):
+    """
+    Returns the schema the server provided is known by
+
+    """
+    protocol = server.secure_protocol \
+        if server.secure and server.secure_protocol else server.protocol
+
+    if isinstance(protocol, (tuple, list)):
+        # Use the first of our aliases
+        protocol = protocol[0]
+
+    return protocol or server.__class__.__name__.lower()
+
+
+def _length(content):
+    """
+    Returns the length (in bytes) of the content provided
+
+    """
+    if not content:
+        return 0
+
+    if isinstance(content, bytes):
+        return len(content)
+
+    return len(content.encode('utf-8'))
+
+
+class _SchemaMetrics(object):
+    """
+    The metrics we've gathered for a single schema
+    """
+
+    def __init__(self, buckets):
+        self.success = 0
+        self.failure = 0
+        self.in_progress = 0
+        self.bytes = 0
+        self.throttles = 0
+        self.throttle_time = 0.0
+
+        # The number of notifications that fell within each of our buckets
+        # (the last of which is our +Inf bucket) along with their total
+        # duration
+        self.counts = [0] * (len(buckets) + 1)
+        self.duration = 0.0
+
+
+class AppriseMetrics(object):
+    """
+    Gathers metrics on the notifications sent by the Apprise objects it's
+    attached to; they can be exported in the Prometheus text format (see
+    prometheus()) or to anything else through samples().
+
+        metrics = AppriseMetrics()
+        metrics.attach(a)
+
+        a.notify(title='title', body='body')
+        print(metrics.prometheus())
+
+    Nothing is gathered (or spent doing so) until we're attached.
+
+    """
+
+    def __init__(self, buckets=None):
+        # The upper bounds of our histogram buckets
+        self.buckets = tuple(sorted(buckets or DEFAULT_BUCKETS))
+
+        # Our metrics are updated from several threads
+        self._lock = threading.Lock()
+
+        # Our metrics; keyed by the schema they're for
+        self._schemas = dict()
+
+        # The throttle totals of each server (as of the last time we saw
+        # them) so that only what changed since is accounted for
+        self._throttled = WeakKeyDictionary()
+
+    def attach(self, apprise):
+        """
+        Starts gathering metrics on the notifications sent by the Apprise
+        object provided
+
+        """
+        if self.pre_send not in apprise.pre_send_hooks:
+            apprise.pre_send_hooks.append(self.pre_send)
+            apprise.send_hooks.append(self.post_send)
+
+    def detach(self, apprise):
+        """
+        Stops gathering metrics on the notifications sent by the Apprise
+        object provided
+
+        """
+        if self.pre_send in apprise.pre_send_hooks:
+            apprise.pre_send_hooks.remove(self.pre_send)
+            apprise.send_hooks.remove(self.post_send)
+
+    def _metrics(self, schema):
+        metrics = self._schemas.get(schema)
+        if metrics is None:
+            metrics = _SchemaMetrics(self.buckets)
+            self._schemas[schema] = metrics
+
+        return metrics
+
+    def pre_send(self, server, title, body, notify_type):
+        """
+        Invoked before a notification is sent to a server
+
+        """
+        size = _length(title) + _length(body)
+
+        with self._lock:
+            metrics = self._metrics(schema_of(server))
+            metrics.in_progress += 1
+            metrics.bytes += size
+
+    def post_send(self, server, status, elapsed):
+        """
+        Invoked after a notification was sent to a server
+
+        """
+        with self._lock:
+            metrics = self._metrics(schema_of(server))
+            metrics.in_progress = max(0, metrics.in_progress - 1)
+
+            if status:
+                metrics.success += 1
+
+            else:
+                metrics.failure += 1
+
+            # Find the first bucket we fall within
+            index = 0
+            for bound in self.buckets:
+                if elapsed <= bound:
+                    break
+                index += 1
+
+            metrics.counts[index] += 1
+            metrics.duration += elapsed
+
+            # Account for the time our server spent throttling itself
+            throttle_time, throttles = self._throttled.get(server, (0.0, 0))
+            metrics.throttle_time += server.throttle_time - throttle_time
+            metrics.throttles += server.throttle_count - throttles
+            self._throttled[server] = \
+                (server.throttle_time, server.throttle_count)
+
+    def reset(self):
+        """
+        Forgets the metrics gathered so far
+
+        """
+        with self._lock:
+            self._schemas.clear()
+
+    def samples(self):
+        """
+        Returns a list of our samples; each is a tuple of the metric name,
+        a dictionary of its labels and its value.  These can be fed to
+        whatever monitoring system you like.
+
+        """
+        bounds = ['%g' % bound for bound in self.buckets] + ['+Inf']
+
+        samples = []
+        with self._lock:
+            for schema, metrics in sorted(self._schemas.items()):
+                labels = {'schema': schema}
+
+                samples.append(('apprise_notify_total', dict(
+                    labels, status='success'), metrics.success))
+                samples.append(('apprise_notify_total', dict(
+                    labels, status='failure'), metrics.failure))
+
+                # Our buckets are cumulative
+                total = 0
+                for bound, count in zip(bounds, metrics.counts):
+                    total += count
+                    samples.append(('apprise_notify_duration_seconds_bucket',
+                                    dict(labels, le=bound), total))
+
+                samples.append(('apprise_notify_duration_seconds_sum',
+                                labels, metrics.duration))
+                samples.append(('apprise_notify_duration_seconds_count',
+                                labels, total))
+
+                samples.append(('apprise_notify_in_progress',
+                                labels, metrics.in_progress))
+                samples.append(('apprise_notify_bytes_total',
+                                labels, metrics.bytes))
+                samples.append(('apprise_throttle_total',
+                                labels, metrics.throttles))
+                samples.append(('apprise_throttle_seconds_total',
+                                labels, metrics.throttle_time))
+
+        return samples
+
+    def prometheus(self):
+        """
+        Returns our metrics in the Prometheus text exposition format
+
+        """
+        # Group our samples by the metric they belong to
+        grouped = dict((metric, []) for metric, _, _ in METRICS)
+        for name, labels, value in self.samples():
+            # Our histograms are reported as several (suffixed) samples
+            metric = name if name in grouped else name.rsplit('_', 1)[0]
+            grouped[metric].append((name, labels, value))
+
+        lines = []
+        for metric, _type, description in METRICS:
+            lines.append('# HELP %s %s' % (metric, description))
+            lines.append('# TYPE %s %s' % (metric, _type))
+            for name, labels, value in grouped[metric]:
+                lines.append('%s{%s} %s' % (name, ','.join(
+                    '%s="%s"' % (key, str(labels[key])
+                                 .replace('\\', '\\\\')
+                                 .replace('"', '\\"')
+                                 .replace('\n', '\\n'))
+                    for key in sorted(labels)), value))
+
+        return '\n'.join(lines) + '\n'
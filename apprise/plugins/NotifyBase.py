@@ -24,8 +24,11 @@
 # THE SOFTWARE.
 
 import re
+import zlib
 import logging
+import weakref
 from time import sleep
+from time import time
 try:
     # Python 2.7
     from urllib import unquote as _unquote
@@ -45,6 +48,11 @@ from ..utils import is_hostname
 from ..common import NOTIFY_TYPES
 from ..common import NotifyFormat
 from ..common import NOTIFY_FORMATS
+from ..common import NotifyCompression
+from ..common import NOTIFY_COMPRESSIONS
+from ..common import NotifyOverflow
+from ..common import NOTIFY_OVERFLOWS
+from ..common import CircuitState
 
 from ..AppriseAsset import AppriseAsset
 
@@ -59,6 +67,117 @@ def _escape(text):
     return sax_escape(text, {"'": "&apos;", "\"": "&quot;"})
 
 
+# The names of the fields (in a payload) or arguments (in a URL or response)
+# whose values are masked before they're logged
+LOGGABLE_SECRET_NAMES = \
+    r'(?:[a-z0-9_-]*(?:pass(?:word)?|secret|token|key|signature)' \
+    r'|pw|auth(?:orization)?)'
+
+LOGGABLE_SECRET_NAME_RE = re.compile(
+    r'^{}$'.format(LOGGABLE_SECRET_NAMES), re.IGNORECASE)
+
+# Finds name=value (and "name": "value") pairs within our content
+LOGGABLE_SECRET_VALUE_RE = re.compile(
+    r'(?<![a-z0-9_-])(?P<name>{})(?P<delim>["\']?\s*[=:]\s*["\']?)'
+    r'(?P<value>[^&\s"\',;]+)'.format(LOGGABLE_SECRET_NAMES), re.IGNORECASE)
+
+# What our secrets are replaced with
+LOGGABLE_MASK = '****'
+
+
+class _Loggable(object):
+    """
+    Wraps content (such as a payload or a server response) that is handed
+    to our logger as an argument; the work of masking the secrets it holds
+    and truncating it is only done if the message is actually logged.
+
+    """
+    __slots__ = ('content', 'maxlen')
+
+    def __init__(self, content, maxlen):
+        self.content = content
+        self.maxlen = maxlen
+
+    @staticmethod
+    def redact(content):
+        """
+        Returns a copy of the content provided with its secrets masked
+        """
+        if isinstance(content, dict):
+            return dict(
+                (k, LOGGABLE_MASK if LOGGABLE_SECRET_NAME_RE.match('%s' % k)
+                    else _Loggable.redact(v)) for k, v in content.items())
+
+        if isinstance(content, (list, tuple)):
+            return [_Loggable.redact(v) for v in content]
+
+        return content
+
+    def __str__(self):
+        content = self.content
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', 'replace')
+
+        if isinstance(content, (dict, list, tuple)):
+            content = str(self.redact(content))
+
+        else:
+            content = LOGGABLE_SECRET_VALUE_RE.sub(
+                r'\g<name>\g<delim>' + LOGGABLE_MASK, '%s' % content)
+
+        if self.maxlen and len(content) > self.maxlen:
+            content = '%s... (%d more characters)' % (
+                content[:self.maxlen], len(content) - self.maxlen)
+
+        return content
+
+
+class _FrozenDict(dict):
+    """
+    A dictionary that can't be changed once it's been created; it allows
+    the services that were configured with the same content (such as the
+    same headers) to safely share a single copy of it.
+
+    """
+    __slots__ = ('__weakref__', )
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError('{} is immutable'.format(type(self).__name__))
+
+    __setitem__ = __delitem__ = _frozen
+    clear = pop = popitem = setdefault = update = _frozen
+
+
+# The tags and headers shared by our services; our entries are removed
+# once no service refers to them anymore
+_INTERNED = weakref.WeakValueDictionary()
+
+
+def _intern(content, factory):
+    """
+    Returns the shared (immutable) copy of the content provided; it's
+    created using the factory specified the first time it's seen.
+
+    """
+    try:
+        key = (factory, tuple(sorted(
+            content.items() if isinstance(content, dict) else content)))
+        return _INTERNED[key]
+
+    except KeyError:
+        return _INTERNED.setdefault(key, factory(content))
+
+    except TypeError:
+        # Our content can't be shared (it isn't hashable or sortable)
+        return factory(content)
+
+
+# The asset shared by every service created without one of its own (an
+# Apprise object hands its own asset to the services it loads); since it's
+# shared, a service is customized by assigning it another asset rather then
+# by changing this one
+_DEFAULT_ASSET = AppriseAsset()
+
 HTTP_ERROR_MAP = {
     400: 'Bad Request - Unsupported Parameters.',
     401: 'Verification Failed.',
@@ -71,6 +190,10 @@ HTTP_ERROR_MAP = {
 # HTML New Line Delimiter
 NOTIFY_NEWLINE = '\r\n'
 
+# Matches the start of an HTML entity (such as &amp; or &#38;) that hasn't
+# been terminated yet
+HTML_ENTITY_PART_RE = re.compile(r'&#?[a-z0-9]*$', re.IGNORECASE)
+
 # Used to break a path list into parts
 PATHSPLIT_LIST_DELIM = re.compile(r'[ \t\r\n,\\/]+')
 
@@ -92,6 +215,19 @@ class NotifyBase(object):
     This is the base class for all notification services
     """
 
+    # The state every service has is kept in slots (rather then in each
+    # instance's dictionary).  Our dictionary remains for the settings that
+    # override our class defaults (a slot can't share the name of the class
+    # attribute it would override) and for the state of our plugins (which
+    # don't declare slots of their own, so they'd have one regardless)
+    __slots__ = (
+        '__dict__', '__weakref__', 'asset', 'verify_certificate', 'secure',
+        'host', 'port', 'user', 'password', 'headers', 'throttle_time',
+        'throttle_count', 'circuit_state', '_circuit_failures',
+        '_circuit_history', '_circuit_results', '_circuit_opened',
+        '_circuit_answered',
+    )
+
     # The default descriptive name associated with the Notification
     service_name = None
 
@@ -128,8 +264,71 @@ class NotifyBase(object):
     # Default Notify Format
     notify_format = NotifyFormat.TEXT
 
-    # Maintain a set of tags to associate with this specific notification
-    tags = set()
+    # How messages exceeding our body_maxlen and title_maxlen are handled;
+    # this is set with the overflow= URL argument
+    overflow_mode = NotifyOverflow.UPSTREAM
+
+    # When looking for a clean place to split (or truncate) a message, we
+    # never look back further then this fraction of the maximum body length
+    overflow_lookback = 0.25
+
+    # Appended to summarized messages; the {} is replaced with the number
+    # of characters that were left out
+    overflow_summary = '\r\n[... {} characters omitted]'
+
+    # The compression applied to the body of our requests (if supported by
+    # the plugin); this is set with the compress= URL argument
+    compress = None
+
+    # The minimum size (in bytes) a request body must be before we bother
+    # compressing it
+    compress_min_bytes = 1024
+
+    # Our circuit breaker opens (failing notifications immediately rather
+    # then waiting on a service we know to be down) after this many
+    # consecutive failures; it's disabled (zero) unless the circuit= URL
+    # argument enables it
+    circuit_max_failures = 0
+
+    # Our circuit breaker also opens if at least this fraction of our most
+    # recent circuit_window notifications failed
+    circuit_error_rate = 0.5
+
+    # The number of recent notifications our error rate is based on; our
+    # error rate is only considered once we've seen this many
+    circuit_window = 20
+
+    # The number of seconds an open circuit waits before it lets a single
+    # notification through to probe the service
+    circuit_reset_time = 60
+
+    # The number of seconds we wait to connect to (and then again to hear
+    # back from) the service we're notifying; this is set with the timeout=
+    # URL argument
+    timeout = 4.0
+
+    # The smallest timeout we'll ever hand to a request; used once our
+    # deadline is all but spent so that we fail fast
+    timeout_min = 0.01
+
+    # The time (in seconds since the epoch) our notification must be sent
+    # by; this is set for us by Apprise for the duration of a notify() call
+    # made with a deadline
+    deadline = None
+
+    # The most characters of a payload (or server response) we include in
+    # our debug logging; see loggable()
+    debug_maxlen = 1024
+
+    # Services that can deliver several notifications in a single request
+    # set this to True and provide a notify_batch() method; it's passed a
+    # list of (title, body, notify_type) tuples.  Apprise uses it to send
+    # its digests (rather then combining them into one message).
+    batch_support = False
+
+    # Maintain a set of tags to associate with this specific notification;
+    # services with the same tags share the same (frozen) set of them
+    tags = frozenset()
 
     # Logging
     logger = logging.getLogger(__name__)
@@ -142,8 +341,12 @@ class NotifyBase(object):
 
         """
 
-        # Prepare our Assets
-        self.asset = AppriseAsset()
+        # Prepare our Assets; the services loaded by an Apprise object all
+        # share its asset (and the rest share our default) rather then each
+        # having their own
+        asset = kwargs.get('asset')
+        self.asset = asset if isinstance(asset, AppriseAsset) \
+            else _DEFAULT_ASSET
 
         # Certificate Verification (for SSL calls); default to being enabled
         self.verify_certificate = kwargs.get('verify', True)
@@ -163,6 +366,9 @@ class NotifyBase(object):
         self.user = kwargs.get('user')
         self.password = kwargs.get('password')
         self.headers = kwargs.get('headers')
+        if isinstance(self.headers, dict):
+            # Services with the same headers share them
+            self.headers = _intern(self.headers, _FrozenDict)
 
         if 'format' in kwargs:
             # Store the specified format if specified
@@ -177,11 +383,169 @@ class NotifyBase(object):
             # Provide override
             self.notify_format = notify_format
 
+        if 'compress' in kwargs:
+            # Store the specified compression if specified
+            compress = kwargs.get('compress', '')
+            if compress.lower() not in NOTIFY_COMPRESSIONS:
+                self.logger.error(
+                    'Invalid compression %s' % compress,
+                )
+                raise TypeError(
+                    'Invalid compression %s' % compress,
+                )
+            # Provide override
+            self.compress = compress.lower()
+
+        if 'overflow' in kwargs:
+            # Store the specified overflow mode if specified
+            overflow = kwargs.get('overflow', '')
+            if overflow.lower() not in NOTIFY_OVERFLOWS:
+                self.logger.error(
+                    'Invalid overflow mode %s' % overflow,
+                )
+                raise TypeError(
+                    'Invalid overflow mode %s' % overflow,
+                )
+            # Provide override
+            self.overflow_mode = overflow.lower()
+
+        if 'timeout' in kwargs:
+            # Store the specified timeout if specified
+            try:
+                timeout = float(kwargs.get('timeout'))
+                if timeout <= 0:
+                    raise ValueError()
+
+                # Provide override
+                self.timeout = timeout
+
+            except (TypeError, ValueError):
+                self.logger.warning(
+                    'Invalid timeout %s; using %ss.' % (
+                        kwargs.get('timeout'), self.timeout))
+
+        if 'circuit' in kwargs:
+            # Store the number of consecutive failures our circuit breaker
+            # opens after (if specified)
+            try:
+                circuit = int(kwargs.get('circuit'))
+                if circuit < 0:
+                    raise ValueError()
+
+                # Provide override
+                self.circuit_max_failures = circuit
+
+            except (TypeError, ValueError):
+                self.logger.warning(
+                    'Invalid circuit %s; using %s.' % (
+                        kwargs.get('circuit'), self.circuit_max_failures))
+
         if 'tag' in kwargs:
             # We want to associate some tags with our notification service.
             # the code below gets the 'tag' argument if defined, otherwise
             # it just falls back to whatever was already defined globally
-            self.tags = set(parse_list(kwargs.get('tag', self.tags)))
+            self.tags = _intern(
+                set(parse_list(kwargs.get('tag', self.tags))), frozenset)
+
+        # The total number of seconds (and times) we've throttled ourselves
+        self.throttle_time = 0.0
+        self.throttle_count = 0
+
+        # Our circuit breaker; our most recent results are tracked by
+        # circuit_report() as a bitmask of failures
+        self.circuit_state = CircuitState.CLOSED
+        self._circuit_failures = 0
+        self._circuit_history = 0
+        self._circuit_results = 0
+        self._circuit_opened = None
+        self._circuit_answered = False
+
+    def circuit_allows(self, now=None):
+        """
+        Returns True if our circuit breaker allows a notification to be sent
+        to our service; otherwise False is returned and the notification
+        should be treated as having failed.
+
+        """
+        # Whatever our service answered last time has already been reported
+        self._circuit_answered = False
+
+        if self.circuit_state == CircuitState.CLOSED:
+            return True
+
+        now = time() if now is None else now
+        if now - self._circuit_opened < self.circuit_reset_time:
+            # We're open (or still waiting on the outcome of our probe)
+            return False
+
+        # Let a single notification through to probe our service; should it
+        # never be reported, another is let through once our reset time
+        # passes again
+        self.circuit_state = CircuitState.HALF_OPEN
+        self._circuit_opened = now
+        return True
+
+    def circuit_response(self, status_code):
+        """
+        Called with the HTTP status code our service answered a failed
+        request with. Only server errors (5xx) count against our circuit;
+        a service that rejects our notification (bad credentials, a
+        malformed request, etc) is still up and there is nothing to be
+        gained by no longer sending to it.
+
+        """
+        if status_code < 500:
+            self._circuit_answered = True
+
+    def circuit_report(self, success, now=None):
+        """
+        Reports the outcome of a notification to our circuit breaker
+
+        """
+        # A notification our service answered (and rejected) is counted as
+        # a success; our service is clearly up
+        success = success or self._circuit_answered
+        self._circuit_answered = False
+
+        if self.circuit_max_failures <= 0:
+            # Our circuit breaker is disabled
+            return
+
+        # Our most recent results are kept as a bitmask (rather then a list)
+        # of circuit_window bits where each failure is a set bit
+        self._circuit_history = ((self._circuit_history << 1) | (
+            not success)) & ((1 << self.circuit_window) - 1)
+        self._circuit_results = min(
+            self._circuit_results + 1, self.circuit_window)
+
+        if success:
+            self._circuit_failures = 0
+            if self.circuit_state == CircuitState.HALF_OPEN:
+                # Our service has recovered
+                self.logger.info(
+                    'Closing {} circuit; service recovered.'.format(
+                        self.service_name))
+                self.circuit_state = CircuitState.CLOSED
+                self._circuit_history = 0
+                self._circuit_results = 0
+            return
+
+        self._circuit_failures += 1
+
+        if self.circuit_state == CircuitState.HALF_OPEN or \
+                self._circuit_failures >= self.circuit_max_failures or (
+                    self._circuit_results >= self.circuit_window and
+                    bin(self._circuit_history).count('1') >=
+                    self.circuit_error_rate * self.circuit_window):
+
+            if self.circuit_state != CircuitState.OPEN:
+                self.logger.warning(
+                    'Opening {} circuit for {}s after {} failure(s).'.format(
+                        self.service_name, self.circuit_reset_time,
+                        self._circuit_failures))
+
+            self.circuit_state = CircuitState.OPEN
+            self._circuit_opened = time() if now is None else now
 
     def throttle(self, throttle_time=None):
         """
@@ -192,12 +556,202 @@ class NotifyBase(object):
         throttle_time = throttle_time \
             if throttle_time is not None else self.throttle_attempt
 
+        if self.deadline is not None:
+            # Never wait beyond our deadline
+            throttle_time = min(throttle_time, self.deadline - time())
+
         # Perform throttle
         if throttle_time > 0:
             sleep(throttle_time)
 
+            # Keep track of the time we've spent waiting
+            self.throttle_time += throttle_time
+            self.throttle_count += 1
+
         return
 
+    def split_message(self, title, body):
+        """
+        Applies our overflow_mode to the title and body provided and returns
+        a list of (title, body) tuples; each of which fit within our
+        title_maxlen and body_maxlen and should be sent in the order they
+        were returned.
+
+        """
+        if self.overflow_mode == NotifyOverflow.UPSTREAM:
+            # Nothing to do
+            return [(title, body)]
+
+        if isinstance(title, bytes):
+            # Work with characters (not bytes) so we never cut a multi-byte
+            # UTF-8 sequence in half
+            title = title.decode('utf-8', 'replace')
+
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', 'replace')
+
+        if self.title_maxlen > 0 and title and len(title) > self.title_maxlen:
+            title = title[:self.title_maxlen]
+
+        if self.body_maxlen <= 0 or not body or \
+                len(body) <= self.body_maxlen:
+            # Our message fits
+            return [(title, body)]
+
+        if self.overflow_mode == NotifyOverflow.SPLIT:
+            # Only the first message carries our title
+            return [
+                (title if index == 0 else '', chunk)
+                for index, chunk in enumerate(self._split_body(body))]
+
+        if self.overflow_mode == NotifyOverflow.SUMMARIZE:
+            # Reserve enough room for our summary; the number of characters
+            # omitted never has more digits then the length of our body
+            summary = self.overflow_summary.format(len(body))
+            if len(summary) < self.body_maxlen:
+                end = self._split_index(
+                    body, 0, self.body_maxlen - len(summary))
+                return [(title, body[:end] + self.overflow_summary.format(
+                    len(body) - end))]
+
+            # There is no room for our summary; we're truncated instead
+
+        # NotifyOverflow.TRUNCATE
+        return [(title, body[:self._split_index(body, 0, self.body_maxlen)])]
+
+    def _split_body(self, body):
+        """
+        A generator splitting the body provided into chunks that fit within
+        our body_maxlen.  Markdown code blocks that span a split are closed
+        at the end of one chunk and re-opened at the start of the next.
+        HTML tags (and entities) are never cut in half, but the elements
+        that span a split are not closed and re-opened.
+
+        """
+        fence = '```'
+        fenced = self.notify_format == NotifyFormat.MARKDOWN and fence in body
+
+        # Leave room for the fences we may need to close and re-open
+        limit = self.body_maxlen - (2 * (len(fence) + 1) if fenced else 0)
+        limit = max(1, limit)
+
+        # True if the chunk we're building starts inside a code block
+        reopen = False
+
+        index = 0
+        while index < len(body):
+            end = self._split_index(body, index, limit)
+            chunk = body[index:end]
+
+            if fenced:
+                if reopen:
+                    chunk = fence + '\n' + chunk
+
+                # An odd number of fences leaves us inside a code block
+                if chunk.count(fence) % 2:
+                    chunk += '\n' + fence
+                    reopen = True
+
+                else:
+                    reopen = False
+
+            yield chunk
+            index = end
+
+    def _split_index(self, body, start, limit):
+        """
+        Returns the index we should split the body at so that no more then
+        limit characters (from start) are used.  We prefer to split on a
+        paragraph, then a line and finally a word boundary; we only ever look
+        back a bounded distance keeping our splitting linear.
+
+        """
+        end = start + limit
+        if end >= len(body):
+            return len(body)
+
+        lookback = max(end - int(limit * self.overflow_lookback), start + 1)
+        for separator in ('\n\n', '\n', ' '):
+            index = body.rfind(separator, lookback, end)
+            if index >= 0:
+                # Keep the separator with the chunk it ends
+                end = min(index + len(separator), end)
+                break
+
+        else:
+            if u'\ud800' <= body[end - 1] <= u'\udbff' and end - 1 > start:
+                # Don't split a surrogate pair
+                end -= 1
+
+        if self.notify_format == NotifyFormat.HTML:
+            # Don't split an HTML tag (or an entity); unless it's all we
+            # have to work with
+            index = body.rfind('<', start + 1, end)
+            if index > body.rfind('>', start, end):
+                end = index
+
+            index = body.rfind('&', max(start + 1, end - 10), end)
+            if index >= 0 and HTML_ENTITY_PART_RE.match(body, index, end):
+                end = index
+
+        return end
+
+    @property
+    def request_timeout(self):
+        """
+        The timeout (in seconds) that should be applied to the next request
+        made to our service; this is our configured timeout unless we have
+        less time then that left before our deadline.
+
+        """
+        if self.deadline is None:
+            return self.timeout
+
+        return max(
+            self.timeout_min, min(self.timeout, self.deadline - time()))
+
+    def loggable(self, content):
+        """
+        Returns the content provided (typically a payload or a server
+        response) ready to be handed to our logger as an argument; its
+        secrets are masked and it's truncated to debug_maxlen characters, but
+        only if our message is actually logged.
+
+        """
+        return _Loggable(content, self.debug_maxlen)
+
+    def compress_body(self, body, headers):
+        """
+        Compresses the request body provided if compression was requested
+        and the body is large enough to warrant it.  The Content-Encoding
+        of the headers provided is updated to reflect this.
+
+        The returned body should be used for every attempt made to deliver
+        it so that it's only ever compressed once.
+        """
+        if not self.compress or body is None:
+            return body
+
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+
+        if len(body) < self.compress_min_bytes:
+            # Not worth compressing
+            return body
+
+        if self.compress == NotifyCompression.GZIP:
+            # A wbits value of 16 + MAX_WBITS produces a gzip stream
+            compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+
+        else:
+            # NotifyCompression.DEFLATE
+            body = zlib.compress(body)
+
+        headers['Content-Encoding'] = self.compress
+        return body
+
     def image_url(self, notify_type, logo=False, extension=None):
         """
         Returns Image URL if possible
@@ -417,6 +971,32 @@ class NotifyBase(object):
                         results['format']))
                 del results['format']
 
+        # Allow our requests timeout to be specified
+        if 'timeout' in results['qsd'] and len(results['qsd']['timeout']):
+            results['timeout'] = results['qsd']['timeout']
+
+        # Allow our circuit breaker to be enabled
+        if 'circuit' in results['qsd'] and len(results['qsd']['circuit']):
+            results['circuit'] = results['qsd']['circuit']
+
+        # Allow the request body to be compressed
+        if 'compress' in results['qsd']:
+            results['compress'] = results['qsd'].get('compress').lower()
+            if results['compress'] not in NOTIFY_COMPRESSIONS:
+                NotifyBase.logger.warning(
+                    'Unsupported compression specified {}'.format(
+                        results['compress']))
+                del results['compress']
+
+        # Allow overflow handling to be specified
+        if 'overflow' in results['qsd']:
+            results['overflow'] = results['qsd'].get('overflow').lower()
+            if results['overflow'] not in NOTIFY_OVERFLOWS:
+                NotifyBase.logger.warning(
+                    'Unsupported overflow mode specified {}'.format(
+                        results['overflow']))
+                del results['overflow']
+
         # Password overrides
         if 'pass' in results['qsd']:
             results['password'] = results['qsd']['pass']
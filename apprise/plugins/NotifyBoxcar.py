@@ -224,10 +224,10 @@ class NotifyBoxcar(NotifyBase):
         })
 
         notify_url = '%s?%s' % (self.notify_url, params)
-        self.logger.debug('Boxcar POST URL: %s (cert_verify=%r)' % (
-            notify_url, self.verify_certificate,
-        ))
-        self.logger.debug('Boxcar Payload: %s' % str(payload))
+        self.logger.debug(
+            'Boxcar POST URL: %s (cert_verify=%r)',
+            self.loggable(notify_url), self.verify_certificate)
+        self.logger.debug('Boxcar Payload: %s', self.loggable(payload))
 
         try:
             r = requests.post(
@@ -235,10 +235,13 @@ class NotifyBoxcar(NotifyBase):
                 data=dumps(payload),
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             # Boxcar returns 201 (Created) when successful
             if r.status_code != requests.codes.created:
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Boxcar notification: '
@@ -265,7 +268,7 @@ class NotifyBoxcar(NotifyBase):
                 'A Connection error occured sending Boxcar '
                 'notification to %s.' % (host))
 
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
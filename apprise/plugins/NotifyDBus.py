@@ -42,6 +42,14 @@ NOTIFY_DBUS_IMAGE_SUPPORT = False
 NOTIFY_DBUS_INTERFACE = 'org.freedesktop.Notifications'
 NOTIFY_DBUS_SETTING_LOCATION = '/org/freedesktop/Notifications'
 
+# The DBus errors that tell us our session bus connection was lost (or never
+# made); only these warrant reconnecting and trying our notification again
+NOTIFY_DBUS_RECONNECT_ERRORS = (
+    'org.freedesktop.DBus.Error.Disconnected',
+    'org.freedesktop.DBus.Error.NoServer',
+    'org.freedesktop.DBus.Error.NoNetwork',
+)
+
 # Initialize our mainloops
 LOOP_GLIB = None
 LOOP_QT = None
@@ -53,6 +61,7 @@ try:
     from dbus import Interface
     from dbus import Byte
     from dbus import ByteArray
+    from dbus.exceptions import DBusException
 
     #
     # now we try to determine which mainloop(s) we can access
@@ -157,6 +166,14 @@ class NotifyDBus(NotifyBase):
     # let me know! :)
     _enabled = NOTIFY_DBUS_SUPPORT_ENABLED
 
+    # Our DBus interfaces are shared between all of our instances and are
+    # keyed by the mainloop they were established with.  This prevents us
+    # from opening a new session bus connection for every message we send.
+    _interfaces = {}
+
+    # Our decoded icon_data keyed by the path of the image it was loaded from
+    _icons = {}
+
     def __init__(self, urgency=None, x_axis=None, y_axis=None, **kwargs):
         """
         Initialize DBus Object
@@ -200,21 +217,6 @@ class NotifyDBus(NotifyBase):
                 "{} notifications could not be loaded.".format(self.schema))
             return False
 
-        # Acquire our session
-        session = SessionBus(mainloop=MAINLOOP_MAP[self.schema])
-
-        # acquire our dbus object
-        dbus_obj = session.get_object(
-            NOTIFY_DBUS_INTERFACE,
-            NOTIFY_DBUS_SETTING_LOCATION,
-        )
-
-        # Acquire our dbus interface
-        dbus_iface = Interface(
-            dbus_obj,
-            dbus_interface=NOTIFY_DBUS_INTERFACE,
-        )
-
         # image path
         icon_path = self.image_path(notify_type, extension='.ico')
 
@@ -229,25 +231,10 @@ class NotifyDBus(NotifyBase):
             meta_payload['y'] = self.y_axis
 
         if NOTIFY_DBUS_IMAGE_SUPPORT is True:
-            try:
-                # Use Pixbuf to create the proper image type
-                image = GdkPixbuf.Pixbuf.new_from_file(icon_path)
-
+            icon_data = self._icon_data(icon_path)
+            if icon_data is not None:
                 # Associate our image to our notification
-                meta_payload['icon_data'] = (
-                    image.get_width(),
-                    image.get_height(),
-                    image.get_rowstride(),
-                    image.get_has_alpha(),
-                    image.get_bits_per_sample(),
-                    image.get_n_channels(),
-                    ByteArray(image.get_pixels())
-                )
-
-            except Exception as e:
-                self.logger.warning(
-                    "Could not load Gnome notification icon ({}): {}"
-                    .format(icon_path, e))
+                meta_payload['icon_data'] = icon_data
 
         # Limit results to just the first 10 line otherwise
         # there is just to much content to display
@@ -258,34 +245,116 @@ class NotifyDBus(NotifyBase):
 
         body = '\r\n'.join(body[0:10])
 
-        try:
-            dbus_iface.Notify(
-                # Application Identifier
-                self.app_id,
-                # Message ID (0 = New Message)
-                0,
-                # Icon (str) - not used
-                '',
-                # Title
-                str(title),
-                # Body
-                str(body),
-                # Actions
-                list(),
-                # Meta
-                meta_payload,
-                # Message Timeout
-                self.message_timeout_ms,
+        # We attempt our notification using our cached interface first; if
+        # our session bus connection was lost we reconnect and try one more
+        # time
+        for reconnect in (False, True):
+            try:
+                self._interface(reconnect=reconnect).Notify(
+                    # Application Identifier
+                    self.app_id,
+                    # Message ID (0 = New Message)
+                    0,
+                    # Icon (str) - not used
+                    '',
+                    # Title
+                    str(title),
+                    # Body
+                    str(body),
+                    # Actions
+                    list(),
+                    # Meta
+                    meta_payload,
+                    # Message Timeout
+                    self.message_timeout_ms,
+                )
+
+                self.logger.info('Sent DBus notification.')
+                break
+
+            except DBusException as e:
+                if not reconnect and \
+                        e.get_dbus_name() in NOTIFY_DBUS_RECONNECT_ERRORS:
+                    self.logger.debug(
+                        'Reconnecting to the DBus session bus.')
+                    continue
+
+                self.logger.warning('Failed to send DBus notification.')
+                self.logger.exception('DBus Exception')
+                return False
+
+            except Exception:
+                self.logger.warning('Failed to send DBus notification.')
+                self.logger.exception('DBus Exception')
+                return False
+
+        return True
+
+    def _interface(self, reconnect=False):
+        """
+        Returns the (cached) DBus interface associated with our mainloop.
+
+        If reconnect is set to True, then a new session bus connection is
+        always established.
+
+        """
+        mainloop = MAINLOOP_MAP[self.schema]
+
+        dbus_iface = None if reconnect else self._interfaces.get(mainloop)
+        if dbus_iface is None:
+            # Acquire our session
+            session = SessionBus(mainloop=mainloop)
+
+            # acquire our dbus object
+            dbus_obj = session.get_object(
+                NOTIFY_DBUS_INTERFACE,
+                NOTIFY_DBUS_SETTING_LOCATION,
+            )
+
+            # Acquire our dbus interface
+            dbus_iface = Interface(
+                dbus_obj,
+                dbus_interface=NOTIFY_DBUS_INTERFACE,
             )
 
-            self.logger.info('Sent DBus notification.')
+            # Store our interface for future use
+            self._interfaces[mainloop] = dbus_iface
+
+        return dbus_iface
+
+    def _icon_data(self, icon_path):
+        """
+        Returns the (cached) icon_data meta entry for the image found at the
+        specified path or None if it could not be loaded.
+
+        """
+        icon_data = self._icons.get(icon_path)
+        if icon_data is not None:
+            return icon_data
+
+        try:
+            # Use Pixbuf to create the proper image type
+            image = GdkPixbuf.Pixbuf.new_from_file(icon_path)
+
+            icon_data = (
+                image.get_width(),
+                image.get_height(),
+                image.get_rowstride(),
+                image.get_has_alpha(),
+                image.get_bits_per_sample(),
+                image.get_n_channels(),
+                ByteArray(image.get_pixels())
+            )
 
         except Exception as e:
-            self.logger.warning('Failed to send DBus notification.')
-            self.logger.exception('DBus Exception')
-            return False
+            self.logger.warning(
+                "Could not load Gnome notification icon ({}): {}"
+                .format(icon_path, e))
+            return None
 
-        return True
+        # Store our decoded image for future use
+        self._icons[icon_path] = icon_data
+        return icon_data
 
     @staticmethod
     def parse_url(url):
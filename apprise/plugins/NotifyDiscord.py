@@ -41,6 +41,7 @@
 #    - https://discordapp.com/developers/docs/resources/webhook
 #
 import re
+import logging
 import requests
 from json import dumps
 
@@ -197,20 +198,23 @@ class NotifyDiscord(NotifyBase):
             self.webhook_token,
         )
 
-        self.logger.debug('Discord POST URL: %s (cert_verify=%r)' % (
-            notify_url, self.verify_certificate,
-        ))
-        self.logger.debug('Discord Payload: %s' % str(payload))
+        self.logger.debug(
+            'Discord POST URL: %s (cert_verify=%r)',
+            notify_url, self.verify_certificate)
+        self.logger.debug('Discord Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code not in (
                     requests.codes.ok, requests.codes.no_content):
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Discord notification: '
@@ -223,7 +227,10 @@ class NotifyDiscord(NotifyBase):
                         'Failed to send Discord notification '
                         '(error=%s).' % r.status_code)
 
-                self.logger.debug('Response Details: %s' % r.raw.read())
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # Only read our response if we're going to log it
+                    self.logger.debug(
+                        'Response Details: %s', self.loggable(r.raw.read()))
 
                 # Return; we're done
                 return False
@@ -236,7 +243,7 @@ class NotifyDiscord(NotifyBase):
                 'A Connection error occured sending Discord '
                 'notification.'
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return False
 
         return True
@@ -240,7 +240,7 @@ class NotifyEmail(NotifyBase):
     default_secure_mode = SecureMailMode.STARTTLS
 
     # Default SMTP Timeout (in seconds)
-    connect_timeout = 15
+    timeout = 15
 
     def __init__(self, **kwargs):
         """
@@ -256,13 +256,6 @@ class NotifyEmail(NotifyBase):
             else:
                 self.port = self.default_port
 
-        # Email SMTP Server Timeout
-        try:
-            self.timeout = int(kwargs.get('timeout', self.connect_timeout))
-
-        except (ValueError, TypeError):
-            self.timeout = self.connect_timeout
-
         # Now we want to construct the To and From email
         # addresses from the URL provided
         self.from_name = kwargs.get('name', None)
@@ -304,15 +297,13 @@ class NotifyEmail(NotifyBase):
             return
 
         for i in range(len(WEBBASE_LOOKUP_TABLE)):  # pragma: no branch
-            self.logger.debug('Scanning %s against %s' % (
-                self.to_addr, WEBBASE_LOOKUP_TABLE[i][0]
-            ))
+            self.logger.debug(
+                'Scanning %s against %s',
+                self.to_addr, WEBBASE_LOOKUP_TABLE[i][0])
             match = WEBBASE_LOOKUP_TABLE[i][1].match(self.from_addr)
             if match:
                 self.logger.info(
-                    'Applying %s Defaults' %
-                    WEBBASE_LOOKUP_TABLE[i][0],
-                )
+                    'Applying %s Defaults', WEBBASE_LOOKUP_TABLE[i][0])
                 self.port = WEBBASE_LOOKUP_TABLE[i][2]\
                     .get('port', self.port)
                 self.secure = WEBBASE_LOOKUP_TABLE[i][2]\
@@ -353,11 +344,10 @@ class NotifyEmail(NotifyBase):
         if not from_name:
             from_name = self.app_desc
 
-        self.logger.debug('Email From: %s <%s>' % (
-            self.from_addr, from_name))
-        self.logger.debug('Email To: %s' % (self.to_addr))
-        self.logger.debug('Login ID: %s' % (self.user))
-        self.logger.debug('Delivery: %s:%d' % (self.smtp_host, self.port))
+        self.logger.debug('Email From: %s <%s>', self.from_addr, from_name)
+        self.logger.debug('Email To: %s', self.to_addr)
+        self.logger.debug('Login ID: %s', self.user)
+        self.logger.debug('Delivery: %s:%d', self.smtp_host, self.port)
 
         # Prepare Email Message
         if self.notify_format == NotifyFormat.HTML:
@@ -386,7 +376,7 @@ class NotifyEmail(NotifyBase):
                 self.smtp_host,
                 self.port,
                 None,
-                timeout=self.timeout,
+                timeout=self.request_timeout,
             )
 
             if self.secure and self.secure_mode == SecureMailMode.STARTTLS:
@@ -402,15 +392,13 @@ class NotifyEmail(NotifyBase):
             # Send the email
             socket.sendmail(self.from_addr, self.to_addr, email.as_string())
 
-            self.logger.info('Sent Email notification to "%s".' % (
-                self.to_addr,
-            ))
+            self.logger.info('Sent Email notification to "%s".', self.to_addr)
 
         except (SocketError, smtplib.SMTPException, RuntimeError) as e:
             self.logger.warning(
                 'A Connection error occured sending Email '
                 'notification to %s.' % self.smtp_host)
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             # Return; we're done
             return False
 
@@ -470,10 +458,6 @@ class NotifyEmail(NotifyBase):
             # Extract from name to associate with from address
             results['name'] = NotifyBase.unquote(results['qsd']['name'])
 
-        if 'timeout' in results['qsd'] and len(results['qsd']['timeout']):
-            # Extract the timeout to associate with smtp server
-            results['timeout'] = results['qsd']['timeout']
-
         # Store SMTP Host if specified
         if 'smtp' in results['qsd'] and len(results['qsd']['smtp']):
             # Extract the smtp server
@@ -155,8 +155,8 @@ class NotifyEmby(NotifyBase):
             payload['pw'] = ''
 
         self.logger.debug(
-            'Emby login() POST URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate))
+            'Emby login() POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
 
         try:
             r = requests.post(
@@ -164,9 +164,12 @@ class NotifyEmby(NotifyBase):
                 headers=headers,
                 data=dumps(payload),
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code != requests.codes.ok:
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to authenticate user %s details: '
@@ -180,7 +183,8 @@ class NotifyEmby(NotifyBase):
                         'Failed to authenticate user %s details: '
                         '(error=%s).' % (self.user, r.status_code))
 
-                self.logger.debug('Emby Response:\r\n%s' % r.text)
+                self.logger.debug(
+                    'Emby Response:\r\n%s', self.loggable(r.text))
 
                 # Return; we're done
                 return False
@@ -189,7 +193,7 @@ class NotifyEmby(NotifyBase):
             self.logger.warning(
                 'A Connection error occured authenticating a user with Emby '
                 'at %s.' % self.host)
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
@@ -317,17 +321,20 @@ class NotifyEmby(NotifyBase):
         }
 
         self.logger.debug(
-            'Emby session() GET URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate))
+            'Emby session() GET URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
 
         try:
             r = requests.get(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code != requests.codes.ok:
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to acquire session for user %s details: '
@@ -341,7 +348,8 @@ class NotifyEmby(NotifyBase):
                         'Failed to acquire session for user %s details: '
                         '(error=%s).' % (self.user, r.status_code))
 
-                self.logger.debug('Emby Response:\r\n%s' % r.text)
+                self.logger.debug(
+                    'Emby Response:\r\n%s', self.loggable(r.text))
 
                 # Return; we're done
                 return sessions
@@ -350,7 +358,7 @@ class NotifyEmby(NotifyBase):
             self.logger.warning(
                 'A Connection error occured querying Emby '
                 'for session information at %s.' % self.host)
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return sessions
@@ -396,13 +404,14 @@ class NotifyEmby(NotifyBase):
         }
 
         self.logger.debug(
-            'Emby logout() POST URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate))
+            'Emby logout() POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
         try:
             r = requests.post(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code not in (
@@ -424,7 +433,8 @@ class NotifyEmby(NotifyBase):
                         'Failed to logoff user %s details: '
                         '(error=%s).' % (self.user, r.status_code))
 
-                self.logger.debug('Emby Response:\r\n%s' % r.text)
+                self.logger.debug(
+                    'Emby Response:\r\n%s', self.loggable(r.text))
 
                 # Return; we're done
                 return False
@@ -433,7 +443,7 @@ class NotifyEmby(NotifyBase):
             self.logger.warning(
                 'A Connection error occured querying Emby '
                 'to logoff user %s at %s.' % (self.user, self.host))
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
@@ -490,20 +500,23 @@ class NotifyEmby(NotifyBase):
             # Update our session
             session_url = url % session
 
-            self.logger.debug('Emby POST URL: %s (cert_verify=%r)' % (
-                session_url, self.verify_certificate,
-            ))
-            self.logger.debug('Emby Payload: %s' % str(payload))
+            self.logger.debug(
+                'Emby POST URL: %s (cert_verify=%r)',
+                session_url, self.verify_certificate)
+            self.logger.debug('Emby Payload: %s', self.loggable(payload))
             try:
                 r = requests.post(
                     session_url,
                     data=dumps(payload),
                     headers=headers,
                     verify=self.verify_certificate,
+                    timeout=self.request_timeout,
                 )
                 if r.status_code not in (
                         requests.codes.ok,
                         requests.codes.no_content):
+                    self.circuit_response(r.status_code)
+
                     try:
                         self.logger.warning(
                             'Failed to send Emby notification: '
@@ -527,7 +540,7 @@ class NotifyEmby(NotifyBase):
                 self.logger.warning(
                     'A Connection error occured sending Emby '
                     'notification to %s.' % self.host)
-                self.logger.debug('Socket Exception: %s' % str(e))
+                self.logger.debug('Socket Exception: %s', e)
 
                 # Mark our failure
                 has_error = True
@@ -81,19 +81,22 @@ class NotifyFaast(NotifyBase):
         if image_url:
             payload['icon_url'] = image_url
 
-        self.logger.debug('Faast POST URL: %s (cert_verify=%r)' % (
-            self.notify_url, self.verify_certificate,
-        ))
-        self.logger.debug('Faast Payload: %s' % str(payload))
+        self.logger.debug(
+            'Faast POST URL: %s (cert_verify=%r)',
+            self.notify_url, self.verify_certificate)
+        self.logger.debug('Faast Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Faast notification: '
@@ -117,7 +120,7 @@ class NotifyFaast(NotifyBase):
             self.logger.warning(
                 'A Connection error occured sending Faast notification.',
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
@@ -95,6 +95,9 @@ class NotifyGnome(NotifyBase):
     # let me know! :)
     _enabled = NOTIFY_GNOME_SUPPORT_ENABLED
 
+    # Our decoded images keyed by the path they were loaded from
+    _icons = {}
+
     def __init__(self, urgency=None, **kwargs):
         """
         Initialize Gnome Object
@@ -142,8 +145,13 @@ class NotifyGnome(NotifyBase):
             notification.set_urgency(self.urgency)
 
             try:
-                # Use Pixbuf to create the proper image type
-                image = GdkPixbuf.Pixbuf.new_from_file(icon_path)
+                image = self._icons.get(icon_path)
+                if image is None:
+                    # Use Pixbuf to create the proper image type
+                    image = GdkPixbuf.Pixbuf.new_from_file(icon_path)
+
+                    # Store our decoded image for future use
+                    self._icons[icon_path] = image
 
                 # Associate our image to our notification
                 notification.set_icon_from_pixbuf(image)
@@ -108,9 +108,13 @@ class NotifyGrowl(NotifyBase):
         if self.password is not None:
             payload['password'] = self.password
 
-        self.logger.debug('Growl Registration Payload: %s' % str(payload))
+        self.logger.debug(
+            'Growl Registration Payload: %s', self.loggable(payload))
         self.growl = notifier.GrowlNotifier(**payload)
 
+        # Our registration is bound by our timeout too
+        self.growl.socketTimeout = self.timeout
+
         try:
             self.growl.register()
             self.logger.debug(
@@ -171,7 +175,7 @@ class NotifyGrowl(NotifyBase):
             'sticky': False,
             'priority': self.priority,
         }
-        self.logger.debug('Growl Payload: %s' % str(payload))
+        self.logger.debug('Growl Payload: %s', self.loggable(payload))
 
         # Update icon of payload to be raw data; this is intentionally done
         # here after we spit the debug message above (so we don't try to
@@ -179,6 +183,9 @@ class NotifyGrowl(NotifyBase):
         payload['icon'] = icon
 
         try:
+            # Apply our (remaining) timeout
+            self.growl.socketTimeout = self.request_timeout
+
             response = self.growl.notify(**payload)
             if not isinstance(response, bool):
                 self.logger.warning(
@@ -200,7 +207,7 @@ class NotifyGrowl(NotifyBase):
             self.logger.warning(
                 'A Connection error occured sending Growl '
                 'notification to %s.' % self.host)
-            self.logger.debug('Growl Exception: %s' % str(e))
+            self.logger.debug('Growl Exception: %s', e)
 
             # Return; we're done
             return False
@@ -36,20 +36,40 @@ GNTP_EOL = shim.b('\r\n')
 GNTP_SEP = shim.b(': ')
 
 
-class _GNTPBuffer(shim.StringIO):
-	"""GNTP Buffer class"""
-	def writeln(self, value=None):
-		if value:
-			self.write(shim.b(value))
-		self.write(GNTP_EOL)
-
-	def writeheader(self, key, value):
-		if not isinstance(value, str):
-			value = str(value)
-		self.write(shim.b(key))
-		self.write(GNTP_SEP)
-		self.write(shim.b(value))
-		self.write(GNTP_EOL)
+# Identifiers of recently added binary resources keyed by their payload so
+# that the same icon is not re-hashed for every message sent
+_RESOURCE_IDENTIFIERS = {}
+_RESOURCE_IDENTIFIERS_MAX = 32
+
+
+def _writeheader(segments, key, value):
+	"""Append an encoded GNTP header line to a list of byte segments"""
+	if not isinstance(value, str):
+		value = str(value)
+	segments.extend((shim.b(key), GNTP_SEP, shim.b(value), GNTP_EOL))
+
+
+def _writeresources(segments, resources):
+	"""Append encoded GNTP binary resources to a list of byte segments"""
+	for resource, data in resources.items():
+		_writeheader(segments, 'Identifier', resource)
+		_writeheader(segments, 'Length', len(data))
+		segments.extend((GNTP_EOL, data, GNTP_EOL, GNTP_EOL))
+
+
+def _resource_identifier(data):
+	"""Return the (memoized) md5 identifier of a binary resource
+
+	:param bytes data: Binary Data
+	:return string: Hex digest identifying the resource
+	"""
+	identifier = _RESOURCE_IDENTIFIERS.get(data)
+	if identifier is None:
+		if len(_RESOURCE_IDENTIFIERS) >= _RESOURCE_IDENTIFIERS_MAX:
+			_RESOURCE_IDENTIFIERS.clear()
+		identifier = hashlib.md5(data).hexdigest()
+		_RESOURCE_IDENTIFIERS[data] = identifier
+	return identifier
 
 
 class _GNTPBase(object):
@@ -232,7 +252,7 @@ class _GNTPBase(object):
 		:param string data: Binary Data
 		"""
 		data = shim.b(data)
-		identifier = hashlib.md5(data).hexdigest()
+		identifier = _resource_identifier(data)
 		self.resources[identifier] = data
 		return 'x-growl-resource://%s' % identifier
 
@@ -253,25 +273,17 @@ class _GNTPBase(object):
 		:return string: GNTP Message ready to be sent. Returned as a byte string
 		"""
 
-		buff = _GNTPBuffer()
-
-		buff.writeln(self._format_info())
+		segments = [shim.b(self._format_info()), GNTP_EOL]
 
 		#Headers
 		for k, v in self.headers.items():
-			buff.writeheader(k, v)
-		buff.writeln()
+			_writeheader(segments, k, v)
+		segments.append(GNTP_EOL)
 
 		#Resources
-		for resource, data in self.resources.items():
-			buff.writeheader('Identifier', resource)
-			buff.writeheader('Length', len(data))
-			buff.writeln()
-			buff.write(data)
-			buff.writeln()
-			buff.writeln()
+		_writeresources(segments, self.resources)
 
-		return buff.getvalue()
+		return shim.b('').join(segments)
 
 
 class GNTPRegister(_GNTPBase):
@@ -350,32 +362,23 @@ class GNTPRegister(_GNTPBase):
 		:return string: Encoded GNTP Registration message. Returned as a byte string
 		"""
 
-		buff = _GNTPBuffer()
-
-		buff.writeln(self._format_info())
+		segments = [shim.b(self._format_info()), GNTP_EOL]
 
 		#Headers
 		for k, v in self.headers.items():
-			buff.writeheader(k, v)
-		buff.writeln()
+			_writeheader(segments, k, v)
+		segments.append(GNTP_EOL)
 
 		#Notifications
-		if len(self.notifications) > 0:
-			for notice in self.notifications:
-				for k, v in notice.items():
-					buff.writeheader(k, v)
-				buff.writeln()
+		for notice in self.notifications:
+			for k, v in notice.items():
+				_writeheader(segments, k, v)
+			segments.append(GNTP_EOL)
 
 		#Resources
-		for resource, data in self.resources.items():
-			buff.writeheader('Identifier', resource)
-			buff.writeheader('Length', len(data))
-			buff.writeln()
-			buff.write(data)
-			buff.writeln()
-			buff.writeln()
-
-		return buff.getvalue()
+		_writeresources(segments, self.resources)
+
+		return shim.b('').join(segments)
 
 
 class GNTPNotice(_GNTPBase):
@@ -194,7 +194,7 @@ class GrowlNotifier(object):
 		s.settimeout(self.socketTimeout)
 		try:
 			s.connect((self.hostname, self.port))
-			s.send(data)
+			s.sendall(data)
 			recv_data = s.recv(1024)
 			while not recv_data.endswith(shim.b("\r\n\r\n")):
 				recv_data += s.recv(1024)
@@ -148,26 +148,27 @@ class NotifyIFTTT(NotifyBase):
             event=self.event,
         )
 
-        self.logger.debug('IFTTT POST URL: %s (cert_verify=%r)' % (
-            url, self.verify_certificate,
-        ))
-        self.logger.debug('IFTTT Payload: %s' % str(payload))
+        self.logger.debug(
+            'IFTTT POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
+        self.logger.debug('IFTTT Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
+            self.logger.debug(u"IFTTT HTTP response status: %r", r.status_code)
+            self.logger.debug(u"IFTTT HTTP response headers: %r", r.headers)
             self.logger.debug(
-                u"IFTTT HTTP response status: %r" % r.status_code)
-            self.logger.debug(
-                u"IFTTT HTTP response headers: %r" % r.headers)
-            self.logger.debug(
-                u"IFTTT HTTP response body: %r" % r.content)
+                u"IFTTT HTTP response body: %s", self.loggable(r.content))
 
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send IFTTT:%s '
@@ -188,14 +189,14 @@ class NotifyIFTTT(NotifyBase):
 
             else:
                 self.logger.info(
-                    'Sent IFTTT notification to Event %s.' % self.event)
+                    'Sent IFTTT notification to Event %s.', self.event)
 
         except requests.RequestException as e:
             self.logger.warning(
                 'A Connection error occured sending IFTTT:%s ' % (
                     self.event) + 'notification.'
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return False
 
         return True
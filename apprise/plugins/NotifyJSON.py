@@ -31,6 +31,15 @@ from .NotifyBase import HTTP_ERROR_MAP
 from ..common import NotifyImageSize
 from ..utils import compat_is_basestring
 
+# Our payload is serialized just once into this skeleton leaving only the
+# (serialized) title, message and type to be filled in per notification.
+#
+# Version: Major.Minor,  Major is only updated if the entire schema is
+# changed. If just adding new items (or removing old ones, only increment
+# the Minor!
+JSON_PAYLOAD_SKELETON = \
+    '{"version": "1.0", "title": %s, "message": %s, "type": %s}'
+
 
 class NotifyJSON(NotifyBase):
     """
@@ -76,15 +85,8 @@ class NotifyJSON(NotifyBase):
         """
 
         # prepare JSON Object
-        payload = {
-            # Version: Major.Minor,  Major is only updated if the entire
-            # schema is changed. If just adding new items (or removing
-            # old ones, only increment the Minor!
-            'version': '1.0',
-            'title': title,
-            'message': body,
-            'type': notify_type,
-        }
+        payload = JSON_PAYLOAD_SKELETON % (
+            dumps(title), dumps(body), dumps(notify_type))
 
         headers = {
             'User-Agent': self.app_id,
@@ -104,19 +106,21 @@ class NotifyJSON(NotifyBase):
 
         url += self.fullpath
 
-        self.logger.debug('JSON POST URL: %s (cert_verify=%r)' % (
-            url, self.verify_certificate,
-        ))
-        self.logger.debug('JSON Payload: %s' % str(payload))
+        self.logger.debug(
+            'JSON POST URL: %s (cert_verify=%r)', url, self.verify_certificate)
+        self.logger.debug('JSON Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 url,
-                data=dumps(payload),
+                data=self.compress_body(payload, headers),
                 headers=headers,
                 auth=auth,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send JSON notification: '
@@ -139,7 +143,7 @@ class NotifyJSON(NotifyBase):
             self.logger.warning(
                 'A Connection error occured sending JSON '
                 'notification to %s.' % self.host)
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
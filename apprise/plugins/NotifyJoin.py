@@ -93,6 +93,13 @@ class NotifyJoin(NotifyBase):
     # The maximum allowable characters allowed in the body per message
     body_maxlen = 1000
 
+    # Our devices are passed along in the URL; we keep the (url encoded)
+    # list of them we pass in each request within this length as longer URLs
+    # are not safely handled by all of the servers (and proxies) along the
+    # way.  Our message doesn't count against it; it's the same in every
+    # request we make and is already limited by our body_maxlen.
+    devices_maxlen = 1000
+
     def __init__(self, apikey, devices, **kwargs):
         """
         Initialize Join Object
@@ -150,43 +157,69 @@ class NotifyJoin(NotifyBase):
         # error tracking (used for function return)
         return_status = True
 
-        # Create a copy of the devices list
-        devices = list(self.devices)
-        while len(devices):
-            device = devices.pop(0)
+        # Our arguments common to every request we make
+        url_args = {
+            'apikey': self.apikey,
+            'title': title,
+            'text': body,
+        }
+
+        image_url = self.image_url(notify_type)
+        if image_url:
+            url_args['icon'] = image_url
+
+        # Prepare the base of our URL
+        base_url = '%s?%s' % (self.notify_url, NotifyBase.urlencode(url_args))
+
+        # prepare payload
+        payload = {}
+
+        # Build our targets; groups must be notified individually while our
+        # devices can be notified in bulk by passing them all in as deviceIds
+        targets = []
+        devices = []
+        for device in self.devices:
             group_re = IS_GROUP_RE.match(device)
             if group_re:
-                device = 'group.%s' % group_re.group('name').lower()
+                targets.append(
+                    ('deviceId', 'group.%s' % group_re.group('name').lower()))
+
+            elif IS_DEVICE_RE.match(device):
+                devices.append(device)
 
-            elif not IS_DEVICE_RE.match(device):
+            else:
                 self.logger.warning(
                     "The specified device/group '%s' is invalid; skipping." % (
                         device,
                     )
                 )
-                continue
 
-            url_args = {
-                'apikey': self.apikey,
-                'deviceId': device,
-                'title': title,
-                'text': body,
-            }
+        # Chunk our devices so that our list of them never exceeds our limit;
+        # our delimiter (a comma) is url encoded to 3 characters
+        chunk = []
+        length = 0
+        for device in devices:
+            if chunk and length + 3 + len(device) > self.devices_maxlen:
+                targets.append(('deviceIds', ','.join(chunk)))
+                chunk = []
+                length = 0
 
-            image_url = self.image_url(notify_type)
-            if image_url:
-                url_args['icon'] = image_url
+            length += len(device) + (3 if chunk else 0)
+            chunk.append(device)
 
-            # prepare payload
-            payload = {}
+        if chunk:
+            targets.append(('deviceIds', ','.join(chunk)))
+
+        while len(targets):
+            key, device = targets.pop(0)
 
             # Prepare the URL
-            url = '%s?%s' % (self.notify_url, NotifyBase.urlencode(url_args))
+            url = '%s&%s' % (base_url, NotifyBase.urlencode({key: device}))
 
-            self.logger.debug('Join POST URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate,
-            ))
-            self.logger.debug('Join Payload: %s' % str(payload))
+            self.logger.debug(
+                'Join POST URL: %s (cert_verify=%r)',
+                self.loggable(url), self.verify_certificate)
+            self.logger.debug('Join Payload: %s', self.loggable(payload))
 
             try:
                 r = requests.post(
@@ -194,9 +227,12 @@ class NotifyJoin(NotifyBase):
                     data=payload,
                     headers=headers,
                     verify=self.verify_certificate,
+                    timeout=self.request_timeout,
                 )
                 if r.status_code != requests.codes.ok:
                     # We had a problem
+                    self.circuit_response(r.status_code)
+
                     try:
                         self.logger.warning(
                             'Failed to send Join:%s '
@@ -217,17 +253,17 @@ class NotifyJoin(NotifyBase):
                     return_status = False
 
                 else:
-                    self.logger.info('Sent Join notification to %s.' % device)
+                    self.logger.info('Sent Join notification to %s.', device)
 
             except requests.RequestException as e:
                 self.logger.warning(
                     'A Connection error occured sending Join:%s '
                     'notification.' % device
                 )
-                self.logger.debug('Socket Exception: %s' % str(e))
+                self.logger.debug('Socket Exception: %s', e)
                 return_status = False
 
-            if len(devices):
+            if len(targets):
                 # Prevent thrashing requests
                 self.throttle()
 
@@ -166,19 +166,22 @@ class NotifyMatrix(NotifyBase):
         else:
             payload = self.__slack_mode_payload(title, body, notify_type)
 
-        self.logger.debug('Matrix POST URL: %s (cert_verify=%r)' % (
-            url, self.verify_certificate,
-        ))
-        self.logger.debug('Matrix Payload: %s' % str(payload))
+        self.logger.debug(
+            'Matrix POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
+        self.logger.debug('Matrix Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 url,
-                data=dumps(payload),
+                data=self.compress_body(dumps(payload), headers),
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Matrix '
@@ -201,7 +204,7 @@ class NotifyMatrix(NotifyBase):
             self.logger.warning(
                 'A Connection error occured sending Matrix notification.'
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             notify_okay = False
 
         return notify_okay
@@ -136,19 +136,22 @@ class NotifyMatterMost(NotifyBase):
         url = '%s://%s:%d' % (self.schema, self.host, self.port)
         url += '/hooks/%s' % self.authtoken
 
-        self.logger.debug('MatterMost POST URL: %s (cert_verify=%r)' % (
-            url, self.verify_certificate,
-        ))
-        self.logger.debug('MatterMost Payload: %s' % str(payload))
+        self.logger.debug(
+            'MatterMost POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
+        self.logger.debug('MatterMost Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 url,
-                data=dumps(payload),
+                data=self.compress_body(dumps(payload), headers),
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send MatterMost notification:'
@@ -172,7 +175,7 @@ class NotifyMatterMost(NotifyBase):
                 'A Connection error occured sending MatterMost '
                 'notification.'
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
@@ -24,6 +24,7 @@
 # THE SOFTWARE.
 
 import re
+import logging
 import requests
 
 from .NotifyBase import NotifyBase
@@ -146,19 +147,22 @@ class NotifyProwl(NotifyBase):
         if self.providerkey:
             payload['providerkey'] = self.providerkey
 
-        self.logger.debug('Prowl POST URL: %s (cert_verify=%r)' % (
-            self.notify_url, self.verify_certificate,
-        ))
-        self.logger.debug('Prowl Payload: %s' % str(payload))
+        self.logger.debug(
+            'Prowl POST URL: %s (cert_verify=%r)',
+            self.notify_url, self.verify_certificate)
+        self.logger.debug('Prowl Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Prowl notification: '
@@ -172,7 +176,10 @@ class NotifyProwl(NotifyBase):
                         '(error=%s).' % (
                             r.status_code))
 
-                self.logger.debug('Response Details: %s' % r.raw.read())
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # Only read our response if we're going to log it
+                    self.logger.debug(
+                        'Response Details: %s', self.loggable(r.raw.read()))
 
                 # Return; we're done
                 return False
@@ -183,7 +190,7 @@ class NotifyProwl(NotifyBase):
         except requests.RequestException as e:
             self.logger.warning(
                 'A Connection error occured sending Prowl notification.')
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
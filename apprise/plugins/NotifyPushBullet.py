@@ -120,21 +120,20 @@ class NotifyPushBullet(NotifyBase):
             elif IS_EMAIL_RE.match(recipient):
                 payload['email'] = recipient
                 self.logger.debug(
-                    "Recipient '%s' is an email address" % recipient)
+                    "Recipient '%s' is an email address", recipient)
 
             elif recipient[0] == '#':
                 payload['channel_tag'] = recipient[1:]
-                self.logger.debug("Recipient '%s' is a channel" % recipient)
+                self.logger.debug("Recipient '%s' is a channel", recipient)
 
             else:
                 payload['device_iden'] = recipient
-                self.logger.debug(
-                    "Recipient '%s' is a device" % recipient)
+                self.logger.debug("Recipient '%s' is a device", recipient)
 
-            self.logger.debug('PushBullet POST URL: %s (cert_verify=%r)' % (
-                self.notify_url, self.verify_certificate,
-            ))
-            self.logger.debug('PushBullet Payload: %s' % str(payload))
+            self.logger.debug(
+                'PushBullet POST URL: %s (cert_verify=%r)',
+                self.notify_url, self.verify_certificate)
+            self.logger.debug('PushBullet Payload: %s', self.loggable(payload))
             try:
                 r = requests.post(
                     self.notify_url,
@@ -142,10 +141,13 @@ class NotifyPushBullet(NotifyBase):
                     headers=headers,
                     auth=auth,
                     verify=self.verify_certificate,
+                    timeout=self.request_timeout,
                 )
 
                 if r.status_code != requests.codes.ok:
                     # We had a problem
+                    self.circuit_response(r.status_code)
+
                     try:
                         self.logger.warning(
                             'Failed to send PushBullet notification to '
@@ -166,14 +168,14 @@ class NotifyPushBullet(NotifyBase):
 
                 else:
                     self.logger.info(
-                        'Sent PushBullet notification to "%s".' % (recipient))
+                        'Sent PushBullet notification to "%s".', recipient)
 
             except requests.RequestException as e:
                 self.logger.warning(
                     'A Connection error occured sending PushBullet '
                     'notification to "%s".' % (recipient),
                 )
-                self.logger.debug('Socket Exception: %s' % str(e))
+                self.logger.debug('Socket Exception: %s', e)
                 has_error = True
 
             if len(recipients):
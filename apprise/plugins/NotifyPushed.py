@@ -24,6 +24,7 @@
 # THE SOFTWARE.
 
 import re
+import logging
 import requests
 from json import dumps
 
@@ -212,20 +213,23 @@ class NotifyPushed(NotifyBase):
             'Content-Type': 'application/json'
         }
 
-        self.logger.debug('Pushed POST URL: %s (cert_verify=%r)' % (
-            self.notify_url, self.verify_certificate,
-        ))
-        self.logger.debug('Pushed Payload: %s' % str(payload))
+        self.logger.debug(
+            'Pushed POST URL: %s (cert_verify=%r)',
+            self.notify_url, self.verify_certificate)
+        self.logger.debug('Pushed Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 self.notify_url,
                 data=dumps(payload),
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Pushed notification: '
@@ -238,7 +242,10 @@ class NotifyPushed(NotifyBase):
                         'Failed to send Pushed notification '
                         '(error=%s).' % r.status_code)
 
-                self.logger.debug('Response Details: %s' % r.raw.read())
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # Only read our response if we're going to log it
+                    self.logger.debug(
+                        'Response Details: %s', self.loggable(r.raw.read()))
 
                 # Return; we're done
                 return False
@@ -249,7 +256,7 @@ class NotifyPushed(NotifyBase):
         except requests.RequestException as e:
             self.logger.warning(
                 'A Connection error occured sending Pushed notification.')
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
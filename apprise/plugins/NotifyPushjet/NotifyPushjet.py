@@ -71,7 +71,7 @@ class NotifyPushjet(NotifyBase):
             if self.port:
                 server += ":" + str(self.port)
 
-            api = pushjet.Api(server)
+            api = pushjet.Api(server, timeout=self.request_timeout)
             service = api.Service(secret_key=self.user)
 
             service.send(body, title)
@@ -79,7 +79,7 @@ class NotifyPushjet(NotifyBase):
 
         except (errors.PushjetError, ValueError) as e:
             self.logger.warning('Failed to send Pushjet notification.')
-            self.logger.debug('Pushjet Exception: %s' % str(e))
+            self.logger.debug('Pushjet Exception: %s', e)
             return False
 
         return True
@@ -27,6 +27,7 @@ import re
 import requests
 
 from ..utils import compat_is_basestring
+from ..utils import parse_bool
 from .NotifyBase import NotifyBase
 from .NotifyBase import HTTP_ERROR_MAP
 
@@ -93,7 +94,8 @@ class NotifyPushover(NotifyBase):
     # The maximum allowable characters allowed in the body per message
     body_maxlen = 512
 
-    def __init__(self, token, devices=None, priority=None, **kwargs):
+    def __init__(self, token, devices=None, priority=None, batch=True,
+                 **kwargs):
         """
         Initialize Pushover Object
         """
@@ -137,6 +139,9 @@ class NotifyPushover(NotifyBase):
         else:
             self.priority = priority
 
+        # Send to all of our devices in a single request when we can
+        self.batch = batch
+
         if not self.user:
             self.logger.warning('No user was specified.')
             raise TypeError('No user was specified.')
@@ -154,17 +159,34 @@ class NotifyPushover(NotifyBase):
         Perform Pushover Notification
         """
 
-        headers = {
-            'User-Agent': self.app_id,
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-        auth = (self.token, '')
-
         # error tracking (used for function return)
         has_error = False
 
         # Create a copy of the devices list
         devices = list(self.devices)
+
+        # Pushover accepts a comma separated list of devices; so if all of
+        # ours are valid we can notify them all with a single request
+        if self.batch and len(devices) > 1 and \
+                all(VALIDATE_DEVICE.match(d) for d in devices):
+
+            status_code = self._send(title, body, ','.join(devices))
+            if status_code == requests.codes.ok:
+                return True
+
+            if status_code != requests.codes.bad_request:
+                # Our failure had nothing to do with the devices specified
+                return False
+
+            # One or more of our devices were rejected; fall back to
+            # notifying each of them individually
+            self.logger.info(
+                'Pushover rejected our batched devices; notifying each '
+                'device individually.')
+
+            # Prevent thrashing requests
+            self.throttle()
+
         while len(devices):
             device = devices.pop(0)
 
@@ -175,60 +197,7 @@ class NotifyPushover(NotifyBase):
                 has_error = True
                 continue
 
-            # prepare JSON Object
-            payload = {
-                'token': self.token,
-                'user': self.user,
-                'priority': str(self.priority),
-                'title': title,
-                'message': body,
-                'device': device,
-            }
-
-            self.logger.debug('Pushover POST URL: %s (cert_verify=%r)' % (
-                self.notify_url, self.verify_certificate,
-            ))
-            self.logger.debug('Pushover Payload: %s' % str(payload))
-            try:
-                r = requests.post(
-                    self.notify_url,
-                    data=payload,
-                    headers=headers,
-                    auth=auth,
-                    verify=self.verify_certificate,
-                )
-                if r.status_code != requests.codes.ok:
-                    # We had a problem
-                    try:
-                        self.logger.warning(
-                            'Failed to send Pushover:%s '
-                            'notification: %s (error=%s).' % (
-                                device,
-                                PUSHOVER_HTTP_ERROR_MAP[r.status_code],
-                                r.status_code))
-
-                    except KeyError:
-                        self.logger.warning(
-                            'Failed to send Pushover:%s '
-                            'notification (error=%s).' % (
-                                device,
-                                r.status_code))
-
-                    # self.logger.debug('Response Details: %s' % r.raw.read())
-
-                    # Return; we're done
-                    has_error = True
-
-                else:
-                    self.logger.info(
-                        'Sent Pushover notification to %s.' % device)
-
-            except requests.RequestException as e:
-                self.logger.warning(
-                    'A Connection error occured sending Pushover:%s ' % (
-                        device) + 'notification.'
-                )
-                self.logger.debug('Socket Exception: %s' % str(e))
+            if self._send(title, body, device) != requests.codes.ok:
                 has_error = True
 
             if len(devices):
@@ -237,6 +206,77 @@ class NotifyPushover(NotifyBase):
 
         return not has_error
 
+    def _send(self, title, body, device):
+        """
+        Sends our notification to the specified device(s) and returns the
+        HTTP status code of the response (or None if no response was
+        received)
+
+        """
+        headers = {
+            'User-Agent': self.app_id,
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        auth = (self.token, '')
+
+        # prepare JSON Object
+        payload = {
+            'token': self.token,
+            'user': self.user,
+            'priority': str(self.priority),
+            'title': title,
+            'message': body,
+            'device': device,
+        }
+
+        self.logger.debug(
+            'Pushover POST URL: %s (cert_verify=%r)',
+            self.notify_url, self.verify_certificate)
+        self.logger.debug('Pushover Payload: %s', self.loggable(payload))
+        try:
+            r = requests.post(
+                self.notify_url,
+                data=payload,
+                headers=headers,
+                auth=auth,
+                verify=self.verify_certificate,
+                timeout=self.request_timeout,
+            )
+            if r.status_code != requests.codes.ok:
+                # We had a problem
+                self.circuit_response(r.status_code)
+
+                try:
+                    self.logger.warning(
+                        'Failed to send Pushover:%s '
+                        'notification: %s (error=%s).' % (
+                            device,
+                            PUSHOVER_HTTP_ERROR_MAP[r.status_code],
+                            r.status_code))
+
+                except KeyError:
+                    self.logger.warning(
+                        'Failed to send Pushover:%s '
+                        'notification (error=%s).' % (
+                            device,
+                            r.status_code))
+
+                # self.logger.debug('Response Details: %s' % r.raw.read())
+
+            else:
+                self.logger.info('Sent Pushover notification to %s.', device)
+
+            return r.status_code
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                'A Connection error occured sending Pushover:%s ' % (
+                    device) + 'notification.'
+            )
+            self.logger.debug('Socket Exception: %s', e)
+
+        return None
+
     @staticmethod
     def parse_url(url):
         """
@@ -274,6 +314,10 @@ class NotifyPushover(NotifyBase):
                 # No priority was set
                 pass
 
+        if 'batch' in results['qsd'] and len(results['qsd']['batch']):
+            # Allow the batching of our devices to be disabled
+            results['batch'] = parse_bool(results['qsd']['batch'], True)
+
         results['token'] = results['host']
         results['devices'] = devices
 
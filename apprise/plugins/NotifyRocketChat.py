@@ -198,19 +198,22 @@ class NotifyRocketChat(NotifyBase):
         Perform Notify Rocket.Chat Notification
         """
 
-        self.logger.debug('Rocket.Chat POST URL: %s (cert_verify=%r)' % (
-            self.api_url + 'chat.postMessage', self.verify_certificate,
-        ))
-        self.logger.debug('Rocket.Chat Payload: %s' % str(payload))
+        self.logger.debug(
+            'Rocket.Chat POST URL: %s (cert_verify=%r)',
+            self.api_url + 'chat.postMessage', self.verify_certificate)
+        self.logger.debug('Rocket.Chat Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 self.api_url + 'chat.postMessage',
                 data=payload,
                 headers=self.headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Rocket.Chat notification: '
@@ -228,14 +231,15 @@ class NotifyRocketChat(NotifyBase):
                 return False
 
             else:
-                self.logger.debug('Rocket.Chat Server Response: %s.' % r.text)
+                self.logger.debug(
+                    'Rocket.Chat Server Response: %s.', self.loggable(r.text))
                 self.logger.info('Sent Rocket.Chat notification.')
 
         except requests.RequestException as e:
             self.logger.warning(
                 'A Connection error occured sending Rocket.Chat '
                 'notification.')
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
@@ -257,9 +261,12 @@ class NotifyRocketChat(NotifyBase):
                 self.api_url + 'login',
                 data=payload,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to authenticate with Rocket.Chat server: '
@@ -294,7 +301,7 @@ class NotifyRocketChat(NotifyBase):
             self.logger.warning(
                 'A Connection error occured authenticating to the '
                 'Rocket.Chat server.')
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return False
 
         return True
@@ -308,9 +315,12 @@ class NotifyRocketChat(NotifyBase):
                 self.api_url + 'logout',
                 headers=self.headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to log off Rocket.Chat server: '
@@ -329,14 +339,14 @@ class NotifyRocketChat(NotifyBase):
 
             else:
                 self.logger.debug(
-                    'Rocket.Chat log off successful; response %s.' % (
-                        r.text))
+                    'Rocket.Chat log off successful; response %s.',
+                    self.loggable(r.text))
 
         except requests.RequestException as e:
             self.logger.warning(
                 'A Connection error occured logging off the '
                 'Rocket.Chat server')
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return False
 
         return True
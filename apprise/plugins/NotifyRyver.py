@@ -174,20 +174,23 @@ class NotifyRyver(NotifyBase):
             },
         }
 
-        self.logger.debug('Ryver POST URL: %s (cert_verify=%r)' % (
-            url, self.verify_certificate,
-        ))
-        self.logger.debug('Ryver Payload: %s' % str(payload))
+        self.logger.debug(
+            'Ryver POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
+        self.logger.debug('Ryver Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send Ryver:%s '
@@ -216,7 +219,7 @@ class NotifyRyver(NotifyBase):
                 'A Connection error occured sending Ryver:%s ' % (
                     self.organization) + 'notification.'
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return False
 
         return True
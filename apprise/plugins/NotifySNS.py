@@ -278,20 +278,23 @@ class NotifySNS(NotifyBase):
         # Prepare our AWS Headers based on our payload
         headers = self.aws_prepare_request(payload)
 
-        self.logger.debug('AWS POST URL: %s (cert_verify=%r)' % (
-            self.notify_url, self.verify_certificate,
-        ))
-        self.logger.debug('AWS Payload: %s' % str(payload))
+        self.logger.debug(
+            'AWS POST URL: %s (cert_verify=%r)',
+            self.notify_url, self.verify_certificate)
+        self.logger.debug('AWS Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send AWS notification to '
@@ -305,20 +308,20 @@ class NotifySNS(NotifyBase):
                         'Failed to send AWS notification to '
                         '"%s" (error=%s).' % (to, r.status_code))
 
-                    self.logger.debug('Response Details: %s' % r.text)
+                    self.logger.debug(
+                        'Response Details: %s', self.loggable(r.text))
 
                 return (False, NotifySNS.aws_response_to_dict(r.text))
 
             else:
-                self.logger.info(
-                    'Sent AWS notification to "%s".' % (to))
+                self.logger.info('Sent AWS notification to "%s".', to)
 
         except requests.RequestException as e:
             self.logger.warning(
                 'A Connection error occured sending AWS '
                 'notification to "%s".' % (to),
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return (False, NotifySNS.aws_response_to_dict(None))
 
         return (True, NotifySNS.aws_response_to_dict(r.text))
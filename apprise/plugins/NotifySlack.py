@@ -247,19 +247,22 @@ class NotifySlack(NotifyBase):
             if image_url:
                 payload['attachments'][0]['footer_icon'] = image_url
 
-            self.logger.debug('Slack POST URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate,
-            ))
-            self.logger.debug('Slack Payload: %s' % str(payload))
+            self.logger.debug(
+                'Slack POST URL: %s (cert_verify=%r)',
+                url, self.verify_certificate)
+            self.logger.debug('Slack Payload: %s', self.loggable(payload))
             try:
                 r = requests.post(
                     url,
                     data=dumps(payload),
                     headers=headers,
                     verify=self.verify_certificate,
+                    timeout=self.request_timeout,
                 )
                 if r.status_code != requests.codes.ok:
                     # We had a problem
+                    self.circuit_response(r.status_code)
+
                     try:
                         self.logger.warning(
                             'Failed to send Slack:%s '
@@ -288,7 +291,7 @@ class NotifySlack(NotifyBase):
                     'A Connection error occured sending Slack:%s ' % (
                         channel) + 'notification.'
                 )
-                self.logger.debug('Socket Exception: %s' % str(e))
+                self.logger.debug('Socket Exception: %s', e)
                 notify_okay = False
 
             if len(channels):
@@ -181,8 +181,7 @@ class NotifyTelegram(NotifyBase):
         if not path:
             # No image to send
             self.logger.debug(
-                'Telegram Image does not exist for %s' % (
-                    notify_type))
+                'Telegram Image does not exist for %s', notify_type)
             return None
 
         files = {'photo': (basename(path), open(path), 'rb')}
@@ -192,8 +191,8 @@ class NotifyTelegram(NotifyBase):
         }
 
         self.logger.debug(
-            'Telegram Image POST URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate))
+            'Telegram Image POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
 
         try:
             r = requests.post(
@@ -201,10 +200,13 @@ class NotifyTelegram(NotifyBase):
                 files=files,
                 data=payload,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to post Telegram Image: '
@@ -223,7 +225,7 @@ class NotifyTelegram(NotifyBase):
         except requests.RequestException as e:
             self.logger.warning(
                 'A connection error occured posting Telegram Image.')
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return False
 
         return True
@@ -246,18 +248,20 @@ class NotifyTelegram(NotifyBase):
         )
 
         self.logger.debug(
-            'Telegram User Detection POST URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate))
+            'Telegram User Detection POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
 
         try:
             r = requests.post(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
 
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
 
                 try:
                     # Try to get the error message if we can:
@@ -290,7 +294,7 @@ class NotifyTelegram(NotifyBase):
         except requests.RequestException as e:
             self.logger.warning(
                 'A connection error occured detecting Telegram User.')
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
             return 0
 
         # A Response might look something like this:
@@ -326,8 +330,8 @@ class NotifyTelegram(NotifyBase):
 
                 _id = _msg['message']['from'].get('id', 0)
                 _user = _msg['message']['from'].get('first_name')
-                self.logger.info('Detected telegram user %s (userid=%d)' % (
-                    _user, _id))
+                self.logger.info(
+                    'Detected telegram user %s (userid=%d)', _user, _id)
                 # Return our detected userid
                 return _id
 
@@ -433,10 +437,10 @@ class NotifyTelegram(NotifyBase):
                     # before our next hit server query
                     self.throttle()
 
-            self.logger.debug('Telegram POST URL: %s (cert_verify=%r)' % (
-                url, self.verify_certificate,
-            ))
-            self.logger.debug('Telegram Payload: %s' % str(payload))
+            self.logger.debug(
+                'Telegram POST URL: %s (cert_verify=%r)',
+                url, self.verify_certificate)
+            self.logger.debug('Telegram Payload: %s', self.loggable(payload))
 
             try:
                 r = requests.post(
@@ -444,10 +448,12 @@ class NotifyTelegram(NotifyBase):
                     data=dumps(payload),
                     headers=headers,
                     verify=self.verify_certificate,
+                    timeout=self.request_timeout,
                 )
 
                 if r.status_code != requests.codes.ok:
                     # We had a problem
+                    self.circuit_response(r.status_code)
 
                     try:
                         # Try to get the error message if we can:
@@ -491,7 +497,7 @@ class NotifyTelegram(NotifyBase):
                     'A connection error occured sending Telegram:%s ' % (
                         payload['chat_id']) + 'notification.'
                 )
-                self.logger.debug('Socket Exception: %s' % str(e))
+                self.logger.debug('Socket Exception: %s', e)
                 has_error = True
 
             finally:
@@ -23,6 +23,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+from time import time
+
 from . import tweepy
 from ..NotifyBase import NotifyBase
 
@@ -50,6 +52,22 @@ class NotifyTwitter(NotifyBase):
     # which are limited to 240 characters)
     body_maxlen = 4096
 
+    # Our authenticated API clients are shared between all of our instances
+    # and are keyed by the credentials they were established with.  This
+    # allows us to re-use their connection pool and cached user lookups.
+    _clients = {}
+
+    # The maximum number of user lookups cached per API client
+    user_cache_size = 128
+
+    # The number of seconds a user lookup remains cached for
+    user_cache_timeout = 3600
+
+    # The maximum number of seconds we'll wait out a Twitter rate limit for
+    # before giving up on our message.  We never block longer than this so
+    # that the delivery of our other notifications isn't held up.
+    rate_limit_max_wait = 0
+
     def __init__(self, ckey, csecret, akey, asecret, **kwargs):
         """
         Initialize Twitter Object
@@ -96,11 +114,8 @@ class NotifyTwitter(NotifyBase):
         """
 
         try:
-            # Attempt to Establish a connection to Twitter
-            self.auth = tweepy.OAuthHandler(self.ckey, self.csecret)
-
-            # Apply our Access Tokens
-            self.auth.set_access_token(self.akey, self.asecret)
+            # Acquire our authenticated API client
+            api = self._client()
 
         except Exception:
             self.logger.warning(
@@ -111,24 +126,74 @@ class NotifyTwitter(NotifyBase):
 
         text = '%s\r\n%s' % (title, body)
         try:
-            # Get our API
-            api = tweepy.API(self.auth)
+            # Rate limits that can't be waited out by our deadline are
+            # returned to us instead of blocking
+            deadline = time() + self.rate_limit_max_wait
+            if self.deadline is not None:
+                deadline = min(deadline, self.deadline)
+
+            # Our API client is shared, so our timeout is passed along with
+            # each call (rather then set on it)
+            timeout = self.request_timeout
+
+            # Resolve our user; this lookup is cached by our API client
+            result = api.get_user(
+                screen_name=self.user, deadline=deadline, timeout=timeout)
+            if not isinstance(result, tweepy.RateLimited):
+                # Send our Direct Message
+                result = api.send_direct_message(
+                    user_id=result.id, text=text, deadline=deadline,
+                    timeout=timeout)
+
+            if isinstance(result, tweepy.RateLimited):
+                self.logger.warning(
+                    'Twitter rate limit reached; the direct message to %s '
+                    'can not be sent for another %d second(s).' % (
+                        self.user, max(0, result.reset_time - time())))
+                return False
 
-            # Send our Direct Message
-            api.send_direct_message(self.user, text=text)
             self.logger.info('Sent Twitter DM notification.')
 
         except Exception as e:
             self.logger.warning(
                 'A Connection error occured sending Twitter '
                 'direct message to %s.' % self.user)
-            self.logger.debug('Twitter Exception: %s' % str(e))
+            self.logger.debug('Twitter Exception: %s', e)
 
             # Return; we're done
             return False
 
         return True
 
+    def _client(self):
+        """
+        Returns the (cached) authenticated API client associated with our
+        credentials.
+
+        """
+        key = (self.ckey, self.csecret, self.akey, self.asecret)
+
+        api = self._clients.get(key)
+        if api is None:
+            # Attempt to Establish a connection to Twitter
+            auth = tweepy.OAuthHandler(self.ckey, self.csecret)
+
+            # Apply our Access Tokens
+            auth.set_access_token(self.akey, self.asecret)
+
+            # Get our API; our screen_name to user_id lookups are cached
+            api = tweepy.API(
+                auth, wait_on_rate_limit=True,
+                cache=tweepy.MemoryCache(
+                    timeout=self.user_cache_timeout,
+                    size=self.user_cache_size))
+
+            # Store our client for future use; if another thread beat us
+            # to it, we use theirs
+            api = self._clients.setdefault(key, api)
+
+        return api
+
     @staticmethod
     def parse_url(url):
         """
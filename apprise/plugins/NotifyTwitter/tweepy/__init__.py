@@ -12,6 +12,7 @@ __license__ = 'MIT'
 from .models import Status, User, DirectMessage, Friendship, SavedSearch, SearchResults, ModelFactory, Category
 from .error import TweepError, RateLimitError
 from .api import API
+from .binder import RateLimited
 from .cache import Cache, MemoryCache, FileCache
 from .auth import OAuthHandler, AppAuthHandler
 from .streaming import Stream, StreamListener
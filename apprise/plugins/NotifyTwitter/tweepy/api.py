@@ -8,6 +8,7 @@ import os
 import mimetypes
 
 import six
+import requests
 
 from .binder import bind_api
 from .error import TweepError
@@ -67,6 +68,10 @@ class API(object):
         if proxy:
             self.proxy['https'] = proxy
 
+        # A single session (and its connection pool) is shared by every
+        # request made through this API object
+        self.session = requests.Session()
+
         # Attempt to explain more clearly the parser argument requirements
         # https://github.com/tweepy/tweepy/issues/421
         #
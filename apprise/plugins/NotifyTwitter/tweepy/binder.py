@@ -23,6 +23,24 @@ re_path_template = re.compile(r'{\w+}')
 
 log = logging.getLogger('tweepy.binder')
 
+
+class RateLimited(object):
+    """Returned in place of a result when waiting out a rate limit would
+    exceed the deadline provided by the caller
+
+        reset_time: the time (in seconds since the epoch) the request can
+            be attempted again
+        response: the response that triggered the rate limit
+    """
+
+    def __init__(self, reset_time, response=None):
+        self.reset_time = reset_time
+        self.response = response
+
+    def __repr__(self):
+        return '<RateLimited until %d>' % self.reset_time
+
+
 def bind_api(**config):
 
     class APIMethod(object):
@@ -37,7 +55,10 @@ def bind_api(**config):
         search_api = config.get('search_api', False)
         upload_api = config.get('upload_api', False)
         use_cache = config.get('use_cache', True)
-        session = requests.Session()
+        # share the connection pool of our API object when we can; our
+        # params and headers are passed with each request (and never set on
+        # the session) since other calls may be using it at the same time
+        session = getattr(api, 'session', None) or requests.Session()
 
         def __init__(self, args, kwargs):
             api = self.api
@@ -58,7 +79,14 @@ def bind_api(**config):
             self.wait_on_rate_limit_notify = kwargs.pop('wait_on_rate_limit_notify',
                                                         api.wait_on_rate_limit_notify)
             self.parser = kwargs.pop('parser', api.parser)
-            self.session.headers = kwargs.pop('headers', {})
+            # The time (in seconds since the epoch) we must return by; if
+            # honouring a rate limit would exceed it we return a RateLimited
+            # result instead of sleeping.
+            self.deadline = kwargs.pop('deadline', None)
+            # The timeout may be set for each call rather then on our API
+            # object which is shared
+            self.timeout = kwargs.pop('timeout', api.timeout)
+            self.headers = dict(kwargs.pop('headers', None) or {})
             self.build_parameters(args, kwargs)
 
             # Pick correct URL root to use
@@ -83,44 +111,44 @@ def bind_api(**config):
             # or older where Host is set including the 443 port.
             # This causes Twitter to issue 301 redirect.
             # See Issue https://github.com/tweepy/tweepy/issues/12
-            self.session.headers['Host'] = self.host
+            self.headers['Host'] = self.host
             # Monitoring rate limits
             self._remaining_calls = None
             self._reset_time = None
 
         def build_parameters(self, args, kwargs):
-            self.session.params = {}
+            self.params = {}
             for idx, arg in enumerate(args):
                 if arg is None:
                     continue
                 try:
-                    self.session.params[self.allowed_param[idx]] = convert_to_utf8_str(arg)
+                    self.params[self.allowed_param[idx]] = convert_to_utf8_str(arg)
                 except IndexError:
                     raise TweepError('Too many parameters supplied!')
 
             for k, arg in kwargs.items():
                 if arg is None:
                     continue
-                if k in self.session.params:
+                if k in self.params:
                     raise TweepError('Multiple values for parameter %s supplied!' % k)
 
-                self.session.params[k] = convert_to_utf8_str(arg)
+                self.params[k] = convert_to_utf8_str(arg)
 
-            log.debug("PARAMS: %r", self.session.params)
+            log.debug("PARAMS: %r", self.params)
 
         def build_path(self):
             for variable in re_path_template.findall(self.path):
                 name = variable.strip('{}')
 
-                if name == 'user' and 'user' not in self.session.params and self.api.auth:
+                if name == 'user' and 'user' not in self.params and self.api.auth:
                     # No 'user' parameter provided, fetch it from Auth instead.
                     value = self.api.auth.get_username()
                 else:
                     try:
-                        value = quote(self.session.params[name])
+                        value = quote(self.params[name])
                     except KeyError:
                         raise TweepError('No parameter value found for path variable: %s' % name)
-                    del self.session.params[name]
+                    del self.params[name]
 
                 self.path = self.path.replace(variable, value)
 
@@ -134,7 +162,7 @@ def bind_api(**config):
             # Query the cache if one is available
             # and this request uses a GET method.
             if self.use_cache and self.api.cache and self.method == 'GET':
-                cache_result = self.api.cache.get('%s?%s' % (url, urlencode(self.session.params)))
+                cache_result = self.api.cache.get('%s?%s' % (url, urlencode(self.params)))
                 # if cache result found and not expired, return it
                 if cache_result:
                     # must restore api reference
@@ -159,6 +187,9 @@ def bind_api(**config):
                             if self._remaining_calls < 1:
                                 sleep_time = self._reset_time - int(time.time())
                                 if sleep_time > 0:
+                                    if self._exceeds_deadline(sleep_time + 5):
+                                        self.api.last_response = resp
+                                        return RateLimited(self._reset_time + 5, resp)
                                     if self.wait_on_rate_limit_notify:
                                         log.warning("Rate limit reached. Sleeping for: %d" % sleep_time)
                                     time.sleep(sleep_time + 5)  # sleep for few extra sec
@@ -178,14 +209,16 @@ def bind_api(**config):
 
                 # Request compression if configured
                 if self.api.compression:
-                    self.session.headers['Accept-encoding'] = 'gzip'
+                    self.headers['Accept-encoding'] = 'gzip'
 
                 # Execute request
                 try:
                     resp = self.session.request(self.method,
                                                 full_url,
                                                 data=self.post_data,
-                                                timeout=self.api.timeout,
+                                                params=self.params,
+                                                headers=self.headers,
+                                                timeout=self.timeout,
                                                 auth=auth,
                                                 proxies=self.api.proxy)
                 except Exception as e:
@@ -214,6 +247,13 @@ def bind_api(**config):
                 elif self.retry_errors and resp.status_code not in self.retry_errors:
                     break
 
+                if self._exceeds_deadline(retry_delay):
+                    if resp.status_code == 429 or resp.status_code == 420:
+                        self.api.last_response = resp
+                        return RateLimited(time.time() + retry_delay, resp)
+                    # we can't wait any longer to retry our request
+                    break
+
                 # Sleep before retrying request again
                 time.sleep(retry_delay)
                 retries_performed += 1
@@ -238,13 +278,19 @@ def bind_api(**config):
 
             # Store result into cache if one is available.
             if self.use_cache and self.api.cache and self.method == 'GET' and result:
-                self.api.cache.store('%s?%s' % (url, urlencode(self.session.params)), result)
+                self.api.cache.store('%s?%s' % (url, urlencode(self.params)), result)
 
             return result
 
+        def _exceeds_deadline(self, sleep_time):
+            return self.deadline is not None and \
+                time.time() + sleep_time > self.deadline
+
     def _call(*args, **kwargs):
+        # create isn't a parameter of our request
+        create = kwargs.pop('create', False)
         method = APIMethod(args, kwargs)
-        if kwargs.get('create'):
+        if create:
             return method
         else:
             return method.execute()
@@ -6,10 +6,11 @@ from __future__ import print_function
 
 import time
 import datetime
-import hashlib
 import threading
 import os
 import logging
+import sys
+from collections import OrderedDict
 
 try:
     import cPickle as pickle
@@ -17,17 +18,22 @@ except ImportError:
     import pickle
 
 try:
-    import fcntl
+    import sqlite3
 except ImportError:
-    # Probably on a windows system
-    # TODO: use win32file
-    pass
+    # Python was built without SQLite; only FileCache needs it
+    sqlite3 = None
 
 log = logging.getLogger('tweepy.cache')
 
 class Cache(object):
     """Cache interface"""
 
+    # Counters tracking the effectiveness of the cache; evictions include
+    # entries removed because they expired or exceeded the cache's budget
+    hits = 0
+    misses = 0
+    evictions = 0
+
     def __init__(self, timeout=60):
         """Initialize the cache
             timeout: number of seconds to keep a cached entry
@@ -60,32 +66,88 @@ class Cache(object):
         """Delete all cached entries"""
         raise NotImplementedError
 
+    def stats(self):
+        """Get the hit, miss and eviction counters of the cache"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
 
 class MemoryCache(Cache):
     """In-memory cache"""
 
-    def __init__(self, timeout=60):
+    def __init__(self, timeout=60, size=None, max_bytes=None):
+        """Initialize the cache
+            timeout: number of seconds to keep a cached entry
+            size: maximum number of entries to keep; the least recently
+                used entry is evicted when exceeded [optional]
+            max_bytes: maximum (pickled) size of all of the entries kept;
+                the least recently used entries are evicted when exceeded
+                [optional]
+        """
         Cache.__init__(self, timeout)
-        self._entries = {}
+        self.size = size
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()
         self.lock = threading.Lock()
 
     def __getstate__(self):
         # pickle
-        return {'entries': self._entries, 'timeout': self.timeout}
+        return {'entries': self._entries, 'timeout': self.timeout,
+                'size': self.size, 'max_bytes': self.max_bytes}
 
     def __setstate__(self, state):
         # unpickle
         self.lock = threading.Lock()
-        self._entries = state['entries']
+        self._entries = OrderedDict(state['entries'])
         self.timeout = state['timeout']
+        self.size = state.get('size')
+        self.max_bytes = state.get('max_bytes')
+        self.bytes = sum(entry[2] for entry in self._entries.values())
 
     def _is_expired(self, entry, timeout):
         return timeout > 0 and (time.time() - entry[0]) >= timeout
 
+    def _sizeof(self, value):
+        if self.max_bytes is None:
+            # we only account for our size if we have a budget to keep
+            return 0
+        try:
+            return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            # unpicklable objects are accounted for by their shallow size
+            return sys.getsizeof(value)
+
+    def _delete(self, key):
+        self.bytes -= self._entries.pop(key)[2]
+
     def store(self, key, value):
+        nbytes = self._sizeof(value)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # this entry could never fit in our cache
+            return
+
         self.lock.acquire()
-        self._entries[key] = (time.time(), value)
-        self.lock.release()
+        try:
+            # (re)inserting our key marks it as the most recently used
+            if key in self._entries:
+                self._delete(key)
+            self._entries[key] = (time.time(), value, nbytes)
+            self.bytes += nbytes
+
+            # evict our least recently used entries until we're within
+            # our budget again
+            while (self.size is not None and
+                    len(self._entries) > self.size) or \
+                    (self.max_bytes is not None and
+                        self.bytes > self.max_bytes):
+                self._delete(next(iter(self._entries)))
+                self.evictions += 1
+        finally:
+            self.lock.release()
 
     def get(self, key, timeout=None):
         self.lock.acquire()
@@ -94,6 +156,7 @@ class MemoryCache(Cache):
             entry = self._entries.get(key)
             if not entry:
                 # no hit, return nothing
+                self.misses += 1
                 return None
 
             # use provided timeout in arguments if provided
@@ -104,10 +167,16 @@ class MemoryCache(Cache):
             # make sure entry is not expired
             if self._is_expired(entry, timeout):
                 # entry expired, delete and return nothing
-                del self._entries[key]
+                self._delete(key)
+                self.evictions += 1
+                self.misses += 1
                 return None
 
+            # mark our entry as the most recently used
+            self._entries[key] = self._entries.pop(key)
+
             # entry found and not expired, return it
+            self.hits += 1
             return entry[1]
         finally:
             self.lock.release()
@@ -118,25 +187,39 @@ class MemoryCache(Cache):
     def cleanup(self):
         self.lock.acquire()
         try:
-            for k, v in dict(self._entries).items():
+            for k, v in list(self._entries.items()):
                 if self._is_expired(v, self.timeout):
-                    del self._entries[k]
+                    self._delete(k)
+                    self.evictions += 1
         finally:
             self.lock.release()
 
     def flush(self):
         self.lock.acquire()
         self._entries.clear()
+        self.bytes = 0
         self.lock.release()
 
 
 class FileCache(Cache):
-    """File-based cache"""
+    """File-based cache
+
+    All of the entries are kept in a single indexed SQLite database stored
+    within the cache directory.
+    """
+
+    # the name of the database kept within our cache directory
+    filename = 'tweepy-cache.db'
 
     # locks used to make cache thread-safe
     cache_locks = {}
 
     def __init__(self, cache_dir, timeout=60):
+        if sqlite3 is None:
+            raise ImportError(
+                'FileCache requires the sqlite3 module, which this build '
+                'of Python does not provide')
+
         Cache.__init__(self, timeout)
         if os.path.exists(cache_dir) is False:
             os.mkdir(cache_dir)
@@ -147,125 +230,94 @@ class FileCache(Cache):
             self.lock = threading.Lock()
             FileCache.cache_locks[cache_dir] = self.lock
 
-        if os.name == 'posix':
-            self._lock_file = self._lock_file_posix
-            self._unlock_file = self._unlock_file_posix
-        elif os.name == 'nt':
-            self._lock_file = self._lock_file_win32
-            self._unlock_file = self._unlock_file_win32
-        else:
-            log.warning('FileCache locking not supported on this system!')
-            self._lock_file = self._lock_file_dummy
-            self._unlock_file = self._unlock_file_dummy
-
-    def _get_path(self, key):
-        md5 = hashlib.md5()
-        md5.update(key.encode('utf-8'))
-        return os.path.join(self.cache_dir, md5.hexdigest())
-
-    def _lock_file_dummy(self, path, exclusive=True):
-        return None
-
-    def _unlock_file_dummy(self, lock):
-        return
-
-    def _lock_file_posix(self, path, exclusive=True):
-        lock_path = path + '.lock'
-        if exclusive is True:
-            f_lock = open(lock_path, 'w')
-            fcntl.lockf(f_lock, fcntl.LOCK_EX)
-        else:
-            f_lock = open(lock_path, 'r')
-            fcntl.lockf(f_lock, fcntl.LOCK_SH)
-        if os.path.exists(lock_path) is False:
-            f_lock.close()
-            return None
-        return f_lock
-
-    def _unlock_file_posix(self, lock):
-        lock.close()
-
-    def _lock_file_win32(self, path, exclusive=True):
-        # TODO: implement
-        return None
-
-    def _unlock_file_win32(self, lock):
-        # TODO: implement
-        return
-
-    def _delete_file(self, path):
-        os.remove(path)
-        if os.path.exists(path + '.lock'):
-            os.remove(path + '.lock')
+        self.lock.acquire()
+        try:
+            self._db = sqlite3.connect(
+                os.path.join(cache_dir, self.filename),
+                check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, created REAL, value BLOB)')
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS cache_created '
+                'ON cache (created)')
+            self._db.commit()
+        finally:
+            self.lock.release()
 
     def store(self, key, value):
-        path = self._get_path(key)
+        blob = sqlite3.Binary(
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
         self.lock.acquire()
         try:
-            # acquire lock and open file
-            f_lock = self._lock_file(path)
-            datafile = open(path, 'wb')
-
-            # write data
-            pickle.dump((time.time(), value), datafile)
-
-            # close and unlock file
-            datafile.close()
-            self._unlock_file(f_lock)
+            self._db.execute(
+                'INSERT OR REPLACE INTO cache (key, created, value) '
+                'VALUES (?, ?, ?)', (key, time.time(), blob))
+            self._db.commit()
         finally:
             self.lock.release()
 
     def get(self, key, timeout=None):
-        return self._get(self._get_path(key), timeout)
+        # check if value is expired
+        if timeout is None:
+            timeout = self.timeout
 
-    def _get(self, path, timeout):
-        if os.path.exists(path) is False:
-            # no record
-            return None
         self.lock.acquire()
         try:
-            # acquire lock and open
-            f_lock = self._lock_file(path, False)
-            datafile = open(path, 'rb')
+            row = self._db.execute(
+                'SELECT created, value FROM cache WHERE key = ?',
+                (key, )).fetchone()
+            if row is None:
+                # no record
+                self.misses += 1
+                return None
 
-            # read pickled object
-            created_time, value = pickle.load(datafile)
-            datafile.close()
+            created_time, value = row
+            if timeout > 0 and (time.time() - created_time) >= timeout:
+                # expired! delete from cache
+                self._db.execute('DELETE FROM cache WHERE key = ?', (key, ))
+                self._db.commit()
+                self.evictions += 1
+                self.misses += 1
+                return None
 
-            # check if value is expired
-            if timeout is None:
-                timeout = self.timeout
-            if timeout > 0:
-                if (time.time() - created_time) >= timeout:
-                    # expired! delete from cache
-                    value = None
-                    self._delete_file(path)
-
-            # unlock and return result
-            self._unlock_file(f_lock)
-            return value
+            self.hits += 1
         finally:
             self.lock.release()
 
+        return pickle.loads(bytes(value))
+
     def count(self):
-        c = 0
-        for entry in os.listdir(self.cache_dir):
-            if entry.endswith('.lock'):
-                continue
-            c += 1
-        return c
+        self.lock.acquire()
+        try:
+            return self._db.execute(
+                'SELECT COUNT(*) FROM cache').fetchone()[0]
+        finally:
+            self.lock.release()
 
     def cleanup(self):
-        for entry in os.listdir(self.cache_dir):
-            if entry.endswith('.lock'):
-                continue
-            self._get(os.path.join(self.cache_dir, entry), None)
+        if self.timeout <= 0:
+            # our entries never expire
+            return
+
+        self.lock.acquire()
+        try:
+            # remove all of our expired entries in a single batch
+            cursor = self._db.execute(
+                'DELETE FROM cache WHERE created <= ?',
+                (time.time() - self.timeout, ))
+            self._db.commit()
+            self.evictions += max(0, cursor.rowcount)
+        finally:
+            self.lock.release()
 
     def flush(self):
-        for entry in os.listdir(self.cache_dir):
-            if entry.endswith('.lock'):
-                continue
-            self._delete_file(os.path.join(self.cache_dir, entry))
+        self.lock.acquire()
+        try:
+            self._db.execute('DELETE FROM cache')
+            self._db.commit()
+        finally:
+            self.lock.release()
 
 
 class MemCacheCache(Cache):
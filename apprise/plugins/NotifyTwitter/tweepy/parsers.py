@@ -53,7 +53,7 @@ class JSONParser(Parser):
         except Exception as e:
             raise TweepError('Failed to parse JSON payload: %s' % e)
 
-        needs_cursors = 'cursor' in method.session.params
+        needs_cursors = 'cursor' in method.params
         if needs_cursors and isinstance(json, dict) \
                 and 'previous_cursor' in json \
                 and 'next_cursor' in json:
@@ -25,12 +25,33 @@
 
 import re
 import requests
+import threading
 from json import dumps
 
+try:
+    # Python 2.7
+    from Queue import Queue
+    from Queue import Empty
+
+except ImportError:
+    # Python 3.x
+    from queue import Queue
+    from queue import Empty
+
 from .NotifyBase import NotifyBase
 from .NotifyBase import HTTP_ERROR_MAP
 from ..common import NotifyType
 from ..common import NotifyImageSize
+from ..utils import parse_url
+from ..utils import compat_is_basestring
+
+# The entries of our hosts= argument; parse_list() isn't used as it would
+# split the brackets off of an IPv6 address
+HOSTS_ENTRY_RE = re.compile(r'\[[^\]]*\](?::[^\s,;\[\]]*)?|[^\s,;\[\]]+')
+
+# An IPv6 address (which parse_url() doesn't support) and its optional port
+IPV6_HOST_RE = re.compile(
+    r'^\[(?P<host>[0-9a-f:.]+)\](?::(?P<port>[0-9]+))?$', re.IGNORECASE)
 
 
 class NotifyXBMC(NotifyBase):
@@ -65,7 +86,14 @@ class NotifyXBMC(NotifyBase):
     # KODI default protocol version (v6)
     kodi_remote_protocol = 6
 
-    def __init__(self, **kwargs):
+    # The maximum number of hosts we notify concurrently
+    max_workers = 8
+
+    # We can deliver several notifications as a single JSON-RPC batch; see
+    # notify_batch()
+    batch_support = True
+
+    def __init__(self, hosts=None, **kwargs):
         """
         Initialize XBMC/KODI Object
         """
@@ -89,11 +117,78 @@ class NotifyXBMC(NotifyBase):
         # Default protocol
         self.protocol = kwargs.get('protocol', self.xbmc_remote_protocol)
 
+        # The hosts we broadcast our notifications to; the first one is always
+        # the host identified in our URL.  Additional hosts share our
+        # credentials and (unless otherwise specified) our port.
+        self.hosts = [(self.host, self.port)]
+        if compat_is_basestring(hosts):
+            hosts = [hosts]
+
+        for entry in [entry for content in (hosts or [])
+                      for entry in HOSTS_ENTRY_RE.findall(content)]:
+            host = self._parse_host(entry)
+            if host is None:
+                self.logger.warning(
+                    'The host specified (%s) is invalid.' % entry)
+                raise TypeError(
+                    'The host specified (%s) is invalid.' % entry)
+
+            if host not in self.hosts:
+                self.hosts.append(host)
+
+        # Our connections to our hosts are pooled (and kept alive) between
+        # notifications; each host has a session of its own (see _session())
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+
+    def _parse_host(self, entry):
+        """
+        Returns the (host, port) of an entry of our hosts= argument or None
+        if it isn't valid; hosts without a port share ours.
+
+        """
+        match = IPV6_HOST_RE.match(entry)
+        if match:
+            # We keep our brackets; they're needed when we build our URLs
+            host = '[%s]' % match.group('host')
+            port = int(match.group('port')) if match.group('port') else None
+
+        elif entry.startswith('['):
+            # Only IPv6 addresses are bracketed
+            return None
+
+        else:
+            results = parse_url('%s://%s' % (self.schema, entry))
+            if not results or results['user'] or results['fullpath']:
+                return None
+
+            host, port = results['host'], results['port']
+
+        return (host, port or self.port)
+
+    def _session(self, host):
+        """
+        Returns the session our connections to the (host, port) specified
+        are pooled in.  Sessions aren't documented as being thread-safe; the
+        threads notifying our hosts each work with a different host (and
+        Apprise never notifies one of its servers from two threads at once)
+        so no session is ever shared between threads.
+
+        """
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                self._sessions[host] = session
+
+            return session
+
     def _payload_60(self, title, body, notify_type, **kwargs):
         """
         Builds payload for KODI API v6.0
 
-        Returns (headers, payload)
+        Returns (headers, payload) where the payload is a JSON-RPC request
+        object
         """
 
         # prepare JSON Object
@@ -121,13 +216,14 @@ class NotifyXBMC(NotifyBase):
             else:
                 payload['type'] = 'info'
 
-        return (self.headers, dumps(payload))
+        return (self.headers, payload)
 
     def _payload_20(self, title, body, notify_type, **kwargs):
         """
         Builds payload for XBMC API v2.0
 
-        Returns (headers, payload)
+        Returns (headers, payload) where the payload is a JSON-RPC request
+        object
         """
 
         # prepare JSON Object
@@ -147,13 +243,48 @@ class NotifyXBMC(NotifyBase):
         if image_url:
             payload['params']['image'] = image_url
 
-        return (self.headers, dumps(payload))
+        return (self.headers, payload)
 
     def notify(self, title, body, notify_type, **kwargs):
         """
         Perform XBMC/KODI Notification
         """
 
+        (headers, payload) = self._payload(title, body, notify_type, **kwargs)
+
+        return self._broadcast(headers, dumps(payload))
+
+    def notify_batch(self, notifications, **kwargs):
+        """
+        Perform XBMC/KODI Notification of several messages at once.
+
+        notifications is a list of (title, body, notify_type) tuples. All of
+        the messages are delivered to each host as a single JSON-RPC 2.0
+        batch request.
+
+        """
+        if not notifications:
+            return True
+
+        batch = []
+        for request_id, (title, body, notify_type) in \
+                enumerate(notifications, start=1):
+            (headers, payload) = self._payload(
+                title, body, notify_type, **kwargs)
+
+            # Each request within our batch must be uniquely identified
+            payload['id'] = request_id
+            batch.append(payload)
+
+        return self._broadcast(headers, dumps(batch))
+
+    def _payload(self, title, body, notify_type, **kwargs):
+        """
+        Builds the payload for the protocol version we're using
+
+        Returns (headers, payload)
+        """
+
         # Limit results to just the first 2 line otherwise
         # there is just to much content to display
         body = re.split('[\r\n]+', body)
@@ -162,62 +293,107 @@ class NotifyXBMC(NotifyBase):
 
         if self.protocol == self.xbmc_remote_protocol:
             # XBMC v2.0
-            (headers, payload) = self._payload_20(
-                title, body, notify_type, **kwargs)
+            return self._payload_20(title, body, notify_type, **kwargs)
 
-        else:
-            # KODI v6.0
-            (headers, payload) = self._payload_60(
-                title, body, notify_type, **kwargs)
+        # KODI v6.0
+        return self._payload_60(title, body, notify_type, **kwargs)
+
+    def _broadcast(self, headers, payload):
+        """
+        Posts our (already serialized) payload to all of our hosts.  Hosts
+        are notified concurrently if there is more than one of them.
+
+        """
+        if len(self.hosts) == 1:
+            return self._send(self.hosts[0], headers, payload)
 
+        # Track the hosts we've yet to notify and our results
+        queue = Queue()
+        for host in self.hosts:
+            queue.put(host)
+
+        results = []
+
+        def worker():
+            while True:
+                try:
+                    host = queue.get_nowait()
+
+                except Empty:
+                    # We're done
+                    return
+
+                # list.append() is thread-safe
+                results.append(self._send(host, headers, payload))
+
+        threads = [threading.Thread(target=worker) for _ in range(
+            min(self.max_workers, len(self.hosts)))]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return all(results) and len(results) == len(self.hosts)
+
+    def _send(self, host, headers, payload):
+        """
+        Posts our payload to the specified (host, port)
+
+        """
         auth = None
         if self.user:
             auth = (self.user, self.password)
 
-        url = '%s://%s' % (self.schema, self.host)
-        if self.port:
-            url += ':%d' % self.port
+        url = '%s://%s' % (self.schema, host[0])
+        if host[1]:
+            url += ':%d' % host[1]
 
         url += '/jsonrpc'
 
-        self.logger.debug('XBMC/KODI POST URL: %s (cert_verify=%r)' % (
-            url, self.verify_certificate,
-        ))
-        self.logger.debug('XBMC/KODI Payload: %s' % str(payload))
+        self.logger.debug(
+            'XBMC/KODI POST URL: %s (cert_verify=%r)',
+            url, self.verify_certificate)
+        self.logger.debug('XBMC/KODI Payload: %s', self.loggable(payload))
         try:
-            r = requests.post(
+            r = self._session(host).post(
                 url,
                 data=payload,
                 headers=headers,
                 auth=auth,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
                 # We had a problem
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
-                        'Failed to send XBMC/KODI notification:'
+                        'Failed to send XBMC/KODI notification to %s:'
                         '%s (error=%s).' % (
+                            host[0],
                             HTTP_ERROR_MAP[r.status_code],
                             r.status_code))
 
                 except KeyError:
                     self.logger.warning(
-                        'Failed to send XBMC/KODI notification '
-                        '(error=%s).' % r.status_code)
+                        'Failed to send XBMC/KODI notification to %s '
+                        '(error=%s).' % (host[0], r.status_code))
 
                 # Return; we're done
                 return False
 
             else:
-                self.logger.info('Sent XBMC/KODI notification.')
+                self.logger.info('Sent XBMC/KODI notification to %s.', host[0])
 
         except requests.RequestException as e:
             self.logger.warning(
                 'A Connection error occured sending XBMC/KODI '
-                'notification.'
+                'notification to %s.' % host[0]
             )
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
@@ -250,4 +426,8 @@ class NotifyXBMC(NotifyBase):
             # KODI Support
             results['protocol'] = NotifyXBMC.kodi_remote_protocol
 
+        # Support broadcasting to additional hosts
+        if 'hosts' in results['qsd'] and len(results['qsd']['hosts']):
+            results['hosts'] = NotifyBase.unquote(results['qsd']['hosts'])
+
         return results
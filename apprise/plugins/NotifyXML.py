@@ -31,6 +31,12 @@ from .NotifyBase import HTTP_ERROR_MAP
 from ..common import NotifyImageSize
 from ..utils import compat_is_basestring
 
+# The slots within our payload our content is placed into
+XML_PAYLOAD_SLOTS_RE = re.compile(
+    r'(\{(?:SUBJECT|MESSAGE_TYPE|MESSAGE)\})',
+    re.IGNORECASE,
+)
+
 
 class NotifyXML(NotifyBase):
     """
@@ -52,13 +58,9 @@ class NotifyXML(NotifyBase):
     # Allows the user to specify the NotifyImageSize object
     image_size = NotifyImageSize.XY_128
 
-    def __init__(self, **kwargs):
-        """
-        Initialize XML Object
-        """
-        super(NotifyXML, self).__init__(**kwargs)
-
-        self.payload = """<?xml version='1.0' encoding='utf-8'?>
+    # The payload we post; the {SUBJECT}, {MESSAGE_TYPE} and {MESSAGE}
+    # slots within it are filled in with our content
+    payload = """<?xml version='1.0' encoding='utf-8'?>
 <soapenv:Envelope
     xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
     xmlns:xsd="http://www.w3.org/2001/XMLSchema"
@@ -73,6 +75,16 @@ class NotifyXML(NotifyBase):
     </soapenv:Body>
 </soapenv:Envelope>"""
 
+    # Our compiled payloads; these are shared by every instance rather then
+    # being compiled by each of them (see _compile())
+    _compiled = {}
+
+    def __init__(self, **kwargs):
+        """
+        Initialize XML Object
+        """
+        super(NotifyXML, self).__init__(**kwargs)
+
         if self.secure:
             self.schema = 'https'
 
@@ -85,6 +97,26 @@ class NotifyXML(NotifyBase):
 
         return
 
+    @classmethod
+    def _compile(cls, payload):
+        """
+        Compiles the payload provided into the static segments surrounding
+        the slots our content is placed into.  Every odd entry of our
+        segments is a slot, so rendering our payload is just a matter of
+        filling these in and joining our segments back together.
+
+        """
+        try:
+            return cls._compiled[payload]
+
+        except KeyError:
+            segments = tuple(XML_PAYLOAD_SLOTS_RE.split(payload))
+            slots = tuple(
+                (index, segments[index].upper())
+                for index in range(1, len(segments), 2))
+
+            return cls._compiled.setdefault(payload, (segments, slots))
+
     def notify(self, title, body, notify_type, **kwargs):
         """
         Perform XML Notification
@@ -105,12 +137,6 @@ class NotifyXML(NotifyBase):
             '{MESSAGE}': NotifyBase.quote(body),
         }
 
-        # Iterate over above list and store content accordingly
-        re_table = re.compile(
-            r'(' + '|'.join(re_map.keys()) + r')',
-            re.IGNORECASE,
-        )
-
         auth = None
         if self.user:
             auth = (self.user, self.password)
@@ -120,21 +146,29 @@ class NotifyXML(NotifyBase):
             url += ':%d' % self.port
 
         url += self.fullpath
-        payload = re_table.sub(lambda x: re_map[x.group()], self.payload)
 
-        self.logger.debug('XML POST URL: %s (cert_verify=%r)' % (
-            url, self.verify_certificate,
-        ))
-        self.logger.debug('XML Payload: %s' % str(payload))
+        # Render our payload
+        segments, slots = self._compile(self.payload)
+        segments = list(segments)
+        for index, slot in slots:
+            segments[index] = re_map[slot]
+        payload = ''.join(segments)
+
+        self.logger.debug(
+            'XML POST URL: %s (cert_verify=%r)', url, self.verify_certificate)
+        self.logger.debug('XML Payload: %s', self.loggable(payload))
         try:
             r = requests.post(
                 url,
-                data=payload,
+                data=self.compress_body(payload, headers),
                 headers=headers,
                 auth=auth,
                 verify=self.verify_certificate,
+                timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
+                self.circuit_response(r.status_code)
+
                 try:
                     self.logger.warning(
                         'Failed to send XML notification: '
@@ -157,7 +191,7 @@ class NotifyXML(NotifyBase):
             self.logger.warning(
                 'A Connection error occured sending XML '
                 'notification to %s.' % self.host)
-            self.logger.debug('Socket Exception: %s' % str(e))
+            self.logger.debug('Socket Exception: %s', e)
 
             # Return; we're done
             return False
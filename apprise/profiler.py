@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import atexit
+import cProfile
+import pstats
+import sys
+import threading
+from contextlib import contextmanager
+from os import environ
+
+from .metrics import schema_of
+
+# The environment variable that turns on profiling; set it to 1 to have our
+# report written to stderr (when we exit) or to a file to have our (pstats)
+# profile saved to it.
+PROFILE_ENVIRONMENT = 'APPRISE_PROFILE'
+
+# The profiler our environment variable turned on (see from_environment())
+_ENVIRONMENT_PROFILER = None
+
+
+class _Snapshot(object):
+    """
+    Hands the statistics of a profile (that may still be running in another
+    thread) over to pstats without stopping it.
+    """
+
+    def __init__(self, profile):
+        profile.snapshot_stats()
+        self.stats = profile.stats
+
+    def create_stats(self):
+        pass
+
+
+class AppriseProfiler(object):
+    """
+    Profiles (using cProfile) the Apprise objects it's attached to; the time
+    spent is accounted for under the following labels:
+
+        add        Parsing and loading our server URLs.
+        notify     Everything notify() does other then sending; such as
+                   tag matching and converting our body.
+        <schema>   Sending to the servers of each schema (eg. json).
+
+        profiler = AppriseProfiler()
+        profiler.attach(a)
+
+        a.notify(title='title', body='body')
+        profiler.report()
+
+    """
+
+    def __init__(self):
+        # Our profiles are gathered from several threads
+        self._lock = threading.Lock()
+
+        # Our profiles; keyed by their label.  Each thread gets its own
+        # (cProfile only ever profiles the thread it was enabled from).
+        self._profiles = dict()
+
+        # The number of times each label was profiled
+        self._calls = dict()
+
+        # The profiles of our current thread; keyed by their label along with
+        # the (label, profile) pairs we're currently in (the last of which is
+        # running)
+        self._local = threading.local()
+
+    def attach(self, apprise):
+        """
+        Starts profiling the Apprise object provided
+
+        """
+        if apprise.profiler is not self:
+            apprise.profiler = self
+            apprise.pre_send_hooks.append(self.pre_send)
+            apprise.send_hooks.append(self.post_send)
+
+    def detach(self, apprise):
+        """
+        Stops profiling the Apprise object provided
+
+        """
+        if apprise.profiler is self:
+            apprise.profiler = None
+            apprise.pre_send_hooks.remove(self.pre_send)
+            apprise.send_hooks.remove(self.post_send)
+
+    def start(self, label):
+        """
+        Starts accounting for our time under the label provided (until
+        stop() is called)
+
+        """
+        local = self._local
+        if not hasattr(local, 'stack'):
+            local.stack = []
+            local.profiles = dict()
+
+        profile = local.profiles.get(label)
+        if profile is None:
+            profile = cProfile.Profile()
+            local.profiles[label] = profile
+            with self._lock:
+                self._profiles.setdefault(label, []).append(profile)
+
+        with self._lock:
+            self._calls[label] = self._calls.get(label, 0) + 1
+
+        if local.stack:
+            # Only one profile may run at a time
+            local.stack[-1][1].disable()
+
+        local.stack.append((label, profile))
+        profile.enable()
+
+    def stop(self, label=None):
+        """
+        Stops accounting for our time under the label provided (or the label
+        last started if one isn't) and resumes whatever was running before
+        it; nothing is stopped if that label isn't the one running (it was
+        never started)
+
+        """
+        stack = getattr(self._local, 'stack', None)
+        if not stack or (label is not None and stack[-1][0] != label):
+            return
+
+        stack.pop()[1].disable()
+        if stack:
+            stack[-1][1].enable()
+
+    @contextmanager
+    def profile(self, label):
+        """
+        Accounts for the time spent within our context under the label
+        provided
+
+        """
+        self.start(label)
+        try:
+            yield
+
+        finally:
+            self.stop(label)
+
+    def pre_send(self, server, title, body, notify_type):
+        self.start(schema_of(server))
+
+    def post_send(self, server, status, elapsed):
+        # Our pre_send() isn't run if a hook before it failed
+        self.stop(schema_of(server))
+
+    def labels(self):
+        """
+        Returns the labels we've profiled; the most time consuming first
+
+        """
+        with self._lock:
+            labels = list(self._profiles.keys())
+
+        return sorted(
+            labels, key=lambda label: self.stats(label).total_tt,
+            reverse=True)
+
+    def stats(self, label=None):
+        """
+        Returns the (pstats) statistics of the label provided or of all of
+        them if no label is specified; None is returned if there aren't any
+
+        """
+        with self._lock:
+            profiles = [
+                profile for key, entries in self._profiles.items()
+                for profile in entries if label is None or key == label]
+
+        if not profiles:
+            return None
+
+        stats = pstats.Stats(_Snapshot(profiles[0]))
+        for profile in profiles[1:]:
+            stats.add(_Snapshot(profile))
+
+        return stats
+
+    def report(self, stream=None, sort='cumulative', limit=15):
+        """
+        Writes a report of where our time went (per label) to the stream
+        provided (stderr by default); the functions of each are sorted as
+        specified (see pstats) and only the first limit of them are listed
+
+        """
+        stream = stream or sys.stderr
+        for label in self.labels():
+            stats = self.stats(label)
+            stream.write('%s: %d call(s) in %.6f seconds\n' % (
+                label, self._calls.get(label, 0), stats.total_tt))
+
+            stats.stream = stream
+            stats.sort_stats(sort).print_stats(limit)
+
+    def dump(self, path, label=None):
+        """
+        Saves our profile (or just that of the label specified) to the path
+        provided so it can be loaded with pstats (or any tool that reads
+        them); if the path contains {label}, then a file is written for
+        each of our labels instead.
+
+        """
+        if '{label}' in path:
+            for label in self.labels():
+                self.dump(path.format(label=label), label=label)
+            return
+
+        stats = self.stats(label)
+        if stats is not None:
+            stats.dump_stats(path)
+
+    @staticmethod
+    def from_environment():
+        """
+        Returns the profiler our environment variable turned on (creating
+        it the first time we're called) or None if it's not set
+
+        """
+        global _ENVIRONMENT_PROFILER
+
+        target = environ.get(PROFILE_ENVIRONMENT, '').strip()
+        if not target:
+            return None
+
+        if _ENVIRONMENT_PROFILER is None:
+            _ENVIRONMENT_PROFILER = AppriseProfiler()
+
+            if target.lower() in ('1', 'y', 'yes', 'true', 'on'):
+                atexit.register(_ENVIRONMENT_PROFILER.report)
+
+            else:
+                atexit.register(_ENVIRONMENT_PROFILER.dump, target)
+
+        return _ENVIRONMENT_PROFILER
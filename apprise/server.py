@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import click
+import logging
+import sys
+import threading
+from json import dumps
+from json import loads
+from time import time
+
+try:
+    # Python 2.7
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from BaseHTTPServer import HTTPServer
+    from SocketServer import ThreadingMixIn
+    from Queue import Queue
+
+except ImportError:
+    # Python 3.x
+    from http.server import BaseHTTPRequestHandler
+    from http.server import HTTPServer
+    from socketserver import ThreadingMixIn
+    from queue import Queue
+
+from . import NotifyType
+from . import Apprise
+from . import AppriseAsset
+from . import AppriseMetrics
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Defines our click context settings adding -h to the additional options that
+# can be specified to get the help menu to come up
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+
+class AppriseStatistics(object):
+    """
+    Tracks the latency and throughput of the notifications we send; it is
+    registered as one of our Apprise objects send_hooks.
+
+    """
+
+    def __init__(self):
+        # The time we started tracking
+        self.started = time()
+
+        # Our statistics are updated from several threads
+        self._lock = threading.Lock()
+
+        # Our per-plugin statistics; our keys are the service name and our
+        # values are a list of the number sent, the number that failed and
+        # the total, minimum and maximum seconds they took.
+        self._plugins = dict()
+
+    def __call__(self, server, status, elapsed):
+        """
+        Records the outcome of a notification
+
+        """
+        with self._lock:
+            entry = self._plugins.get(server.service_name)
+            if entry is None:
+                entry = [0, 0, 0.0, elapsed, elapsed]
+                self._plugins[server.service_name] = entry
+
+            entry[0] += 1
+            if not status:
+                entry[1] += 1
+
+            entry[2] += elapsed
+            entry[3] = min(entry[3], elapsed)
+            entry[4] = max(entry[4], elapsed)
+
+    def details(self):
+        """
+        Returns our statistics as a dictionary
+
+        """
+        uptime = max(time() - self.started, 1e-6)
+
+        plugins = {}
+        with self._lock:
+            for name, (sent, failed, total, low, high) in \
+                    self._plugins.items():
+                plugins[name] = {
+                    'sent': sent,
+                    'failed': failed,
+                    # Notifications per second
+                    'throughput': sent / uptime,
+                    'latency': {
+                        'avg': total / sent,
+                        'min': low,
+                        'max': high,
+                    },
+                }
+
+        return {
+            'uptime': uptime,
+            'plugins': plugins,
+        }
+
+
+class _Job(object):
+    """
+    A notification waiting on (or being sent by) one of our workers
+
+    """
+
+    def __init__(self, record):
+        self.record = record
+        self.status = None
+        self.done = threading.Event()
+
+
+class AppriseRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests made to our AppriseHTTPServer
+
+    """
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/stats':
+            return self._respond(200, self.server.stats())
+
+        if self.path.rstrip('/') == '/metrics':
+            return self._respond(
+                200, self.server.metrics.prometheus(),
+                content_type='text/plain; version=0.0.4')
+
+        return self._respond(404, {'error': 'Not Found'})
+
+    def do_POST(self):
+        path = self.path.rstrip('/')
+        if path not in ('/notify', '/notify/batch'):
+            return self._respond(404, {'error': 'Not Found'})
+
+        try:
+            length = int(self.headers.get('Content-Length'))
+
+        except (TypeError, ValueError):
+            return self._respond(411, {'error': 'Length Required'})
+
+        if length > self.server.max_body:
+            return self._respond(413, {'error': 'Request Entity Too Large'})
+
+        try:
+            records = loads(self.rfile.read(length).decode('utf-8'))
+
+        except ValueError as e:
+            return self._respond(400, {'error': 'Invalid JSON: %s' % str(e)})
+
+        if path == '/notify':
+            records = [records]
+
+        if not isinstance(records, list) or not records or \
+                not all(isinstance(r, dict) for r in records):
+            return self._respond(
+                400, {'error': 'Expected a JSON object (or a list of them)'})
+
+        jobs = self.server.submit(records)
+        if jobs is None:
+            # Our queue is full
+            return self._respond(429, {'error': 'Too Many Requests'})
+
+        for job in jobs:
+            job.done.wait()
+
+        status = all(job.status for job in jobs)
+        if path == '/notify':
+            response = {'status': status}
+
+        else:
+            response = {
+                'status': status,
+                'results': [{'status': job.status} for job in jobs],
+            }
+
+        return self._respond(200 if status else 502, response)
+
+    def _respond(self, code, content, content_type='application/json'):
+        if content_type == 'application/json':
+            content = dumps(content)
+
+        content = content.encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        logger.debug('%s - ' + format, self.address_string(), *args)
+
+
+class AppriseHTTPServer(ThreadingMixIn, HTTPServer):
+    """
+    An HTTP server sending the notifications posted to it using a shared
+    (pre-loaded) Apprise object:
+
+        POST /notify        a JSON object with an optional title, body,
+                            type and tag.
+        POST /notify/batch  a JSON list of the above.
+        GET  /stats         the per-plugin latency and throughput
+        GET  /metrics       our metrics (in the Prometheus text format)
+
+    Notifications are sent by a fixed number of workers; if more then
+    queue_size notifications are waiting to be sent, new requests are
+    rejected (429) until they catch up.
+
+    """
+    daemon_threads = True
+
+    def __init__(self, address, apprise, workers=4, queue_size=100,
+                 max_body=1048576):
+
+        HTTPServer.__init__(self, address, AppriseRequestHandler)
+
+        self.apprise = apprise
+
+        # The largest request body (in bytes) we accept
+        self.max_body = max_body
+
+        # Our statistics
+        self.statistics = AppriseStatistics()
+        self.apprise.send_hooks.append(self.statistics)
+
+        self.metrics = AppriseMetrics()
+        self.metrics.attach(self.apprise)
+
+        # The number of requests rejected because we were too busy
+        self.rejected = 0
+
+        # The notifications waiting to be sent
+        self.queue_size = queue_size
+        self._queue = Queue()
+        self._lock = threading.Lock()
+
+        self._workers = [
+            threading.Thread(target=self._worker) for _ in range(workers)]
+        for worker in self._workers:
+            worker.daemon = True
+            worker.start()
+
+    def submit(self, records):
+        """
+        Queues the records provided and returns their jobs; if there isn't
+        room for all of them, then None is returned and none are queued.
+
+        """
+        with self._lock:
+            if self._queue.qsize() + len(records) > self.queue_size:
+                self.rejected += 1
+                return None
+
+            jobs = [_Job(record) for record in records]
+            for job in jobs:
+                self._queue.put(job)
+
+        return jobs
+
+    def stats(self):
+        """
+        Returns the statistics reported by /stats
+
+        """
+        stats = self.statistics.details()
+        stats.update({
+            'workers': len(self._workers),
+            'queued': self._queue.qsize(),
+            'rejected': self.rejected,
+        })
+        return stats
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                # We're done
+                return
+
+            record = job.record
+            try:
+                job.status = self.apprise.notify(
+                    title=record.get('title'),
+                    body=record.get('body'),
+                    notify_type=record.get('type', NotifyType.INFO),
+                    tag=record.get('tag'),
+                )
+
+            except Exception:
+                # Don't let one bad record take our worker down with it
+                logger.exception('Notification Exception')
+                job.status = False
+
+            job.done.set()
+
+    def server_close(self):
+        """
+        Stops our workers and closes our server
+
+        """
+        HTTPServer.server_close(self)
+
+        for _ in self._workers:
+            self._queue.put(None)
+
+        for worker in self._workers:
+            worker.join()
+
+        del self._workers[:]
+
+        # Send whatever our digests (if any) are still holding onto
+        self.apprise.flush()
+
+        if self.statistics in self.apprise.send_hooks:
+            self.apprise.send_hooks.remove(self.statistics)
+
+        self.metrics.detach(self.apprise)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('--host', '-H', default='localhost', type=str,
+              help='The address to listen on (default=localhost).')
+@click.option('--port', '-p', default=8000, type=int,
+              help='The port to listen on (default=8000).')
+@click.option('--workers', '-w', default=4, type=click.IntRange(min=1),
+              help='The number of notifications sent concurrently '
+              '(default=4).')
+@click.option('--queue-size', '-q', default=100, type=click.IntRange(min=1),
+              help='The number of notifications that may wait to be sent '
+              'before requests are rejected (default=100).')
+@click.option('--max-body', '-m', default=1048576,
+              type=click.IntRange(min=1),
+              help='The largest request body (in bytes) accepted '
+              '(default=1048576).')
+@click.option('--theme', '-T', default='default', type=str,
+              help='Specify the default theme.')
+@click.option('-v', '--verbose', count=True)
+@click.argument('urls', nargs=-1,
+                metavar='SERVER_URL [SERVER_URL2 [SERVER_URL3]]',)
+def main(urls, host, port, workers, queue_size, max_body, theme, verbose):
+    """
+    Serve HTTP requests to send notifications to all of the specified
+    servers identified by their URLs.
+
+    """
+    # Logging
+    ch = logging.StreamHandler(sys.stderr)
+    logger.setLevel(logging.DEBUG if verbose > 1 else (
+        logging.INFO if verbose == 1 else logging.ERROR))
+    ch.setFormatter(
+        logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logger.addHandler(ch)
+
+    if not urls:
+        logger.error('You must specify at least one server URL.')
+        sys.exit(1)
+
+    # Load our inventory up just once; it's shared by all of our requests
+    a = Apprise(servers=urls, asset=AppriseAsset(theme=theme))
+
+    server = AppriseHTTPServer(
+        (host, port), a, workers=workers, queue_size=queue_size,
+        max_body=max_body)
+
+    logger.info('Listening on http://%s:%d', *server.server_address[:2])
+    try:
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        server.server_close()
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
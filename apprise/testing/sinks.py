@@ -0,0 +1,767 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import logging
+import random
+import re
+import threading
+from collections import deque
+from contextlib import contextmanager
+from json import dumps
+from time import sleep
+from time import time
+from uuid import uuid4
+
+from requests.adapters import HTTPAdapter
+
+try:
+    # Python 2.7
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from BaseHTTPServer import HTTPServer
+    from urlparse import urlparse
+    from urlparse import urlunparse
+    import SocketServer as socketserver
+
+except ImportError:
+    # Python 3.x
+    from http.server import BaseHTTPRequestHandler
+    from http.server import HTTPServer
+    from urllib.parse import urlparse
+    from urllib.parse import urlunparse
+    import socketserver
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# The header our redirect() places the host a request was intended for in
+REDIRECT_HEADER = 'X-Apprise-Host'
+
+
+class SinkOutcome(object):
+    """
+    The outcome a sink decided on for a request it received
+    """
+    OK = 'ok'
+    ERROR = 'error'
+    THROTTLED = 'throttled'
+
+
+SINK_OUTCOMES = (
+    SinkOutcome.OK,
+    SinkOutcome.ERROR,
+    SinkOutcome.THROTTLED,
+)
+
+
+class SinkBehavior(object):
+    """
+    Decides how a sink responds to each request it receives and keeps track
+    of what it received.
+
+    latency     The seconds to wait before responding.
+    jitter      Up to this many (random) seconds are added to our latency.
+    error_rate  The fraction (0.0 - 1.0) of requests that fail.
+    rate_limit  The number of requests per second accepted (with bursts of
+                up to this many) before we start throttling them.
+    retry_after The seconds a throttled client is told to wait.
+    history     The number of (most recent) requests we keep a record of.
+    seed        Seeds our random number generator.
+
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0,
+                 rate_limit=None, retry_after=1, history=100, seed=None):
+
+        if latency < 0 or jitter < 0:
+            raise TypeError('The latency specified must not be negative.')
+
+        if error_rate < 0 or error_rate > 1:
+            raise TypeError(
+                'The error rate specified (%s) must be between 0.0 and 1.0.'
+                % error_rate)
+
+        if rate_limit is not None and rate_limit <= 0:
+            raise TypeError(
+                'The rate limit specified (%s) must be positive.' % rate_limit)
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+
+        # Requests are handled by several threads
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+
+        # Our token bucket (used for rate limiting)
+        self._tokens = float(rate_limit or 0)
+        self._refilled = time()
+
+        # The most recent requests we received
+        self.history = deque(maxlen=history)
+
+        # Our counters; keyed by our outcome
+        self.counters = dict((outcome, 0) for outcome in SINK_OUTCOMES)
+
+    def respond(self, record=None):
+        """
+        Waits out our latency and then returns the outcome of the request;
+        the record provided (if any) is kept in our history.
+
+        """
+        with self._lock:
+            if record is not None:
+                self.history.append(record)
+
+            if self.rate_limit:
+                # Refill our bucket
+                now = time()
+                self._tokens = min(
+                    float(self.rate_limit),
+                    self._tokens + (now - self._refilled) * self.rate_limit)
+                self._refilled = now
+
+            if self.rate_limit and self._tokens < 1.0:
+                outcome = SinkOutcome.THROTTLED
+
+            else:
+                if self.rate_limit:
+                    self._tokens -= 1.0
+
+                outcome = SinkOutcome.ERROR \
+                    if self._random.random() < self.error_rate \
+                    else SinkOutcome.OK
+
+            self.counters[outcome] += 1
+
+            delay = self.latency
+            if self.jitter:
+                delay += self._random.uniform(0, self.jitter)
+
+        if delay:
+            sleep(delay)
+
+        return outcome
+
+    @property
+    def remaining(self):
+        """
+        The number of requests we'll accept before throttling them (as of
+        the last one we received); None if we don't throttle them
+
+        """
+        return int(self._tokens) if self.rate_limit else None
+
+    def stats(self):
+        """
+        Returns the number of requests we received (and their outcomes)
+
+        """
+        with self._lock:
+            stats = dict(self.counters)
+
+        stats['requests'] = sum(stats.values())
+        return stats
+
+    def reset(self):
+        """
+        Forgets everything we received
+
+        """
+        with self._lock:
+            self.history.clear()
+            for outcome in SINK_OUTCOMES:
+                self.counters[outcome] = 0
+
+
+class _Sink(object):
+    """
+    What all of our sinks have in common; they can be started in (and
+    stopped from) a thread of their own and used as a context manager:
+
+        with HTTPSink(error_rate=0.1) as sink:
+            ...
+
+    """
+    daemon_threads = True
+
+    allow_reuse_address = True
+
+    # How often (in seconds) we check whether we've been asked to stop
+    poll_interval = 0.05
+
+    def __init__(self, address, handler, **kwargs):
+        self.behavior = SinkBehavior(**kwargs)
+        self._thread = None
+
+        # Support (Python 2.7) old-style classes
+        socketserver.TCPServer.__init__(self, address, handler)
+
+    @property
+    def host(self):
+        return self.server_address[0]
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        """
+        Starts serving requests in a (daemon) thread of our own
+
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.serve_forever,
+                kwargs={'poll_interval': self.poll_interval})
+            self._thread.daemon = True
+            self._thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        Stops serving requests and releases our socket
+
+        """
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self.server_close()
+
+    def stats(self):
+        return self.behavior.stats()
+
+    @property
+    def history(self):
+        return self.behavior.history
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+#
+# HTTP
+#
+
+def _slack(outcome, behavior, path, body):
+    if outcome == SinkOutcome.THROTTLED:
+        return 429, {'Retry-After': str(behavior.retry_after)}, \
+            'rate_limited'
+
+    if outcome == SinkOutcome.ERROR:
+        return 500, {}, 'rollup_error'
+
+    return 200, {}, 'ok'
+
+
+def _discord(outcome, behavior, path, body):
+    headers = {}
+    if behavior.rate_limit:
+        headers.update({
+            'X-RateLimit-Limit': str(behavior.rate_limit),
+            'X-RateLimit-Remaining': str(behavior.remaining),
+            'X-RateLimit-Reset-After': str(behavior.retry_after),
+        })
+
+    if outcome == SinkOutcome.THROTTLED:
+        headers['Retry-After'] = str(behavior.retry_after)
+        return 429, headers, {
+            'message': 'You are being rate limited.',
+            'retry_after': behavior.retry_after * 1000,
+            'global': False,
+        }
+
+    if outcome == SinkOutcome.ERROR:
+        return 500, headers, {'message': '500: Internal Server Error'}
+
+    return 204, headers, None
+
+
+def _telegram(outcome, behavior, path, body):
+    if outcome == SinkOutcome.THROTTLED:
+        return 429, {'Retry-After': str(behavior.retry_after)}, {
+            'ok': False,
+            'error_code': 429,
+            'description': 'Too Many Requests: retry after %d' %
+            behavior.retry_after,
+            'parameters': {'retry_after': behavior.retry_after},
+        }
+
+    if outcome == SinkOutcome.ERROR:
+        return 500, {}, {
+            'ok': False,
+            'error_code': 500,
+            'description': 'Internal Server Error',
+        }
+
+    if path.endswith('/getUpdates'):
+        # Nobody has started a conversation with our bot
+        return 200, {}, {'ok': True, 'result': []}
+
+    return 200, {}, {
+        'ok': True,
+        'result': {'message_id': 1, 'date': int(time())},
+    }
+
+
+def _pushover(outcome, behavior, path, body):
+    headers = {}
+    if behavior.rate_limit:
+        headers.update({
+            'X-Limit-App-Limit': str(behavior.rate_limit),
+            'X-Limit-App-Remaining': str(behavior.remaining),
+            'X-Limit-App-Reset': str(int(time()) + behavior.retry_after),
+        })
+    request = str(uuid4())
+
+    if outcome == SinkOutcome.THROTTLED:
+        return 429, headers, {
+            'status': 0, 'request': request,
+            'errors': ['application is over its message limit'],
+        }
+
+    if outcome == SinkOutcome.ERROR:
+        return 500, headers, {
+            'status': 0, 'request': request,
+            'errors': ['internal server error'],
+        }
+
+    return 200, headers, {'status': 1, 'request': request}
+
+
+# The response returned by our AWS (SNS) stand-in
+SNS_RESPONSE = \
+    '<{action}Response xmlns="http://sns.amazonaws.com/doc/2010-03-31/">' \
+    '<{action}Result>{result}</{action}Result>' \
+    '<ResponseMetadata><RequestId>{request}</RequestId></ResponseMetadata>' \
+    '</{action}Response>'
+
+SNS_ERROR = \
+    '<ErrorResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">' \
+    '<Error><Type>{type}</Type><Code>{code}</Code>' \
+    '<Message>{message}</Message></Error>' \
+    '<RequestId>{request}</RequestId></ErrorResponse>'
+
+SNS_ACTION_RE = re.compile(r'(^|&)Action=(?P<action>[A-Za-z]+)')
+
+
+def _sns(outcome, behavior, path, body):
+    request = str(uuid4())
+    headers = {'Content-Type': 'text/xml'}
+
+    # AWS reports throttling as a 400 (rather then a 429)
+    if outcome == SinkOutcome.THROTTLED:
+        return 400, headers, SNS_ERROR.format(
+            type='Sender', code='Throttling', message='Rate exceeded',
+            request=request)
+
+    if outcome == SinkOutcome.ERROR:
+        return 500, headers, SNS_ERROR.format(
+            type='Receiver', code='InternalError',
+            message='Internal Error', request=request)
+
+    match = SNS_ACTION_RE.search(body.decode('utf-8', 'replace'))
+    action = match.group('action') if match else 'Publish'
+    if action == 'CreateTopic':
+        result = '<TopicArn>arn:aws:sns:us-east-1:000000000000:apprise' \
+                 '</TopicArn>'
+
+    else:
+        result = '<MessageId>%s</MessageId>' % str(uuid4())
+
+    return 200, headers, SNS_RESPONSE.format(
+        action=action, result=result, request=request)
+
+
+def _generic(outcome, behavior, path, body):
+    if outcome == SinkOutcome.THROTTLED:
+        return 429, {'Retry-After': str(behavior.retry_after)}, \
+            {'error': 'Too Many Requests'}
+
+    if outcome == SinkOutcome.ERROR:
+        return 500, {}, {'error': 'Internal Server Error'}
+
+    return 200, {}, {}
+
+
+# The services our HTTP sink emulates; each entry is the regular expression
+# matching the host(s) the service is reached at, the name we know it by and
+# the function that generates our response.  Anything else is treated as a
+# generic (JSON) web service.
+HTTP_SERVICES = (
+    (re.compile(r'^hooks\.slack\.com$', re.I), 'slack', _slack),
+    (re.compile(r'^(.+\.)?discord(app)?\.com$', re.I), 'discord', _discord),
+    (re.compile(r'^api\.telegram\.org$', re.I), 'telegram', _telegram),
+    (re.compile(r'^api\.pushover\.net$', re.I), 'pushover', _pushover),
+    (re.compile(r'^sns\.[a-z0-9-]+\.amazonaws\.com$', re.I), 'sns', _sns),
+)
+
+
+def http_service(host):
+    """
+    Returns the name of the service (and the function generating the
+    responses of) the host provided.
+
+    """
+    host = host.rsplit(':', 1)[0] if host.count(':') == 1 else host
+    for regex, name, response in HTTP_SERVICES:
+        if regex.match(host):
+            return name, response
+
+    return 'generic', _generic
+
+
+class _HTTPSinkHandler(BaseHTTPRequestHandler):
+    """
+    Responds to the requests made to our HTTPSink
+    """
+
+    # Keep our connections alive (like the services we emulate do)
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self):
+        host = self.headers.get(REDIRECT_HEADER) or \
+            self.headers.get('Host') or ''
+        name, response = http_service(host)
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+
+        except ValueError:
+            length = 0
+
+        body = self.rfile.read(length) if length > 0 else b''
+
+        outcome = self.server.behavior.respond({
+            'service': name,
+            'method': self.command,
+            'host': host,
+            'path': self.path,
+            'body': body,
+        })
+
+        code, headers, content = response(
+            outcome, self.server.behavior, self.path, body)
+
+        if content is None:
+            content = b''
+
+        else:
+            if isinstance(content, (dict, list)):
+                headers.setdefault('Content-Type', 'application/json')
+                content = dumps(content)
+
+            content = content.encode('utf-8')
+
+        self.send_response(code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+    do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        logger.debug('%s - ' + format, self.address_string(), *args)
+
+
+class HTTPSink(_Sink, socketserver.ThreadingMixIn, HTTPServer):
+    """
+    A stand-in for the web services our plugins notify; it responds like
+    Slack, Discord, Telegram, Pushover and Amazon SNS do (based on the host
+    the request was intended for) and like a generic JSON web service to
+    everything else.
+
+    Plugins that take a host (such as json:// and xml://) can be pointed at
+    our sink directly; everything else can be (temporarily) sent to it with
+    redirect().
+
+    """
+
+    def __init__(self, address=('127.0.0.1', 0), **kwargs):
+        _Sink.__init__(self, address, _HTTPSinkHandler, **kwargs)
+
+    @property
+    def url(self):
+        return 'http://%s:%d' % (self.host, self.port)
+
+
+@contextmanager
+def redirect(sink):
+    """
+    Sends every request made (using requests) to the HTTPSink provided for
+    as long as we're in effect; the host each was intended for is passed
+    along in our REDIRECT_HEADER.
+
+        with HTTPSink() as sink, redirect(sink):
+            Apprise.instantiate('slack://T1JJ3T3L2/A1BRTD4JD/TIiajkdnl').notify(
+                title='title', body='body', notify_type='info')
+
+    """
+    send = HTTPAdapter.send
+
+    def _send(adapter, request, **kwargs):
+        url = urlparse(request.url)
+        request.headers[REDIRECT_HEADER] = url.netloc
+        request.url = urlunparse(
+            ('http', '%s:%d' % (sink.host, sink.port)) + tuple(url[2:]))
+        return send(adapter, request, **kwargs)
+
+    HTTPAdapter.send = _send
+    try:
+        yield sink
+
+    finally:
+        HTTPAdapter.send = send
+
+
+#
+# SMTP
+#
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """
+    Speaks just enough SMTP to accept the messages sent by smtplib; every
+    login is accepted and STARTTLS is not supported.
+    """
+
+    def _reply(self, line):
+        self.wfile.write(line.encode('utf-8') + b'\r\n')
+        self.wfile.flush()
+
+    def _readline(self):
+        line = self.rfile.readline()
+        if not line:
+            # Our client went away
+            raise EOFError()
+
+        return line.decode('utf-8', 'replace').rstrip('\r\n')
+
+    def handle(self):
+        try:
+            self._session()
+
+        except EOFError:
+            pass
+
+    def _session(self):
+        sender = None
+        recipients = []
+
+        self._reply('220 %s ESMTP Apprise Sink' % self.server.host)
+        while True:
+            line = self._readline()
+            command, _, argument = line.partition(' ')
+            command = command.upper()
+
+            if command == 'EHLO':
+                self._reply('250-%s' % self.server.host)
+                self._reply('250-AUTH PLAIN LOGIN')
+                self._reply('250 8BITMIME')
+
+            elif command == 'HELO':
+                self._reply('250 %s' % self.server.host)
+
+            elif command == 'AUTH':
+                mechanism, _, response = argument.partition(' ')
+                if mechanism.upper() == 'LOGIN':
+                    if not response:
+                        # Username:
+                        self._reply('334 VXNlcm5hbWU6')
+                        self._readline()
+
+                    # Password:
+                    self._reply('334 UGFzc3dvcmQ6')
+                    self._readline()
+
+                elif not response:
+                    self._reply('334 ')
+                    self._readline()
+
+                self._reply('235 2.7.0 Authentication successful')
+
+            elif command == 'MAIL':
+                sender = argument.partition(':')[2].strip()
+                recipients = []
+                self._reply('250 2.1.0 OK')
+
+            elif command == 'RCPT':
+                recipients.append(argument.partition(':')[2].strip())
+                self._reply('250 2.1.5 OK')
+
+            elif command == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line or line.rstrip(b'\r\n') == b'.':
+                        break
+
+                    # Remove our dot-stuffing
+                    lines.append(line[1:] if line.startswith(b'.') else line)
+
+                outcome = self.server.behavior.respond({
+                    'service': 'smtp',
+                    'from': sender,
+                    'to': recipients,
+                    'body': b''.join(lines),
+                })
+
+                if outcome == SinkOutcome.THROTTLED:
+                    self._reply(
+                        '450 4.7.0 Rate limited; try again in %d seconds'
+                        % self.server.behavior.retry_after)
+
+                elif outcome == SinkOutcome.ERROR:
+                    self._reply('451 4.3.0 Local error in processing')
+
+                else:
+                    self._reply('250 2.0.0 OK queued')
+
+            elif command in ('RSET', 'NOOP'):
+                self._reply('250 2.0.0 OK')
+
+            elif command == 'QUIT':
+                self._reply('221 2.0.0 Bye')
+                return
+
+            else:
+                self._reply('502 5.5.2 Command not recognized')
+
+
+class SMTPSink(_Sink, socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    A stand-in SMTP server; point an (unsecured) mailto:// URL at it with
+    ?smtp=<host> and a port.
+
+    """
+
+    def __init__(self, address=('127.0.0.1', 0), **kwargs):
+        _Sink.__init__(self, address, _SMTPSinkHandler, **kwargs)
+
+
+#
+# GNTP (Growl)
+#
+
+class _GNTPSinkHandler(socketserver.StreamRequestHandler):
+    """
+    Reads the GNTP messages sent to our GNTPSink and responds to them
+    """
+
+    def _block(self):
+        """
+        Reads a block of headers (up to the blank line ending them)
+
+        """
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                raise EOFError()
+
+            line = line.decode('utf-8', 'replace').rstrip('\r\n')
+            if not line:
+                return lines
+
+            lines.append(line)
+
+    @staticmethod
+    def _headers(lines):
+        return dict(
+            (key.strip(), value.strip()) for key, _, value in
+            (line.partition(':') for line in lines))
+
+    def handle(self):
+        try:
+            lines = self._block()
+            info = lines[0].split(' ')
+            headers = self._headers(lines[1:])
+            action = info[1] if len(info) > 1 else 'NOTIFY'
+
+            blocks = [headers]
+            if action == 'REGISTER':
+                # Each of our notification types
+                for _ in range(int(headers.get('Notifications-Count', 0))):
+                    blocks.append(self._headers(self._block()))
+
+            # Our binary resources (such as icons)
+            resources = set(
+                value for block in blocks for value in block.values()
+                if value.startswith('x-growl-resource://'))
+
+            for _ in resources:
+                resource = self._headers(self._block())
+                self.rfile.read(int(resource.get('Length', 0)) + 4)
+
+        except (EOFError, IndexError, ValueError):
+            # Not something we understand
+            return
+
+        if action == 'NOTIFY':
+            outcome = self.server.behavior.respond({
+                'service': 'growl',
+                'title': headers.get('Notification-Title'),
+                'body': headers.get('Notification-Text'),
+                'headers': headers,
+            })
+
+        else:
+            # We always welcome (registering) applications
+            outcome = SinkOutcome.OK
+
+        if outcome == SinkOutcome.OK:
+            response = 'GNTP/1.0 -OK NONE\r\nResponse-Action: %s\r\n' % action
+
+        else:
+            # GNTP has no notion of being throttled
+            response = 'GNTP/1.0 -ERROR NONE\r\nResponse-Action: %s\r\n' \
+                'Error-Code: 500\r\nError-Description: %s\r\n' % (
+                    action, 'Too Many Requests'
+                    if outcome == SinkOutcome.THROTTLED
+                    else 'Internal Server Error')
+
+        self.wfile.write((response + '\r\n').encode('utf-8'))
+
+
+class GNTPSink(_Sink, socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    A stand-in Growl (GNTP) listener; point a growl:// URL at it.
+
+    """
+
+    def __init__(self, address=('127.0.0.1', 0), **kwargs):
+        _Sink.__init__(self, address, _GNTPSinkHandler, **kwargs)
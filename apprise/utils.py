@@ -94,6 +94,22 @@ TIDY_NUX_TRIM_RE = re.compile(
 # Used for attempting to acquire the schema if the URL can't be parsed.
 GET_SCHEMA_RE = re.compile(r'\s*(?P<schema>[a-z0-9]{2,9})://.*$', re.I)
 
+# Tokenizes a URL made up of nothing but printable ASCII characters (less
+# the backslash) in a single pass; this covers all but the most unusual of
+# URLs.  Those it doesn't match are left to parse_url's slower (but more
+# forgiving) chain of regular expressions.
+TOKENIZE_URL_RE = re.compile(
+    r'(?=[\x21-\x5b\x5d-\x7e]+\Z)'
+    r'(?P<schema>[A-Za-z0-9_+.-]+)://+'
+    r'(?:(?P<user>[^:@/?#\[\]]*)(?::(?P<password>[^:@/?#\[\]]*))?@)?'
+    r'(?P<host>[^:@/?#\[\]]+)(?::(?P<port>[^:@/?#\[\]]*))?'
+    r'(?P<fullpath>/[^?#;]*)?(?:#[^?]*)?'
+    r'(?:\?(?P<qsd>[^;]+))?\Z')
+
+# A single label (the content between the dots) of a hostname
+IS_HOSTNAME_LABEL_RE = re.compile(
+    r'(?!-)[A-Z\d_-]{1,63}(?<!-)$', re.IGNORECASE)
+
 
 def is_hostname(hostname):
     """
@@ -105,8 +121,16 @@ def is_hostname(hostname):
     if hostname[-1] == ".":
         hostname = hostname[:-1]
 
-    allowed = re.compile(r'(?!-)[A-Z\d_-]{1,63}(?<!-)$', re.IGNORECASE)
-    return all(allowed.match(x) for x in hostname.split("."))
+    return all(IS_HOSTNAME_LABEL_RE.match(x) for x in hostname.split("."))
+
+
+try:
+    # Python v2.x
+    _BASESTRING = basestring
+
+except NameError:
+    # Python v3.x
+    _BASESTRING = str
 
 
 def compat_is_basestring(content):
@@ -114,13 +138,7 @@ def compat_is_basestring(content):
     Python 3 support for checking if content is unicode and/or
     of a string type
     """
-    try:
-        # Python v2.x
-        return isinstance(content, basestring)
-
-    except NameError:
-        # Python v3.x
-        return isinstance(content, str)
+    return isinstance(content, _BASESTRING)
 
 
 def tidy_path(path):
@@ -170,6 +188,69 @@ def parse_url(url, default_schema='http', verify_host=True):
         # Simple error checking
         return None
 
+    match = TOKENIZE_URL_RE.match(url)
+    if match is None:
+        # Leave anything out of the ordinary to our regular expressions
+        return _parse_url(url, default_schema, verify_host)
+
+    schema, user, password, host, port, fullpath, qsdata = match.groups()
+    result = {
+        'user': user,
+        'password': password,
+        'port': port,
+        'host': host,
+        'fullpath': None,
+        'path': None,
+        'query': None,
+        'schema': schema.lower(),
+        'url': None,
+        'qsd': {},
+    }
+
+    if fullpath:
+        # The equivalent of tidy_path(); remove duplicate slashes and any
+        # trailing slash
+        while '//' in fullpath:
+            fullpath = fullpath.replace('//', '/')
+
+        if len(fullpath) > 1 and fullpath[-1] == '/':
+            fullpath = fullpath[:-1]
+
+        fullpath = quote(unquote(fullpath))
+
+        # Handle trailing slashes removed above
+        if fullpath[-1] != '/' and url[-1] == '/':
+            fullpath += '/'
+
+        result['fullpath'] = fullpath
+
+        # Split our query from our path
+        index = fullpath.rfind('/') + 1
+        result['path'] = fullpath[:index]
+        result['query'] = fullpath[index:] or None
+
+    if qsdata:
+        # The equivalent of parse_qsl(keep_blank_values=True) while ensuring
+        # that all keys are lowercase
+        qsd = result['qsd']
+        for entry in qsdata.split('&'):
+            if not entry:
+                continue
+
+            key, _, value = entry.partition('=')
+            qsd[unquote(key.replace('+', ' ')).lower().strip()] = \
+                unquote(value.replace('+', ' ')).strip()
+
+    return _verify_url(result, verify_host)
+
+
+def _parse_url(url, default_schema='http', verify_host=True):
+    """
+    The (slower) regular expression based implementation of parse_url();
+    it handles the URLs parse_url() can't tokenize in a single pass.
+
+    """
+
     # Default Results
     result = {
         # The username (if specified)
@@ -292,6 +373,16 @@ def parse_url(url, default_schema='http', verify_host=True):
         # and it's already assigned
         pass
 
+    return _verify_url(result, verify_host)
+
+
+def _verify_url(result, verify_host=True):
+    """
+    Validates the port (and optionally the host) of the URL parsed into the
+    result provided and re-assembles a cleaned up version of it; None is
+    returned if it is not valid.
+
+    """
     if result['port']:
         try:
             result['port'] = int(result['port'])
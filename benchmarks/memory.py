@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Measures the memory Apprise holds for each of the servers loaded into it;
+the servers are taken from the fixed corpus found in corpus.py so that
+results can be compared between runs.
+
+    # Measure 10,000 and 100,000 servers
+    python benchmarks/memory.py
+
+    # Fail if a server costs us more then 1KB
+    python benchmarks/memory.py --count 10000 --max-bytes 1024
+
+"""
+
+from __future__ import print_function
+
+import click
+import gc
+import logging
+import sys
+from os.path import abspath
+from os.path import dirname
+from os.path import join
+
+# Always measure the Apprise we were shipped with (and our corpus)
+sys.path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from benchmarks import corpus  # noqa: E402
+
+from apprise import Apprise  # noqa: E402
+
+# Defines our click context settings adding -h to the additional options that
+# can be specified to get the help menu to come up
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+
+def measure(count):
+    """
+    Loads count URLs (from our corpus) into an Apprise object and returns
+    the number of servers loaded, the bytes held on their behalf and the
+    bytes held for each of them.
+
+    """
+    # Not every interpreter we support has tracemalloc (Python 2.7 and PyPy
+    # don't), so it's only required once we're asked to measure something
+    import tracemalloc
+
+    # Our URLs are built before we start tracing; they're ours, not Apprise's
+    urls = corpus.urls(count, exclude=corpus.NETWORK_SCHEMAS)
+
+    # Load (and discard) a server first so that our (one-time) imports and
+    # caches aren't counted against what we load
+    Apprise(servers=urls[:1])
+
+    a = Apprise()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+
+        for url in urls:
+            # Added one at a time; a list is split on commas and spaces
+            a.add(url)
+
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+
+    finally:
+        tracemalloc.stop()
+
+    servers = len(a)
+    return {
+        'servers': servers,
+        'bytes': used,
+        'per_server': float(used) / max(servers, 1),
+    }
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('--count', '-n', 'counts', multiple=True,
+              type=click.IntRange(min=1), default=(10000, 100000),
+              help='The number of URLs to load (may be specified more than '
+              'once; default=10000 and 100000).')
+@click.option('--max-bytes', '-m', default=None, type=float,
+              help='Fail if a server costs us more then this many bytes.')
+def main(counts, max_bytes):
+    """
+    Measure the memory held for each server loaded into Apprise.
+
+    """
+    # Our corpus contains plenty of invalid URLs; we don't need to hear
+    # about them (some of which are logged by our root logger)
+    logging.disable(logging.CRITICAL)
+
+    exceeded = 0
+    click.echo('{:>10} {:>10} {:>14} {:>12}'.format(
+        'urls', 'servers', 'bytes', 'per server'))
+    try:
+        for count in counts:
+            result = measure(count)
+            failed = max_bytes is not None and \
+                result['per_server'] > max_bytes
+            exceeded += 1 if failed else 0
+
+            click.echo('{:>10} {:>10} {:>14} {:>12.1f}{}'.format(
+                count, result['servers'], result['bytes'],
+                result['per_server'], '  EXCEEDED' if failed else ''))
+
+    finally:
+        logging.disable(logging.NOTSET)
+
+    sys.exit(1 if exceeded else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmarks for the hot paths of Apprise (URL parsing, instantiation,
+dispatching and formatting); these are measured against the fixed corpora
+found in corpus.py so that results can be compared between runs.
+
+    # Run everything
+    python benchmarks/run.py
+
+    # Only run the URL parsing benchmarks
+    python benchmarks/run.py -f parse
+
+    # Save our results as a baseline, and later compare against it
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --compare baseline.json
+
+"""
+
+from __future__ import print_function
+
+import click
+import logging
+import platform
+import sys
+import timeit
+from collections import OrderedDict
+from json import dump
+from json import load
+from os.path import abspath
+from os.path import dirname
+from os.path import join
+
+# Always benchmark the Apprise we were shipped with (and our corpus)
+sys.path.insert(0, abspath(join(dirname(__file__), '..')))
+
+from benchmarks import corpus  # noqa: E402
+
+from apprise import Apprise  # noqa: E402
+from apprise import AppriseAsset  # noqa: E402
+from apprise import NotifyBase  # noqa: E402
+from apprise import NotifyFormat  # noqa: E402
+from apprise import NOTIFY_TYPES  # noqa: E402
+from apprise import NOTIFY_IMAGE_SIZES  # noqa: E402
+from apprise import __version__  # noqa: E402
+from apprise import utils  # noqa: E402
+
+# Defines our click context settings adding -h to the additional options that
+# can be specified to get the help menu to come up
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+# Our registered benchmarks; our keys are their names and our values are
+# a function that prepares the benchmark.  It's passed the scale to apply to
+# the size of our corpora and returns the (callable) benchmark and the
+# number of operations each call performs.
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name):
+    """
+    Registers the decorated function as the benchmark name specified
+
+    """
+    def decorator(function):
+        BENCHMARKS[name] = function
+        return function
+
+    return decorator
+
+
+class BenchNotification(NotifyBase):
+    """
+    A notification service that doesn't go anywhere; it's used to measure
+    the overhead of Apprise itself.
+
+    """
+    service_name = 'Benchmark'
+    protocol = 'bench'
+
+    def __init__(self, **kwargs):
+        super(BenchNotification, self).__init__(**kwargs)
+
+    def notify(self, title, body, notify_type, **kwargs):
+        return True
+
+    @staticmethod
+    def parse_url(url):
+        return NotifyBase.parse_url(url, verify_host=False)
+
+
+@benchmark('parse_url')
+def bench_parse_url(scale):
+    urls = corpus.urls(int(5000 * scale))
+
+    def run():
+        for url in urls:
+            utils.parse_url(url)
+
+    return run, len(urls)
+
+
+@benchmark('parse_url_regex')
+def bench_parse_url_regex(scale):
+    # The regular expressions parse_url() falls back on for the URLs it
+    # can't tokenize in a single pass; kept for comparison
+    urls = corpus.urls(int(5000 * scale))
+
+    def run():
+        for url in urls:
+            utils._parse_url(url)
+
+    return run, len(urls)
+
+
+@benchmark('parse_list')
+def bench_parse_list(scale):
+    tags = corpus.tags(int(5000 * scale))
+
+    def run():
+        for tag in tags:
+            utils.parse_list(tag)
+
+    return run, len(tags)
+
+
+@benchmark('instantiate')
+def bench_instantiate(scale):
+    urls = corpus.urls(
+        int(1000 * scale), exclude=corpus.NETWORK_SCHEMAS)
+
+    def run():
+        for url in urls:
+            Apprise.instantiate(url)
+
+    return run, len(urls)
+
+
+@benchmark('notify_tags')
+def bench_notify_tags(scale):
+    tags = corpus.tags(int(1000 * scale))
+
+    a = Apprise()
+    for tag in tags:
+        a.servers.append(BenchNotification(tag=tag))
+
+    # A mix of or'ed and and'ed tags
+    filters = (
+        corpus.WORDS[0],
+        [corpus.WORDS[1], corpus.WORDS[2]],
+        [(corpus.WORDS[3], corpus.WORDS[4]), corpus.WORDS[5]],
+    )
+
+    def run():
+        for tag in filters:
+            a.notify(title='title', body='body', tag=tag)
+
+    return run, len(filters) * len(a.servers)
+
+
+@benchmark('convert_markdown')
+def bench_convert_markdown(scale):
+    body = corpus.markdown_body(int(65536 * scale))
+
+    def run():
+        Apprise.convert(body, NotifyFormat.MARKDOWN, NotifyFormat.HTML)
+
+    return run, 1
+
+
+@benchmark('convert_text')
+def bench_convert_text(scale):
+    body = corpus.text_body(int(65536 * scale))
+
+    def run():
+        Apprise.convert(body, NotifyFormat.TEXT, NotifyFormat.HTML)
+
+    return run, 1
+
+
+@benchmark('asset_masks')
+def bench_asset_masks(scale):
+    asset = AppriseAsset()
+    count = max(1, int(250 * scale))
+
+    def run():
+        for _ in range(count):
+            for notify_type in NOTIFY_TYPES:
+                for size in NOTIFY_IMAGE_SIZES:
+                    asset.image_url(notify_type, size)
+                    asset.image_path(notify_type, size, must_exist=False)
+
+    return run, count * len(NOTIFY_TYPES) * len(NOTIFY_IMAGE_SIZES) * 2
+
+
+def _debug_payload(scale):
+    """
+    Returns a plugin and a payload like the ones our plugins log before
+    every request they make; debug logging is disabled (as it is unless
+    someone asks for it) so we're measuring what it costs us not to log.
+
+    """
+    server = BenchNotification()
+
+    payload = {
+        'token': 'a' * 30,
+        'title': 'title',
+        'message': corpus.text_body(int(4096 * scale)),
+        'priority': 0,
+    }
+
+    return server, payload
+
+
+@benchmark('debug_eager')
+def bench_debug_eager(scale):
+    server, payload = _debug_payload(scale)
+    count = max(1, int(1000 * scale))
+
+    def run():
+        # How our payloads used to be logged; formatted whether or not our
+        # message was ever going to be logged
+        for _ in range(count):
+            server.logger.debug('Bench Payload: %s' % str(payload))
+
+    return run, count
+
+
+@benchmark('debug_lazy')
+def bench_debug_lazy(scale):
+    server, payload = _debug_payload(scale)
+    count = max(1, int(1000 * scale))
+
+    def run():
+        for _ in range(count):
+            server.logger.debug(
+                'Bench Payload: %s', server.loggable(payload))
+
+    return run, count
+
+
+def run_benchmarks(names=None, repeat=5, scale=1.0):
+    """
+    Runs the benchmarks specified (or all of them) and returns our results
+    keyed by the benchmark name.  Each benchmark is run repeat times and the
+    best (and median) of them are reported.
+
+    """
+    results = OrderedDict()
+    for name, prepare in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+
+        function, ops = prepare(scale)
+        timings = sorted(timeit.repeat(function, number=1, repeat=repeat))
+
+        results[name] = {
+            'ops': ops,
+            'min': timings[0],
+            'median': timings[len(timings) // 2],
+            'per_op': timings[0] / ops,
+        }
+
+    return results
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compares our results to a baseline; returns a list of tuples containing
+    the benchmark name, the ratio of our time to that of our baseline and
+    whether or not it is a regression (slower by more then our threshold).
+
+    """
+    comparison = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = result['per_op'] / max(baseline[name]['per_op'], 1e-12)
+        comparison.append((name, ratio, ratio > 1.0 + threshold))
+
+    return comparison
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('--filter', '-f', 'filters', multiple=True, type=str,
+              help='Only run the benchmarks whose name contains this '
+              '(may be specified more than once).')
+@click.option('--repeat', '-r', default=5, type=click.IntRange(min=1),
+              help='The number of times each benchmark is run (default=5).')
+@click.option('--scale', '-x', default=1.0, type=float,
+              help='Scale the size of our corpora (default=1.0).')
+@click.option('--save', '-s', default=None, type=str, metavar='FILE',
+              help='Save our results (as JSON) so they can be used as a '
+              'baseline later.')
+@click.option('--compare', '-c', 'baseline', default=None, type=str,
+              metavar='FILE', help='Compare our results against a baseline '
+              'previously saved with --save.')
+@click.option('--threshold', '-t', default=0.1, type=float,
+              help='How much slower (than our baseline) a benchmark may be '
+              'before it is reported as a regression (default=0.1).')
+@click.option('--list', '-l', 'list_only', is_flag=True,
+              help='List our benchmarks.')
+def main(filters, repeat, scale, save, baseline, threshold, list_only):
+    """
+    Benchmark the hot paths of Apprise.
+
+    """
+    if list_only:
+        for name in BENCHMARKS.keys():
+            click.echo(name)
+        sys.exit(0)
+
+    # Our benchmarks exercise plenty of invalid content; we don't need to
+    # hear about it
+    logging.getLogger('apprise').setLevel(logging.CRITICAL)
+
+    names = [
+        name for name in BENCHMARKS.keys()
+        if not filters or any(f in name for f in filters)]
+
+    results = run_benchmarks(names, repeat=repeat, scale=scale)
+
+    click.echo('{:<20} {:>8} {:>12} {:>12} {:>12}'.format(
+        'benchmark', 'ops', 'min (s)', 'median (s)', 'per op (us)'))
+    for name, result in results.items():
+        click.echo('{:<20} {:>8} {:>12.6f} {:>12.6f} {:>12.3f}'.format(
+            name, result['ops'], result['min'], result['median'],
+            result['per_op'] * 1e6))
+
+    if save:
+        with open(save, 'w') as f:
+            dump({
+                'apprise': __version__,
+                'python': platform.python_version(),
+                'scale': scale,
+                'results': results,
+            }, f, indent=2)
+
+    if baseline:
+        with open(baseline) as f:
+            baseline = load(f)
+
+        if baseline.get('scale') != scale:
+            click.echo('Warning: our baseline was taken with a scale of '
+                       '{}.'.format(baseline.get('scale')))
+
+        regressions = 0
+        click.echo('')
+        click.echo('{:<20} {:>10}'.format('benchmark', 'vs baseline'))
+        for name, ratio, regression in compare(
+                results, baseline['results'], threshold=threshold):
+            click.echo('{:<20} {:>9.2f}x{}'.format(
+                name, ratio, '  REGRESSION' if regression else ''))
+            regressions += 1 if regression else 0
+
+        if regressions:
+            sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
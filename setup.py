@@ -62,7 +62,7 @@ setup(
         'Emby IFTTT Discord',
     author='Chris Caron',
     author_email='lead2gold@gmail.com',
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*')),
     package_data={
         'apprise': [
             'assets/NotifyXML-1.0.xsd',
@@ -24,6 +24,9 @@
 # THE SOFTWARE.
 
 from __future__ import print_function
+import sys
+import threading
+from time import sleep
 from os import chmod
 from os import getuid
 from os.path import dirname
@@ -34,6 +37,8 @@ from apprise.Apprise import SCHEMA_MAP
 from apprise import NotifyBase
 from apprise import NotifyType
 from apprise import NotifyFormat
+from apprise import NotifyOverflow
+from apprise import CircuitState
 from apprise import NotifyImageSize
 from apprise import __version__
 from apprise.Apprise import __load_matrix
@@ -419,6 +424,437 @@ def test_apprise_notify_formats(tmpdir):
            body_format=NotifyFormat.HTML) is True)
 
 
+def test_apprise_notify_overflow():
+    """
+    API: Apprise() Overflow tests
+
+    """
+    # Track what was sent
+    sent = []
+
+    class SplitNotification(NotifyBase):
+        # A tiny body
+        body_maxlen = 10
+
+        def __init__(self, **kwargs):
+            super(SplitNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, **kwargs):
+            sent.append((title, body))
+            return self.host != 'fail'
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['split'] = SplitNotification
+
+    a = Apprise()
+    assert a.add('split://localhost?overflow=split') is True
+
+    body = 'word ' * 6
+    assert a.notify(title='title', body=body) is True
+    assert sent == [
+        ('title', 'word word '), ('', 'word word '), ('', 'word word ')]
+
+    # Upstream handling (the default) sends our message as is
+    a = Apprise()
+    assert a.add('split://localhost') is True
+    assert a.servers[0].overflow_mode == NotifyOverflow.UPSTREAM
+
+    del sent[:]
+    assert a.notify(title='title', body=body) is True
+    assert sent == [('title', body)]
+
+    # We stop sending the remaining parts of a message once one fails
+    a = Apprise()
+    assert a.add('split://fail?overflow=split') is True
+
+    del sent[:]
+    assert a.notify(title='title', body=body) is False
+    assert len(sent) == 1
+
+
+def test_apprise_dedup():
+    """
+    API: Apprise() Duplicate Suppression
+
+    """
+    # The apprise.Apprise module (not to be confused with the class)
+    with mock.patch.object(sys.modules['apprise.Apprise'], 'time') as \
+            mock_time:
+        _test_apprise_dedup(mock_time)
+
+
+def _test_apprise_dedup(mock_time):
+    mock_time.return_value = 1000.0
+
+    # Track what was sent
+    sent = []
+
+    class DedupNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super(DedupNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            sent.append((self.host, title, body, notify_type))
+            return self.host != 'fail'
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['dedup'] = DedupNotification
+
+    # By default nothing is suppressed
+    a = Apprise(servers='dedup://localhost')
+    assert a.notify(title='title', body='body') is True
+    assert a.notify(title='title', body='body') is True
+    assert len(sent) == 2
+    assert a.suppressed == 0
+
+    del sent[:]
+    a = Apprise(servers=['dedup://hostA', 'dedup://hostB'], dedup_window=60)
+    assert a.notify(title='title', body='body') is True
+    assert len(sent) == 2
+
+    # Our repeat is suppressed (for both servers)
+    assert a.notify(title='title', body='body') is True
+    assert len(sent) == 2
+    assert a.suppressed == 2
+
+    # A different message (or type) is not
+    assert a.notify(title='title', body='body2') is True
+    assert a.notify(
+        title='title', body='body', notify_type=NotifyType.FAILURE) is True
+    assert len(sent) == 6
+    assert a.suppressed == 2
+
+    # Once our window passes, we send again
+    mock_time.return_value = 1061.0
+    assert a.notify(title='title', body='body') is True
+    assert len(sent) == 8
+    assert a.suppressed == 2
+
+    # We never track more then our maximum number of entries
+    a.dedup_max_entries = 3
+    for no in range(10):
+        assert a.notify(title='title', body='body%d' % no) is True
+    assert len(a._recent) <= a.dedup_max_entries
+
+    # Clearing our servers clears what we're tracking
+    a.clear()
+    assert len(a._recent) == 0
+
+    # Failed notifications are not suppressed; they can be tried again
+    del sent[:]
+    a = Apprise(servers='dedup://fail', dedup_window=60)
+    assert a.notify(title='title', body='body') is False
+    assert a.notify(title='title', body='body') is False
+    assert len(sent) == 2
+    assert a.suppressed == 0
+    assert len(a._recent) == 0
+
+    # Nor are those we never got to send
+    a = Apprise(servers='dedup://localhost', dedup_window=60)
+    assert a.notify(title='title', body='body', deadline=0) is False
+    assert a.notify(title='title', body='body') is True
+    assert a.suppressed == 0
+
+    # We track the servers themselves (not just their id) so a new server
+    # is never mistaken for one we've since let go of
+    a.clear()
+    assert a.add('dedup://localhost') is True
+    assert a.notify(title='title', body='body') is True
+    assert a.suppressed == 0
+
+    # Notifications waiting in a digest are suppressed, and those in a digest
+    # that couldn't be sent are not
+    del sent[:]
+    a = Apprise(
+        servers=['dedup://localhost', 'dedup://fail'], dedup_window=60,
+        digest_window=30)
+    assert a.notify(title='title', body='body') is True
+    assert a.notify(title='title', body='body') is True
+    assert a.suppressed == 2
+    assert a.flush() is False
+    assert len(sent) == 2
+
+    assert a.notify(title='title', body='body') is True
+    assert a.suppressed == 3
+    assert a.flush() is False
+    assert sent[-1] == ('fail', 'title', 'body', NotifyType.INFO)
+
+
+def test_apprise_digest():
+    """
+    API: Apprise() Digests
+
+    """
+    # The apprise.Apprise module (not to be confused with the class)
+    with mock.patch.object(sys.modules['apprise.Apprise'], 'time') as \
+            mock_time:
+        _test_apprise_digest(mock_time)
+
+
+def _test_apprise_digest(mock_time):
+    mock_time.return_value = 1000.0
+
+    # Track what was sent
+    sent = []
+
+    class DigestNotification(NotifyBase):
+        # A small body to work with
+        body_maxlen = 100
+
+        def __init__(self, **kwargs):
+            super(DigestNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            sent.append((self.host, title, body, notify_type))
+            return self.host != 'fail'
+
+    class HtmlDigestNotification(DigestNotification):
+        notify_format = NotifyFormat.HTML
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['digest'] = DigestNotification
+    SCHEMA_MAP['hdigest'] = HtmlDigestNotification
+
+    a = Apprise(
+        servers=['digest://localhost', 'hdigest://localhost'],
+        digest_window=30)
+
+    # Our notifications are held onto
+    assert a.notify(title='t1', body='b1') is True
+    assert a.notify(title='t2', body='<b2>', notify_type=NotifyType.FAILURE,
+                    body_format=NotifyFormat.TEXT) is True
+    assert a.notify(title='', body='b3', notify_type=NotifyType.WARNING) \
+        is True
+    assert len(sent) == 0
+
+    # Until our window passes
+    mock_time.return_value = 1031.0
+    assert a.notify(title='t4', body='b4') is True
+    assert len(sent) == 2
+    assert sent[0] == (
+        'localhost', '3 Notifications', 't1\r\nb1\r\n\r\nt2\r\n<b2>\r\n\r\nb3',
+        NotifyType.FAILURE)
+    assert sent[1][1] == '3 Notifications'
+    assert sent[1][2] == \
+        '<b>t1</b><br/>\r\nb1<hr/>\r\n<b>t2</b><br/>\r\n&lt;b2&gt;<hr/>\r\nb3'
+
+    # A flush sends what we have left; a single notification is sent as is
+    del sent[:]
+    assert a.flush() is True
+    assert sent == [
+        ('localhost', 't4', 'b4', NotifyType.INFO),
+        ('localhost', 't4', 'b4', NotifyType.INFO),
+    ]
+
+    # Nothing left to flush
+    del sent[:]
+    assert a.flush() is True
+    assert len(sent) == 0
+
+    # Digests are sent once they hold digest_max notifications
+    a = Apprise(servers='digest://localhost', digest_window=30, digest_max=2)
+    assert a.notify(title='t1', body='b1') is True
+    assert len(sent) == 0
+    assert a.notify(title='t2', body='b2') is True
+    assert len(sent) == 1
+
+    # Or before they'd grow larger then our body_maxlen
+    del sent[:]
+    a = Apprise(servers='digest://localhost', digest_window=30)
+    assert a.notify(title='t1', body='a' * 60) is True
+    assert a.notify(title='t2', body='b' * 60) is True
+    assert len(sent) == 1
+    assert sent[0][2] == 'a' * 60
+    assert a.flush() is True
+    assert len(sent) == 2
+    assert sent[1][2] == 'b' * 60
+
+    # Failures are reported
+    del sent[:]
+    a = Apprise(servers='digest://fail', digest_window=30, digest_max=2)
+    assert a.notify(title='t1', body='b1') is True
+    assert a.notify(title='t2', body='b2') is False
+    assert a.notify(title='t3', body='b3') is True
+    assert a.flush() is False
+
+    a = Apprise(servers='digest://fail', digest_window=30)
+    assert a.notify(title='t1', body='a' * 60) is True
+    assert a.notify(title='t2', body='b' * 60) is False
+    mock_time.return_value = 1100.0
+    assert a.notify(title='t3', body='b3') is False
+
+    # Clearing our servers drops our digests
+    a.clear()
+    assert a.flush() is True
+
+    # Our limit accounts for how our digest is presented (its headings,
+    # separators and the expansion of our body into HTML)
+    del sent[:]
+    a = Apprise(servers='hdigest://localhost', digest_window=30)
+    assert a.notify(
+        title='t1', body=' ' * 10, body_format=NotifyFormat.TEXT) is True
+    assert a.notify(
+        title='t2', body=' ' * 10, body_format=NotifyFormat.TEXT) is True
+    assert len(sent) == 1
+    assert a.flush() is True
+    assert len(sent) == 2
+    assert all(len(entry[2]) <= 100 for entry in sent)
+
+    # Whatever is left is sent when we exit
+    del sent[:]
+    a = Apprise(servers='digest://localhost', digest_window=30)
+    assert a.notify(title='t1', body='b1') is True
+    assert len(sent) == 0
+    sys.modules['apprise.Apprise']._flush_at_exit()
+    assert sent == [('localhost', 't1', 'b1', NotifyType.INFO)]
+
+
+def test_apprise_digest_background():
+    """
+    API: Apprise() Digests sent in the background
+
+    """
+    # Track what was sent
+    sent = []
+
+    class BackgroundNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super(BackgroundNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            sent.append((title, body))
+            return True
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['bground'] = BackgroundNotification
+
+    a = Apprise(servers='bground://localhost', digest_window=0.1)
+    assert a.notify(title='t1', body='b1') is True
+    assert a.notify(title='t2', body='b2') is True
+    assert len(sent) == 0
+
+    # Our digest is sent without us having to notify (or flush) again
+    for _ in range(500):
+        if sent and a._flusher is None:
+            break
+        sleep(0.01)
+
+    assert sent == [('2 Notifications', 't1\r\nb1\r\n\r\nt2\r\nb2')]
+    assert a._flusher is None
+
+    # It's started again with our next digest
+    assert a.notify(title='t3', body='b3') is True
+    for _ in range(500):
+        if len(sent) == 2:
+            break
+        sleep(0.01)
+
+    assert sent[1] == ('t3', 'b3')
+
+
+def test_apprise_circuit():
+    """
+    API: Apprise() Circuit Breaker
+
+    """
+    # Track what was sent
+    sent = []
+
+    class CircuitNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super(CircuitNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            sent.append(self.host)
+            if self.host == 'throw':
+                raise AttributeError()
+
+            elif self.host == 'reject':
+                # Our service is up; it just didn't like our notification
+                self.circuit_response(400)
+
+            return self.host == 'good'
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['circuit'] = CircuitNotification
+
+    # Our circuit breaker is only used if it's enabled
+    a = Apprise(servers=['circuit://bad'])
+    for _ in range(3):
+        assert a.notify(title='title', body='body') is False
+    assert sent == ['bad'] * 3
+
+    # Open our circuit quickly
+    del sent[:]
+    a = Apprise(servers=[
+        'circuit://{}?circuit=2'.format(host)
+        for host in ('good', 'bad', 'throw', 'reject')])
+    assert a.notify(title='title', body='body') is False
+    assert a.notify(title='title', body='body') is False
+    assert sorted(sent) == sorted(['good', 'bad', 'throw', 'reject'] * 2)
+    for server in a.servers:
+        assert server.circuit_state == (
+            CircuitState.CLOSED if server.host in ('good', 'reject')
+            else CircuitState.OPEN)
+
+    # Our failing servers are no longer waited on
+    del sent[:]
+    assert a.notify(title='title', body='body') is False
+    assert sorted(sent) == ['good', 'reject']
+
+
+def test_apprise_threads():
+    """
+    API: Apprise() notified from several threads
+
+    """
+    # Track how many threads are notifying each of our servers at once
+    lock = threading.Lock()
+    active = {}
+    busiest = {}
+
+    class ThreadNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super(ThreadNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            with lock:
+                active[self.host] = active.get(self.host, 0) + 1
+                busiest[self.host] = max(
+                    busiest.get(self.host, 0), active[self.host])
+
+            # Give another thread the chance to get in our way
+            sleep(0.001)
+
+            with lock:
+                active[self.host] -= 1
+            return True
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['thread'] = ThreadNotification
+
+    a = Apprise(
+        servers=['thread://hostA', 'thread://hostB'], dedup_window=60)
+
+    def worker(no):
+        for i in range(20):
+            a.notify(title='title', body='body%d-%d' % (no, i))
+
+    threads = [threading.Thread(target=worker, args=(no, ))
+               for no in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    # Every notification was sent, but never by two threads to the same
+    # server at once
+    assert busiest == {'hostA': 1, 'hostB': 1}
+    assert len(a._recent) == 8 * 20 * 2
+    assert a.suppressed == 0
+
+
 def test_apprise_asset(tmpdir):
     """
     API: AppriseAsset() object
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+import sys
+from os.path import abspath
+from os.path import dirname
+from click.testing import CliRunner
+
+# Our benchmarks aren't installed along with Apprise
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from benchmarks import corpus  # noqa: E402
+from benchmarks import memory  # noqa: E402
+from benchmarks import run  # noqa: E402
+
+
+def test_benchmark_corpus():
+    """
+    Benchmarks: corpus
+
+    """
+    # Our corpora are reproducible
+    assert corpus.urls(50) == corpus.urls(50)
+    assert corpus.tags(50) == corpus.tags(50)
+    assert corpus.urls(50) != corpus.urls(50, seed=1)
+
+    assert len(corpus.urls(50)) == 50
+    assert len(corpus.tags(50)) == 50
+
+    # Schemas can be excluded
+    for url in corpus.urls(200, exclude=corpus.NETWORK_SCHEMAS):
+        assert url.split(':', 1)[0] not in corpus.NETWORK_SCHEMAS
+
+    # Our bodies are (roughly) the size requested
+    assert 1024 <= len(corpus.text_body(1024)) < 2048
+    assert 1024 <= len(corpus.markdown_body(1024)) < 2048
+
+
+def test_benchmark_run():
+    """
+    Benchmarks: run
+
+    """
+    results = run.run_benchmarks(repeat=1, scale=0.01)
+    assert list(results.keys()) == list(run.BENCHMARKS.keys())
+    for result in results.values():
+        assert result['ops'] > 0
+        assert result['min'] <= result['median']
+
+    # Filter our benchmarks
+    results = run.run_benchmarks(['parse_url'], repeat=1, scale=0.01)
+    assert list(results.keys()) == ['parse_url']
+
+    # Compare against a baseline
+    baseline = {'parse_url': dict(results['parse_url'])}
+    assert run.compare(results, baseline) == [('parse_url', 1.0, False)]
+
+    baseline['parse_url']['per_op'] /= 2.0
+    name, ratio, regression = run.compare(results, baseline)[0]
+    assert regression is True
+    assert ratio > 1.9
+
+    # Benchmarks missing from our baseline are skipped
+    assert run.compare(results, {}) == []
+
+
+def test_benchmark_memory():
+    """
+    Benchmarks: memory
+
+    """
+    # Python 2.7 and PyPy can't measure our memory
+    pytest.importorskip('tracemalloc')
+
+    result = memory.measure(50)
+    assert result['servers'] > 0
+    assert result['bytes'] > 0
+    assert result['per_server'] == \
+        float(result['bytes']) / result['servers']
+
+    runner = CliRunner()
+    result = runner.invoke(memory.main, ['-n', '50'])
+    assert result.exit_code == 0
+    assert 'EXCEEDED' not in result.output
+
+    # We fail if our servers cost us more then we allow
+    result = runner.invoke(memory.main, ['-n', '50', '--max-bytes', '1'])
+    assert result.exit_code == 1
+    assert 'EXCEEDED' in result.output
@@ -24,7 +24,15 @@
 # THE SOFTWARE.
 
 from __future__ import print_function
+import os
+import pytest
+import socket
+import stat
+import threading
+from json import dumps
+from json import loads
 from apprise import cli
+from apprise import Apprise
 from apprise import NotifyBase
 from click.testing import CliRunner
 from apprise.Apprise import SCHEMA_MAP
@@ -89,3 +97,211 @@ def test_apprise_cli():
         'bad://localhost',
     ])
     assert result.exit_code == 1
+
+
+def test_apprise_cli_stream():
+    """
+    API: Apprise() CLI --stream mode
+
+    """
+
+    class StreamNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super(StreamNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            if body == 'throw':
+                raise AttributeError('bad plugin')
+            # Fail our failure notifications
+            return notify_type != 'failure'
+
+    # Set up our notification types
+    SCHEMA_MAP['stream'] = StreamNotification
+
+    runner = CliRunner()
+    result = runner.invoke(cli.main, [
+        '--stream',
+        'stream://localhost',
+    ], input='\n'.join([
+        dumps({'title': 'title', 'body': 'body', 'id': 'a'}),
+        '',
+        dumps({'body': 'body', 'type': 'success', 'tag': None}),
+    ]) + '\n')
+    assert result.exit_code == 0
+
+    results = sorted(
+        [loads(line) for line in result.output.splitlines()],
+        key=lambda r: r['line'])
+    assert results == [
+        {'line': 1, 'id': 'a', 'status': True},
+        {'line': 3, 'status': True},
+    ]
+
+    # Failures (and bad records) are reported but don't stop our stream
+    result = runner.invoke(cli.main, [
+        '-S', '--workers', '1',
+        'stream://localhost',
+    ], input='\n'.join([
+        'not json',
+        '[]',
+        dumps({'body': 'body', 'type': 'failure'}),
+        dumps({'body': 'throw'}),
+        dumps({'body': 'body'}),
+    ]))
+    assert result.exit_code == 1
+
+    results = sorted(
+        [loads(line) for line in result.output.splitlines()],
+        key=lambda r: r['line'])
+    assert [r['line'] for r in results] == [1, 2, 3, 4, 5]
+    assert [r['status'] for r in results] == [
+        False, False, False, False, True]
+    assert 'error' in results[0]
+    assert 'error' in results[1]
+    assert 'error' not in results[2]
+
+
+def test_apprise_cli_daemon(tmpdir):
+    """
+    API: Apprise() CLI --daemon and --client modes
+
+    """
+
+    # Track what was sent
+    sent = []
+
+    class DaemonNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super(DaemonNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            sent.append((title, body, notify_type))
+            return notify_type != 'failure'
+
+    # Set up our notification types
+    SCHEMA_MAP['daemon'] = DaemonNotification
+
+    path = str(tmpdir.join('apprise.sock'))
+
+    # Anything at our path that isn't a socket is left alone
+    tmpdir.join('apprise.sock').write('content')
+    with pytest.raises(socket.error):
+        cli._DaemonServer(path, Apprise(servers='daemon://localhost'))
+    assert tmpdir.join('apprise.sock').read() == 'content'
+    tmpdir.join('apprise.sock').remove()
+
+    # A stale socket (one nobody is listening on) is cleaned up
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    sock.close()
+    assert os.path.exists(path)
+
+    server = cli._DaemonServer(
+        path, Apprise(servers='daemon://localhost'), workers=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        # Only we may submit notifications
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+        # A running daemon isn't replaced by another
+        with pytest.raises(socket.error):
+            cli._DaemonServer(path, Apprise(servers='daemon://localhost'))
+
+        runner = CliRunner()
+
+        # No server URLs are needed to submit to our daemon
+        result = runner.invoke(cli.main, [
+            '--client', '--socket', path,
+            '-t', 'test title',
+            '-b', 'test body',
+        ])
+        assert result.exit_code == 0
+        assert sent == [('test title', 'test body', 'info')]
+
+        # Our body can come from STDIN
+        result = runner.invoke(cli.main, [
+            '-C', '-s', path, '-n', 'failure',
+        ], input='test stdin body')
+        assert result.exit_code == 1
+        assert sent[-1] == (None, 'test stdin body', 'failure')
+
+        # Stream our records through our daemon
+        result = runner.invoke(cli.main, [
+            '-C', '-S', '-s', path,
+        ], input='\n'.join([
+            dumps({'body': 'body', 'id': 1}),
+            'not json',
+        ]) + '\n')
+        assert result.exit_code == 1
+        results = sorted(
+            [loads(line) for line in result.output.splitlines()],
+            key=lambda r: r['line'])
+        assert results[0] == {'line': 1, 'id': 1, 'status': True}
+        assert results[1]['status'] is False
+
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    # There is no daemon to submit to
+    result = runner.invoke(cli.main, [
+        '--client', '--socket', str(tmpdir.join('missing.sock')),
+        '-b', 'test body',
+    ])
+    assert result.exit_code == 1
+
+    # We can't listen on a path we can't write to
+    result = runner.invoke(cli.main, [
+        '--daemon', '--socket', str(tmpdir.join('missing', 'apprise.sock')),
+        'daemon://localhost',
+    ])
+    assert result.exit_code == 1
+
+    # Our daemon needs server URLs too
+    result = runner.invoke(cli.main, ['--daemon', '--socket', path])
+    assert result.exit_code == 1
+
+
+def test_apprise_cli_profile(tmpdir):
+    """
+    API: Apprise() CLI --profile
+
+    """
+    # Other tests reload our modules, so look up our current schema map
+    from apprise.Apprise import SCHEMA_MAP
+
+    class ProfileNotification(NotifyBase):
+        protocol = 'profile'
+
+        def __init__(self, **kwargs):
+            super(ProfileNotification, self).__init__()
+
+        def notify(self, **kwargs):
+            return True
+
+    SCHEMA_MAP['profile'] = ProfileNotification
+
+    runner = CliRunner()
+    result = runner.invoke(cli.main, [
+        '-b', 'test body', '--profile', 'profile://localhost'])
+    assert result.exit_code == 0
+    assert 'profile: 1 call(s) in ' in result.output
+    assert 'notify: 1 call(s) in ' in result.output
+
+    # Save our profile; one file for each of our labels
+    path = str(tmpdir.join('{label}.pstats'))
+    result = runner.invoke(cli.main, [
+        '-b', 'test body', '--profile-output', path, 'profile://localhost'])
+    assert result.exit_code == 0
+    assert 'call(s) in ' not in result.output
+    assert sorted(f.basename for f in tmpdir.listdir()) == [
+        'add.pstats', 'notify.pstats', 'profile.pstats']
+
+    # We report on our profile however we exit
+    result = runner.invoke(cli.main, [
+        '-b', 'test body', '-P', 'invalid://localhost'])
+    assert result.exit_code == 1
+    assert 'add: 1 call(s) in ' in result.output
@@ -176,12 +176,45 @@ def test_dbus_plugin(mock_mainloop, mock_byte, mock_bytearray,
     mock_notify = mock.Mock()
     mock_interface.return_value = mock_notify
     mock_notify.Notify.side_effect = AttributeError()
+    # Our interface is cached, so clear it to pick up our new mock object
+    obj._interfaces.clear()
     assert(obj.notify(title='', body='body',
            notify_type=apprise.NotifyType.INFO) is False)
     mock_notify.Notify.side_effect = None
 
+    # Our cached interface is re-used between notifications
+    mock_sessionbus.reset_mock()
+    assert(obj.notify(title='', body='body',
+           notify_type=apprise.NotifyType.INFO) is True)
+    assert(obj.notify(title='', body='body',
+           notify_type=apprise.NotifyType.INFO) is True)
+    assert(mock_sessionbus.call_count == 0)
+
+    # A lost connection causes us to reconnect and try again
+    from dbus.exceptions import DBusException
+    mock_notify.Notify.side_effect = (DBusException(
+        'lost', name='org.freedesktop.DBus.Error.Disconnected'), None)
+    assert(obj.notify(title='', body='body',
+           notify_type=apprise.NotifyType.INFO) is True)
+    assert(mock_sessionbus.call_count == 1)
+
+    # Any other error is not retried
+    mock_sessionbus.reset_mock()
+    mock_notify.Notify.side_effect = (DBusException(
+        'bad', name='org.freedesktop.DBus.Error.InvalidArgs'), None)
+    assert(obj.notify(title='', body='body',
+           notify_type=apprise.NotifyType.INFO) is False)
+    assert(mock_sessionbus.call_count == 0)
+
+    mock_notify.Notify.side_effect = (AttributeError(), None)
+    assert(obj.notify(title='', body='body',
+           notify_type=apprise.NotifyType.INFO) is False)
+    assert(mock_sessionbus.call_count == 0)
+    mock_notify.Notify.side_effect = None
+
     # Test our loading of our icon exception; it will still allow the
     # notification to be sent
+    obj._icons.clear()
     mock_pixbuf.new_from_file.side_effect = AttributeError()
     assert(obj.notify(title='title', body='body',
            notify_type=apprise.NotifyType.INFO) is True)
@@ -121,8 +121,12 @@ def test_gnome_plugin():
     assert(obj.notify(title='', body='body',
            notify_type=apprise.NotifyType.INFO) is True)
 
+    # Our decoded icon is cached between notifications
+    assert(mock_pixbuf.new_from_file.call_count == 1)
+
     # Test our loading of our icon exception; it will still allow the
     # notification to be sent
+    obj._icons.clear()
     mock_pixbuf.new_from_file.side_effect = AttributeError()
     assert(obj.notify(title='title', body='body',
            notify_type=apprise.NotifyType.INFO) is True)
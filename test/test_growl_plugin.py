@@ -270,3 +270,58 @@ def test_growl_plugin(mock_gntp):
             print('%s / %s' % (url, str(e)))
             assert(exception is not None)
             assert(isinstance(e, exception))
+
+
+@mock.patch('apprise.plugins.gntp.notifier.GrowlNotifier')
+def test_growl_plugin_timeout(mock_gntp):
+    """
+    API: NotifyGrowl Plugin() Timeouts
+
+    """
+    # Track the timeout in place when we talk to our server
+    timeouts = []
+
+    mock_notifier = mock.Mock()
+    mock_notifier.register.side_effect = \
+        lambda: timeouts.append(('register', mock_notifier.socketTimeout))
+    mock_notifier.notify.side_effect = \
+        lambda **kwargs: timeouts.append(
+            ('notify', mock_notifier.socketTimeout)) or True
+    mock_gntp.return_value = mock_notifier
+
+    obj = Apprise.instantiate('growl://localhost?timeout=2.5')
+    assert isinstance(obj, plugins.NotifyGrowl)
+    assert obj.notify(
+        title='test', body='body', notify_type=NotifyType.INFO) is True
+
+    # Our registration (done when we're created) is bound by our timeout
+    assert timeouts == [('register', 2.5), ('notify', 2.5)]
+
+
+def test_growl_gntp_encoding():
+    """
+    API: gntp packet encoding
+
+    """
+    gntp = plugins.gntp.core
+
+    # Identical resources share a single identifier
+    notice = gntp.GNTPNotice(app='apprise', name='info', title='title')
+    resource = notice.add_resource(b'\x89PNG icon data')
+    assert resource == notice.add_resource(b'\x89PNG icon data')
+    assert resource != notice.add_resource(b'\x89PNG other icon')
+    notice.add_header('Notification-Icon', resource)
+
+    data = notice.encode()
+    assert isinstance(data, bytes)
+    assert data.startswith(b'GNTP/1.0 NOTIFY NONE\r\n')
+    assert b'Notification-Icon: ' + resource.encode('utf-8') + b'\r\n' in data
+    assert b'Length: 14\r\n\r\n\x89PNG icon data\r\n\r\n' in data
+
+    register = gntp.GNTPRegister()
+    register.add_notification('info')
+    data = register.encode()
+    assert data.startswith(b'GNTP/1.0 REGISTER NONE\r\n')
+    assert b'Notifications-Count: 1\r\n' in data
+    assert b'Notification-Name: info\r\n' in data
+    assert data.endswith(b'\r\n\r\n')
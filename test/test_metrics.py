@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from apprise import Apprise
+from apprise import AppriseMetrics
+from apprise import NotifyBase
+from apprise.metrics import schema_of
+
+
+def test_apprise_metrics():
+    """
+    API: AppriseMetrics()
+
+    """
+    # Other tests reload our modules, so look up our current schema map
+    from apprise.Apprise import SCHEMA_MAP
+
+    # Track what our hooks saw
+    seen = []
+
+    class MetricsNotification(NotifyBase):
+        protocol = 'mtrc'
+        secure_protocol = 'mtrcs'
+
+        def __init__(self, **kwargs):
+            super(MetricsNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            if body == 'throttle':
+                self.throttle(0.01)
+
+            if body == 'throw':
+                raise AttributeError()
+
+            return body != 'failure'
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['mtrc'] = MetricsNotification
+    SCHEMA_MAP['mtrcs'] = MetricsNotification
+
+    a = Apprise()
+    assert a.add('mtrc://localhost')
+    assert a.add('mtrcs://localhost')
+
+    assert sorted(schema_of(s) for s in a.servers) == ['mtrc', 'mtrcs']
+
+    # Our hooks are invoked in order
+    a.pre_send_hooks.append(
+        lambda server, title, body, notify_type: seen.append((
+            'pre', title, body, notify_type)))
+    a.send_hooks.append(
+        lambda server, status, elapsed: seen.append(('post', status)))
+
+    assert a.notify(title='title', body='body', notify_type='info') is True
+    assert seen == [
+        ('pre', 'title', 'body', 'info'), ('post', True),
+        ('pre', 'title', 'body', 'info'), ('post', True),
+    ]
+
+    # A hook that throws fails our notification, but our deadline is still
+    # cleared and the hooks that follow are still run
+    def broken_hook(server, title, body, notify_type):
+        raise ValueError()
+
+    del seen[:]
+    a.pre_send_hooks.append(broken_hook)
+    assert a.notify(title='title', body='body', deadline=60) is False
+    assert seen == [
+        ('pre', 'title', 'body', 'info'), ('post', False),
+        ('pre', 'title', 'body', 'info'), ('post', False),
+    ]
+    assert all(server.deadline is None for server in a.servers)
+    del a.pre_send_hooks[:]
+
+    # The same goes for the hooks run once a notification was sent; our
+    # remaining hooks and servers are still run
+    def broken_post_hook(server, status, elapsed):
+        raise ValueError()
+
+    del seen[:]
+    a.send_hooks.insert(0, broken_post_hook)
+    assert a.notify(title='title', body='body') is True
+    assert seen == [('post', True), ('post', True)]
+
+    del a.send_hooks[:]
+
+    # Nothing is gathered until we're attached
+    metrics = AppriseMetrics(buckets=(1.0, 0.5))
+    assert metrics.buckets == (0.5, 1.0)
+    assert a.notify(title='title', body='body') is True
+    assert metrics.samples() == []
+
+    metrics.attach(a)
+    # We're only ever attached once
+    metrics.attach(a)
+    assert len(a.pre_send_hooks) == 1
+    assert len(a.send_hooks) == 1
+
+    assert a.notify(title=u'tïtle', body='body') is True
+    assert a.notify(title='title', body='failure') is False
+    assert a.notify(title='title', body='throw') is False
+    assert a.notify(title='', body='throttle') is True
+
+    samples = dict(
+        ((name, tuple(sorted(labels.items()))), value)
+        for name, labels, value in metrics.samples())
+
+    for schema in ('mtrc', 'mtrcs'):
+        def sample(name, **labels):
+            labels['schema'] = schema
+            return samples[(name, tuple(sorted(labels.items())))]
+
+        assert sample('apprise_notify_total', status='success') == 2
+        assert sample('apprise_notify_total', status='failure') == 2
+        assert sample('apprise_notify_duration_seconds_count') == 4
+        assert sample('apprise_notify_duration_seconds_bucket',
+                      le='+Inf') == 4
+        assert sample('apprise_notify_duration_seconds_bucket',
+                      le='0.5') <= 4
+        assert sample('apprise_notify_duration_seconds_sum') >= 0.01
+        assert sample('apprise_notify_in_progress') == 0
+        assert sample('apprise_notify_bytes_total') == \
+            len(u'tïtle'.encode('utf-8')) + len('body') + \
+            len('titlefailure') + len('titlethrow') + len('throttle')
+        assert sample('apprise_throttle_total') == 1
+        assert sample('apprise_throttle_seconds_total') == 0.01
+
+    # Only what's changed since is accounted for
+    assert a.notify(title='', body='throttle') is True
+    assert ('apprise_throttle_total', {'schema': 'mtrc'}, 2) in \
+        metrics.samples()
+
+    text = metrics.prometheus()
+    assert text.endswith('\n')
+    assert '# TYPE apprise_notify_total counter\n' in text
+    assert '# TYPE apprise_notify_duration_seconds histogram\n' in text
+    assert 'apprise_notify_total{schema="mtrc",status="success"} 3\n' \
+        in text
+    assert 'apprise_notify_duration_seconds_bucket{le="+Inf",' \
+        'schema="mtrc"} 5\n' in text
+    assert 'apprise_notify_duration_seconds_bucket{le="0.5",' \
+        'schema="mtrc"} ' in text
+
+    metrics.reset()
+    assert metrics.samples() == []
+    assert 'apprise_notify_total{' not in metrics.prometheus()
+
+    metrics.detach(a)
+    # We can be detached more then once
+    metrics.detach(a)
+    assert not a.pre_send_hooks
+    assert not a.send_hooks
+
+    assert a.notify(title='title', body='body') is True
+    assert metrics.samples() == []
+
+
+def test_apprise_metrics_labels():
+    """
+    API: AppriseMetrics() labels
+
+    """
+    class LabelNotification(NotifyBase):
+        protocol = ('label', 'alias')
+
+        def __init__(self, **kwargs):
+            super(LabelNotification, self).__init__(**kwargs)
+
+    class UnnamedNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super(UnnamedNotification, self).__init__(**kwargs)
+
+    # The first of our aliases is used
+    assert schema_of(LabelNotification()) == 'label'
+    assert schema_of(LabelNotification(secure=True)) == 'label'
+    assert schema_of(UnnamedNotification()) == 'unnamednotification'
+
+    # Our label values are escaped
+    metrics = AppriseMetrics()
+    metrics.post_send(LabelNotification(), True, 0.1)
+    metrics._schemas['a"b\\c\nd'] = metrics._schemas.pop('label')
+    assert 'apprise_notify_total{schema="a\\"b\\\\c\\nd",status="success"} 1' \
+        in metrics.prometheus()
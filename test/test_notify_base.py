@@ -26,6 +26,13 @@
 from apprise.plugins.NotifyBase import NotifyBase
 from apprise import NotifyType
 from apprise import NotifyImageSize
+from apprise import NotifyFormat
+from apprise import NotifyOverflow
+from apprise import CircuitState
+import zlib
+import logging
+import pytest
+from time import time
 from timeit import default_timer
 from apprise.utils import compat_is_basestring
 
@@ -71,6 +78,10 @@ def test_notify_base():
     # then other
     assert elapsed < 1.5
 
+    # We keep track of the time we spent throttling (but only when we did)
+    assert nb.throttle_count == 1
+    assert nb.throttle_time == 1.0
+
     # our NotifyBase wasn't initialized with an ImageSize so this will fail
     assert nb.image_url(notify_type=NotifyType.INFO) is None
     assert nb.image_path(notify_type=NotifyType.INFO) is None
@@ -192,3 +203,414 @@ def test_notify_base_urls():
     assert NotifyBase.parse_url('http:///') is None
     assert NotifyBase.parse_url('http://:test/') is None
     assert NotifyBase.parse_url('http://pass:test/') is None
+
+
+def test_notify_base_compression():
+    """
+    API: NotifyBase() Request Body Compression
+
+    """
+    # invalid compressions throw exceptions
+    try:
+        nb = NotifyBase(compress='invalid')
+        assert False
+    except TypeError:
+        assert True
+
+    # No compression by default
+    nb = NotifyBase()
+    headers = {}
+    body = 'a' * (nb.compress_min_bytes * 2)
+    assert nb.compress_body(body, headers) == body
+    assert 'Content-Encoding' not in headers
+
+    # Small bodies are left alone
+    nb = NotifyBase(compress='GZIP')
+    assert nb.compress == 'gzip'
+    headers = {}
+    assert nb.compress_body('small', headers) == b'small'
+    assert 'Content-Encoding' not in headers
+
+    # gzip
+    headers = {}
+    data = nb.compress_body(body, headers)
+    assert headers['Content-Encoding'] == 'gzip'
+    assert len(data) < len(body)
+    assert zlib.decompress(data, 16 + zlib.MAX_WBITS) == body.encode('utf-8')
+
+    # deflate
+    nb = NotifyBase(compress='deflate')
+    headers = {}
+    data = nb.compress_body(body, headers)
+    assert headers['Content-Encoding'] == 'deflate'
+    assert zlib.decompress(data) == body.encode('utf-8')
+
+    # URL handling
+    results = NotifyBase.parse_url('json://localhost?compress=GZIP')
+    assert results['compress'] == 'gzip'
+
+    results = NotifyBase.parse_url('json://localhost?compress=invalid')
+    assert 'compress' not in results
+
+
+def test_notify_base_overflow():
+    """
+    API: NotifyBase() Overflow Handling
+
+    """
+    # invalid overflow modes throw exceptions
+    try:
+        nb = NotifyBase(overflow='invalid')
+        assert False
+    except TypeError:
+        assert True
+
+    body = 'line one\nline two\n\nparagraph two is here'
+
+    # The default is to leave our message alone
+    nb = NotifyBase()
+    nb.body_maxlen = 10
+    nb.title_maxlen = 5
+    assert nb.overflow_mode == NotifyOverflow.UPSTREAM
+    assert nb.split_message('title too long', body) == \
+        [('title too long', body)]
+
+    # Truncate on a word boundary
+    nb = NotifyBase(overflow='TRUNCATE')
+    nb.body_maxlen = 15
+    nb.title_maxlen = 5
+    assert nb.split_message('title too long', body) == \
+        [('title', 'line one\nline ')]
+
+    # Messages that fit are not touched
+    assert nb.split_message('title', 'short') == [('title', 'short')]
+
+    # Summarize leaves a note of how much was left out
+    nb = NotifyBase(overflow=NotifyOverflow.SUMMARIZE)
+    nb.body_maxlen = len(body) - 1
+    results = nb.split_message('title', body)
+    assert len(results) == 1
+    assert len(results[0][1]) <= nb.body_maxlen
+    assert results[0][1].endswith('characters omitted]')
+
+    # We're truncated if there is no room for our summary
+    nb.body_maxlen = 20
+    assert len(nb.overflow_summary.format(len(body))) >= nb.body_maxlen
+    results = nb.split_message('title', body)
+    assert results == [('title', 'line one\nline two\n\n')]
+    assert len(results[0][1]) <= nb.body_maxlen
+
+    nb.body_maxlen = len(nb.overflow_summary.format(len(body)))
+    results = nb.split_message('title', body)
+    assert len(results[0][1]) <= nb.body_maxlen
+    assert not results[0][1].endswith('characters omitted]')
+
+    nb.body_maxlen += 1
+    results = nb.split_message('title', body)
+    assert len(results[0][1]) <= nb.body_maxlen
+    assert results[0][1].endswith('characters omitted]')
+
+    # Split on paragraph, line and word boundaries
+    nb = NotifyBase(overflow=NotifyOverflow.SPLIT)
+    nb.body_maxlen = 20
+    results = nb.split_message('title', body)
+    assert results[0] == ('title', 'line one\nline two\n\n')
+    assert ''.join([r[1] for r in results]) == body
+    for _, chunk in results[1:]:
+        assert _ == ''
+        assert len(chunk) <= nb.body_maxlen
+
+    # No boundaries to work with at all
+    nb.body_maxlen = 4
+    results = nb.split_message('', 'a' * 10)
+    assert [r[1] for r in results] == ['aaaa', 'aaaa', 'aa']
+
+    # UTF-8 content is split on characters (not bytes)
+    body = u'\u00e9' * 10
+    results = nb.split_message(b'title', body.encode('utf-8'))
+    assert results[0][0] == u'title'
+    assert u''.join([r[1] for r in results]) == body
+
+    # Markdown code blocks are closed and re-opened across a split
+    nb = NotifyBase(
+        overflow=NotifyOverflow.SPLIT, format=NotifyFormat.MARKDOWN)
+    nb.body_maxlen = 20
+    results = nb.split_message('', '```\nline one\nline two\n```')
+    assert len(results) > 1
+    for _, chunk in results:
+        assert chunk.count('```') % 2 == 0
+        assert len(chunk) <= nb.body_maxlen
+
+    # HTML tags (and entities) are never cut in half
+    nb = NotifyBase(overflow=NotifyOverflow.SPLIT, format=NotifyFormat.HTML)
+    nb.body_maxlen = 20
+    body = '<b>bold</b> <a href="/x">link</a> fish &amp; chips &#38; peas'
+    results = nb.split_message('', body)
+    assert ''.join([r[1] for r in results]) == body
+    for _, chunk in results:
+        assert len(chunk) <= nb.body_maxlen
+        assert chunk.count('<') == chunk.count('>')
+        assert chunk.count('&') == chunk.count(';')
+
+    # Unless a tag is all we have to work with
+    nb.body_maxlen = 10
+    body = '<a href="http://localhost">'
+    results = nb.split_message('', body)
+    assert ''.join([r[1] for r in results]) == body
+    for _, chunk in results:
+        assert len(chunk) <= nb.body_maxlen
+
+        # URL handling
+    results = NotifyBase.parse_url('json://localhost?overflow=Split')
+    assert results['overflow'] == 'split'
+
+    results = NotifyBase.parse_url('json://localhost?overflow=invalid')
+    assert 'overflow' not in results
+
+
+def test_notify_base_circuit():
+    """
+    API: NotifyBase() Circuit Breaker
+
+    """
+    # Our circuit breaker is disabled by default
+    nb = NotifyBase()
+    assert nb.circuit_max_failures == 0
+    for _ in range(nb.circuit_window):
+        nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.CLOSED
+    assert nb.circuit_allows() is True
+
+    nb = NotifyBase(circuit='5')
+    assert nb.circuit_max_failures == 5
+    assert nb.circuit_state == CircuitState.CLOSED
+    assert nb.circuit_allows(now=0) is True
+
+    # Consecutive failures open our circuit
+    for _ in range(nb.circuit_max_failures - 1):
+        nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.CLOSED
+
+    # A success resets our count
+    nb.circuit_report(True, now=0)
+    for _ in range(nb.circuit_max_failures - 1):
+        nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.CLOSED
+
+    nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.OPEN
+    assert nb.circuit_allows(now=nb.circuit_reset_time - 1) is False
+
+    # Once our reset time passes we probe our service; a failure opens our
+    # circuit again
+    assert nb.circuit_allows(now=nb.circuit_reset_time) is True
+    assert nb.circuit_state == CircuitState.HALF_OPEN
+    nb.circuit_report(False, now=nb.circuit_reset_time)
+    assert nb.circuit_state == CircuitState.OPEN
+    assert nb.circuit_allows(now=nb.circuit_reset_time + 1) is False
+
+    # Only a single probe is let through at a time
+    assert nb.circuit_allows(now=nb.circuit_reset_time * 2) is True
+    assert nb.circuit_allows(now=nb.circuit_reset_time * 2) is False
+    assert nb.circuit_state == CircuitState.HALF_OPEN
+
+    # A successful probe closes it
+    nb.circuit_report(True, now=nb.circuit_reset_time * 2)
+    assert nb.circuit_state == CircuitState.CLOSED
+    assert nb.circuit_allows(now=nb.circuit_reset_time * 2) is True
+
+    # A probe that is never reported doesn't hold our circuit half open
+    # forever
+    for _ in range(nb.circuit_max_failures):
+        nb.circuit_report(False, now=0)
+    assert nb.circuit_allows(now=nb.circuit_reset_time) is True
+    assert nb.circuit_allows(now=nb.circuit_reset_time * 2 - 1) is False
+    assert nb.circuit_allows(now=nb.circuit_reset_time * 2) is True
+
+    # Our error rate opens our circuit too (without ever reaching our
+    # maximum consecutive failures)
+    nb = NotifyBase(circuit=5)
+    for _ in range(nb.circuit_window):
+        nb.circuit_report(False, now=0)
+        nb.circuit_report(True, now=0)
+        if nb.circuit_state == CircuitState.OPEN:
+            break
+    assert nb.circuit_state == CircuitState.OPEN
+
+    # Notifications our service rejected (rather then failed to handle)
+    # aren't held against it
+    nb = NotifyBase(circuit=1)
+    assert nb.circuit_allows(now=0) is True
+    nb.circuit_response(401)
+    nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.CLOSED
+
+    # What was answered is only ever reported once
+    assert nb.circuit_allows(now=0) is True
+    nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.OPEN
+
+    nb = NotifyBase(circuit=1)
+    nb.circuit_response(503)
+    nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.OPEN
+
+    # Invalid settings leave our circuit breaker disabled
+    for circuit in ('-1', 'invalid', None):
+        assert NotifyBase(circuit=circuit).circuit_max_failures == 0
+
+    # URL handling
+    results = NotifyBase.parse_url('json://localhost?circuit=3')
+    assert results['circuit'] == '3'
+
+    results = NotifyBase.parse_url('json://localhost?circuit=')
+    assert 'circuit' not in results
+
+
+def test_notify_base_timeout():
+    """
+    API: NotifyBase() Timeouts
+
+    """
+    nb = NotifyBase()
+    assert nb.request_timeout == nb.timeout
+
+    nb = NotifyBase(timeout='2.5')
+    assert nb.timeout == 2.5
+    assert nb.request_timeout == 2.5
+
+    # Invalid timeouts are ignored
+    assert NotifyBase(timeout='invalid').timeout == NotifyBase.timeout
+    assert NotifyBase(timeout=0).timeout == NotifyBase.timeout
+    assert NotifyBase(timeout=None).timeout == NotifyBase.timeout
+
+    # Our deadline caps our timeout
+    nb.deadline = time() + 1
+    assert 0 < nb.request_timeout <= 1
+
+    # We never hand out a timeout of zero (or less)
+    nb.deadline = time() - 1
+    assert nb.request_timeout == nb.timeout_min
+
+    # We don't throttle beyond our deadline
+    start = default_timer()
+    nb.throttle(throttle_time=10)
+    assert default_timer() - start < 1
+
+    # URL handling
+    results = NotifyBase.parse_url('json://localhost?timeout=30')
+    assert results['timeout'] == '30'
+
+
+def test_notify_base_loggable():
+    """
+    API: NotifyBase() loggable()
+
+    """
+    nb = NotifyBase()
+
+    # Our secrets are masked
+    payload = {
+        'token': 'abc123',
+        'title': 'title',
+        'extra': {'apikey': 'abc123', 'pw': 'abc123'},
+        'targets': [{'password': 'abc123'}],
+    }
+    content = str(nb.loggable(payload))
+    assert 'abc123' not in content
+    assert "'title': 'title'" in content
+
+    # Our payload isn't changed
+    assert payload['token'] == 'abc123'
+
+    # As are those found in URLs and responses
+    content = str(nb.loggable(
+        'https://localhost/?access_token=abc123&signature=abc123&title=a'))
+    assert content == \
+        'https://localhost/?access_token=****&signature=****&title=a'
+
+    assert str(nb.loggable(b'{"token": "abc123", "ok": true}')) == \
+        '{"token": "****", "ok": true}'
+
+    # Large content is truncated
+    nb.debug_maxlen = 10
+    assert str(nb.loggable('a' * 30)) == 'aaaaaaaaaa... (20 more characters)'
+
+    # No work is done unless we're logged
+    class Content(object):
+        def __str__(self):
+            raise AssertionError('Content was formatted')
+
+    level = nb.logger.level
+    nb.logger.setLevel(logging.INFO)
+    try:
+        nb.logger.debug('Content: %s', nb.loggable(Content()))
+
+    finally:
+        nb.logger.setLevel(level)
+
+
+def test_notify_base_shared():
+    """
+    API: NotifyBase() shared state
+
+    """
+    from apprise import Apprise
+    from apprise import AppriseAsset
+
+    # Services with the same tags (and headers) share them
+    nb1 = NotifyBase(tag='a, b', headers={'X-Key': 'value'})
+    nb2 = NotifyBase(tag='b, a', headers={'X-Key': 'value'})
+    assert nb1.tags == set(['a', 'b'])
+    assert nb1.tags is nb2.tags
+    assert nb1.headers == {'X-Key': 'value'}
+    assert nb1.headers is nb2.headers
+
+    assert NotifyBase(tag='c').tags is not nb1.tags
+    assert NotifyBase(headers={'X-Key': 'other'}).headers is not nb1.headers
+
+    # Which is only safe because they can't be changed
+    with pytest.raises(AttributeError):
+        nb1.tags.add('c')
+
+    for mutate in (
+            lambda h: h.__setitem__('X-Key', 'other'),
+            lambda h: h.__delitem__('X-Key'),
+            lambda h: h.update({'X-Key': 'other'}),
+            lambda h: h.pop('X-Key'),
+            lambda h: h.setdefault('X-Other', 'value'),
+            lambda h: h.clear()):
+        with pytest.raises(TypeError):
+            mutate(nb1.headers)
+    assert nb1.headers == {'X-Key': 'value'}
+
+    # Headers that can't be shared are still accepted
+    nb = NotifyBase(headers={'X-Key': ['value']})
+    assert nb.headers == {'X-Key': ['value']}
+
+    # The services an Apprise object loads share its asset
+    asset = AppriseAsset()
+    a = Apprise(asset=asset)
+    assert a.add('json://localhost') is True
+    assert a.add('xml://localhost') is True
+    assert all(server.asset is asset for server in a.servers)
+
+    # Otherwise our services share a single default
+    assert NotifyBase().asset is NotifyBase().asset
+    assert NotifyBase().asset is not asset
+    assert NotifyBase(asset=asset).asset is asset
+
+    # Our circuit breaker only tracks our most recent results
+    nb = NotifyBase()
+    nb.circuit_max_failures = nb.circuit_window + 1
+    nb.circuit_error_rate = 1.0
+    for _ in range(nb.circuit_window * 4):
+        nb.circuit_report(True, now=0)
+    assert nb._circuit_results == nb.circuit_window
+    assert nb._circuit_history == 0
+
+    for _ in range(nb.circuit_window - 1):
+        nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.CLOSED
+    nb.circuit_report(False, now=0)
+    assert nb.circuit_state == CircuitState.OPEN
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import mock
+import pstats
+import threading
+from os.path import join
+
+try:
+    # Python 2.7
+    from StringIO import StringIO
+
+except ImportError:
+    # Python 3.x
+    from io import StringIO
+
+from apprise import Apprise
+from apprise import NotifyBase
+from apprise import profiler as apprise_profiler
+from apprise.profiler import AppriseProfiler
+
+
+def _functions(stats):
+    """
+    Returns the names of the functions found in the statistics provided
+    """
+    return set(function for _, _, function in stats.stats.keys())
+
+
+def test_apprise_profiler(tmpdir):
+    """
+    API: AppriseProfiler()
+
+    """
+    # Other tests reload our modules, so look up our current schema map
+    from apprise.Apprise import SCHEMA_MAP
+
+    def profiled_send():
+        return sum(range(1000))
+
+    class ProfileNotification(NotifyBase):
+        protocol = 'profile'
+
+        def __init__(self, **kwargs):
+            super(ProfileNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            profiled_send()
+            return True
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['profile'] = ProfileNotification
+
+    profiler = AppriseProfiler()
+    assert profiler.labels() == []
+    assert profiler.stats() is None
+
+    # Stopping what was never started does nothing
+    profiler.stop()
+
+    a = Apprise()
+    assert a.profiler is None
+
+    profiler.attach(a)
+    # We're only ever attached once
+    profiler.attach(a)
+    assert a.profiler is profiler
+    assert len(a.pre_send_hooks) == 1
+    assert len(a.send_hooks) == 1
+
+    assert a.add('profile://localhost')
+    assert a.notify(title='title', body='body') is True
+
+    # Notifications are sent from several threads too
+    threads = [
+        threading.Thread(
+            target=a.notify, kwargs={'title': 'title', 'body': 'body'})
+        for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(profiler.labels()) == ['add', 'notify', 'profile']
+    assert profiler._calls == {'add': 1, 'notify': 4, 'profile': 4}
+
+    # The time spent sending is only accounted for under our schema
+    assert 'profiled_send' in _functions(profiler.stats('profile'))
+    assert 'profiled_send' not in _functions(profiler.stats('notify'))
+    assert '_notify' in _functions(profiler.stats('notify'))
+    assert 'instantiate' in _functions(profiler.stats('add'))
+
+    # Every thread's profile is accounted for
+    stats = profiler.stats('profile').stats
+    assert [
+        calls for (_, _, function), (_, calls, _, _, _) in stats.items()
+        if function == 'profiled_send'] == [4]
+
+    # Everything
+    functions = _functions(profiler.stats())
+    assert 'profiled_send' in functions
+    assert 'instantiate' in functions
+
+    # Our report
+    stream = StringIO()
+    profiler.report(stream=stream, limit=5)
+    report = stream.getvalue()
+    assert 'profile: 4 call(s) in ' in report
+    assert 'notify: 4 call(s) in ' in report
+    assert 'add: 1 call(s) in ' in report
+    assert 'profiled_send' in report
+
+    # Save our profiles
+    path = str(tmpdir.join('apprise.pstats'))
+    profiler.dump(path)
+    assert 'profiled_send' in _functions(pstats.Stats(path))
+
+    path = str(tmpdir.join('{label}.pstats'))
+    profiler.dump(path)
+    for label in ('add', 'notify', 'profile'):
+        stats = pstats.Stats(join(str(tmpdir), '%s.pstats' % label))
+        assert ('profiled_send' in _functions(stats)) is \
+            (label == 'profile')
+
+    # Nothing to save
+    path = str(tmpdir.join('missing.pstats'))
+    profiler.dump(path, label='missing')
+    assert not tmpdir.join('missing.pstats').check()
+
+    # A hook that fails before ours keeps our pre_send() from being run; we
+    # don't stop (or account for our schema under) the notify profile
+    # wrapping it
+    def broken_hook(server, title, body, notify_type):
+        raise ValueError()
+
+    a.pre_send_hooks.insert(0, broken_hook)
+    assert a.notify(title='title', body='body') is False
+    a.pre_send_hooks.remove(broken_hook)
+
+    assert profiler._calls == {'add': 1, 'notify': 5, 'profile': 4}
+    assert not profiler._local.stack
+
+    profiler.start('notify')
+    profiler.post_send(a.servers[0], False, 0.0)
+    assert [label for label, _ in profiler._local.stack] == ['notify']
+    profiler.stop('notify')
+
+    # Only the label running is ever stopped
+    profiler.start('outer')
+    profiler.start('inner')
+    profiler.stop('outer')
+    assert [label for label, _ in profiler._local.stack] == \
+        ['outer', 'inner']
+    profiler.stop('inner')
+    profiler.stop('outer')
+    assert not profiler._local.stack
+    del profiler._profiles['outer'], profiler._profiles['inner']
+
+    profiler.detach(a)
+    # We can be detached more then once
+    profiler.detach(a)
+    assert a.profiler is None
+    assert not a.pre_send_hooks
+    assert not a.send_hooks
+
+    assert a.notify(title='title', body='body') is True
+    assert profiler._calls['notify'] == 6
+
+
+@mock.patch('atexit.register')
+def test_apprise_profiler_environment(mock_register, tmpdir):
+    """
+    API: AppriseProfiler() environment
+
+    """
+    with mock.patch.dict('os.environ', {}, clear=True):
+        assert AppriseProfiler.from_environment() is None
+        assert Apprise().profiler is None
+
+    with mock.patch.object(apprise_profiler, '_ENVIRONMENT_PROFILER', None):
+        with mock.patch.dict('os.environ', {'APPRISE_PROFILE': 'yes'}):
+            profiler = AppriseProfiler.from_environment()
+            assert isinstance(profiler, AppriseProfiler)
+
+            # The same profiler is shared by all
+            assert AppriseProfiler.from_environment() is profiler
+            assert Apprise().profiler is profiler
+            assert Apprise().profiler is profiler
+
+            # Our report is written when we exit
+            mock_register.assert_called_once_with(profiler.report)
+
+    mock_register.reset_mock()
+    path = str(tmpdir.join('apprise.pstats'))
+    with mock.patch.object(apprise_profiler, '_ENVIRONMENT_PROFILER', None):
+        with mock.patch.dict('os.environ', {'APPRISE_PROFILE': path}):
+            profiler = AppriseProfiler.from_environment()
+
+            # Our profile is saved when we exit
+            mock_register.assert_called_once_with(profiler.dump, path)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+from json import dumps
+
+import requests
+from click.testing import CliRunner
+
+from apprise import Apprise
+from apprise import NotifyBase
+from apprise import server as apprise_server
+
+
+def test_apprise_server():
+    """
+    API: AppriseHTTPServer()
+
+    """
+    # Other tests reload our modules, so look up our current schema map
+    from apprise.Apprise import SCHEMA_MAP
+
+    # Used to hold our workers up
+    release = threading.Event()
+    release.set()
+
+    # Set once a worker starts sending a notification
+    busy = threading.Event()
+
+    class ServerNotification(NotifyBase):
+        service_name = 'Server'
+
+        def __init__(self, **kwargs):
+            super(ServerNotification, self).__init__(**kwargs)
+
+        def notify(self, title, body, notify_type, **kwargs):
+            busy.set()
+            release.wait()
+            if body == 'throw':
+                raise AttributeError()
+            return notify_type != 'failure'
+
+    # Store our notifications into our schema map
+    SCHEMA_MAP['server'] = ServerNotification
+
+    a = Apprise(servers='server://localhost')
+    server = apprise_server.AppriseHTTPServer(
+        ('localhost', 0), a, workers=1, queue_size=2, max_body=1024)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    url = 'http://localhost:%d' % server.server_address[1]
+    try:
+        r = requests.post(url + '/notify', data=dumps({'body': 'body'}))
+        assert r.status_code == 200
+        assert r.json() == {'status': True}
+
+        r = requests.post(url + '/notify/', data=dumps(
+            {'title': 'title', 'body': 'body', 'type': 'failure'}))
+        assert r.status_code == 502
+        assert r.json() == {'status': False}
+
+        r = requests.post(url + '/notify/batch', data=dumps([
+            {'body': 'body'}, {'body': 'throw'}]))
+        assert r.status_code == 502
+        assert r.json() == {
+            'status': False,
+            'results': [{'status': True}, {'status': False}],
+        }
+
+        # Bad requests
+        assert requests.post(url + '/notify', data='{').status_code == 400
+        assert requests.post(url + '/notify', data='[]').status_code == 400
+        assert requests.post(
+            url + '/notify/batch', data='[]').status_code == 400
+        assert requests.post(
+            url + '/notify', data='a' * 1025).status_code == 413
+        assert requests.post(url + '/unknown', data='{}').status_code == 404
+        assert requests.get(url + '/unknown').status_code == 404
+
+        # Batches too large for our queue are rejected
+        r = requests.post(
+            url + '/notify/batch', data=dumps([{'body': 'a'}] * 3))
+        assert r.status_code == 429
+
+        # As are requests made while our queue is full; hold our worker up
+        # and fill our queue
+        release.clear()
+        results = []
+
+        def client():
+            results.append(
+                requests.post(url + '/notify', data=dumps({'body': 'body'})))
+
+        clients = [threading.Thread(target=client) for _ in range(3)]
+        busy.clear()
+        clients[0].start()
+
+        # Wait for our worker to pick up our first request
+        assert busy.wait(10)
+
+        for c in clients[1:]:
+            c.start()
+
+        while server._queue.qsize() < 2:
+            # Wait for our queue to fill
+            release.wait(0.01)
+
+        r = requests.post(url + '/notify', data=dumps({'body': 'body'}))
+        assert r.status_code == 429
+
+        release.set()
+        for c in clients:
+            c.join()
+        assert [r.status_code for r in results] == [200] * 3
+
+        # Our statistics
+        r = requests.get(url + '/stats')
+        assert r.status_code == 200
+        stats = r.json()
+        assert stats['workers'] == 1
+        assert stats['queued'] == 0
+        assert stats['rejected'] == 2
+        assert stats['plugins']['Server']['sent'] == 7
+        assert stats['plugins']['Server']['failed'] == 2
+        assert stats['plugins']['Server']['throughput'] > 0
+        assert stats['plugins']['Server']['latency']['min'] <= \
+            stats['plugins']['Server']['latency']['avg'] <= \
+            stats['plugins']['Server']['latency']['max']
+
+        r = requests.get(url + '/metrics')
+        assert r.status_code == 200
+        assert r.headers['Content-Type'].startswith('text/plain')
+        assert 'apprise_notify_total{schema="servernotification",' \
+            'status="success"} 5\n' in r.text
+        assert 'apprise_notify_total{schema="servernotification",' \
+            'status="failure"} 2\n' in r.text
+
+    finally:
+        release.set()
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    # Our statistics are no longer gathered
+    assert len(a.send_hooks) == 0
+    assert len(a.pre_send_hooks) == 0
+
+
+def test_apprise_server_cli():
+    """
+    API: AppriseHTTPServer() CLI
+
+    """
+    runner = CliRunner()
+
+    # No servers specified
+    result = runner.invoke(apprise_server.main, [])
+    assert result.exit_code == 1
+
+    result = runner.invoke(apprise_server.main, ['-h'])
+    assert result.exit_code == 0
@@ -27,6 +27,8 @@ from apprise import plugins
 from apprise import NotifyType
 from apprise import Apprise
 import mock
+import pytest
+import time
 
 
 TEST_URLS = (
@@ -119,9 +121,11 @@ def test_plugin(mock_oauth, mock_api):
             assert(isinstance(e, instance))
 
 
+@mock.patch('apprise.plugins.tweepy.API.get_user')
 @mock.patch('apprise.plugins.tweepy.API.send_direct_message')
 @mock.patch('apprise.plugins.tweepy.OAuthHandler.set_access_token')
-def test_twitter_plugin_init(set_access_token, send_direct_message):
+def test_twitter_plugin_init(set_access_token, send_direct_message,
+                             get_user):
     """
     API: NotifyTwitter Plugin() (pt2)
 
@@ -194,3 +198,212 @@ def test_twitter_plugin_init(set_access_token, send_direct_message):
     assert obj.notify(
         title='test', body='body',
         notify_type=NotifyType.INFO) is False
+
+    # Our authenticated client is cached and re-used for every message
+    send_direct_message.side_effect = None
+    get_user.return_value = mock.Mock(id=12345)
+    set_access_token.reset_mock()
+
+    assert obj.notify(
+        title='test', body='body',
+        notify_type=NotifyType.INFO) is True
+    assert obj.notify(
+        title='test', body='body',
+        notify_type=NotifyType.INFO) is True
+
+    assert set_access_token.call_count == 0
+    send_direct_message.assert_called_with(
+        user_id=12345, text='test\r\nbody', deadline=mock.ANY,
+        timeout=obj.request_timeout)
+
+    # Rate limits we can't wait out are reported as a failure
+    send_direct_message.return_value = plugins.tweepy.RateLimited(0)
+    assert obj.notify(
+        title='test', body='body',
+        notify_type=NotifyType.INFO) is False
+
+
+def test_twitter_memory_cache():
+    """
+    API: NotifyTwitter tweepy MemoryCache
+
+    """
+    cache = plugins.tweepy.MemoryCache(timeout=60, size=2)
+    cache.store('a', 1)
+    cache.store('b', 2)
+
+    # Accessing 'a' makes 'b' our least recently used entry
+    assert cache.get('a') == 1
+    cache.store('c', 3)
+
+    assert cache.count() == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+    # Unbounded caches never evict anything
+    cache = plugins.tweepy.MemoryCache(timeout=60)
+    for i in range(100):
+        cache.store(i, i)
+    assert cache.count() == 100
+
+
+def test_twitter_binder_deadline():
+    """
+    API: NotifyTwitter tweepy rate limit deadline
+
+    """
+    api = plugins.tweepy.API(wait_on_rate_limit=True)
+
+    reset_time = int(time.time()) + 900
+    response = mock.Mock()
+    response.status_code = 429
+    response.headers = {
+        'x-rate-limit-remaining': '0',
+        'x-rate-limit-reset': str(reset_time),
+    }
+
+    with mock.patch.object(api.session, 'request') as mock_request:
+        mock_request.return_value = response
+
+        # Our rate limit can't be waited out before our deadline, so we're
+        # returned a RateLimited result instead of sleeping
+        result = api.get_user(
+            screen_name='apprise', deadline=time.time() + 10)
+        assert isinstance(result, plugins.tweepy.RateLimited)
+        assert result.reset_time == reset_time + 5
+        assert result.response is response
+        assert mock_request.call_count == 1
+
+        # Our deadline isn't passed along as a parameter
+        assert 'deadline' not in mock_request.call_args[1]['params']
+        assert mock_request.call_args[1]['params'] == {
+            'screen_name': b'apprise'}
+
+        # Retry-After delays are honoured the same way
+        response.headers = {'retry-after': '120'}
+        result = api.get_user(
+            screen_name='apprise', deadline=time.time() + 10,
+            retry_count=1)
+        assert isinstance(result, plugins.tweepy.RateLimited)
+        assert result.reset_time > time.time() + 100
+
+        # Errors that aren't rate limits are raised as they always have been
+        response.status_code = 500
+        response.text = ''
+        with pytest.raises(plugins.tweepy.TweepError):
+            api.get_user(
+                screen_name='apprise', deadline=time.time() + 10,
+                retry_count=1, retry_delay=60)
+
+
+def test_twitter_binder_shared_session():
+    """
+    API: NotifyTwitter tweepy calls sharing a session
+
+    """
+    api = plugins.tweepy.API(auth_handler=mock.Mock())
+
+    # Building one call doesn't change another that shares our session
+    user = api.get_user(screen_name='alice', create=True)
+    message = api.send_direct_message(
+        user_id=1, text='secret', timeout=5, create=True)
+    assert user.session is message.session
+    assert user.params == {'screen_name': b'alice'}
+    assert message.params == {'user_id': b'1', 'text': b'secret'}
+
+    # Our timeout is per call too
+    assert user.timeout == api.timeout
+    assert message.timeout == 5
+
+    response = mock.Mock(status_code=200, headers={}, text='{}')
+    with mock.patch.object(api.session, 'request') as mock_request:
+        mock_request.return_value = response
+        user.execute()
+
+    assert mock_request.call_args[1]['params'] == {'screen_name': b'alice'}
+    assert mock_request.call_args[1]['headers']['Host'] == api.host
+    assert mock_request.call_args[1]['timeout'] == api.timeout
+
+    # Our session itself is left alone
+    assert 'screen_name' not in api.session.params
+    assert 'Host' not in api.session.headers
+
+
+def test_twitter_memory_cache_budget():
+    """
+    API: NotifyTwitter tweepy MemoryCache byte budget and counters
+
+    """
+    cache = plugins.tweepy.MemoryCache(timeout=60, max_bytes=1024)
+    cache.store('a', 'a' * 400)
+    cache.store('b', 'b' * 400)
+    assert cache.count() == 2
+    assert 800 < cache.bytes <= 1024
+
+    # Adding a third entry exceeds our budget; the least recently used
+    # entry is evicted
+    assert cache.get('a') == 'a' * 400
+    cache.store('c', 'c' * 400)
+    assert cache.count() == 2
+    assert cache.bytes <= 1024
+    assert cache.get('b') is None
+
+    # Entries that could never fit are simply not stored
+    cache.store('d', 'd' * 2048)
+    assert cache.get('d') is None
+    assert cache.count() == 2
+
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'evictions': 1}
+
+    # Replacing an entry keeps our accounting intact
+    cache.store('c', 'c')
+    assert cache.count() == 2
+    assert cache.bytes < 500
+
+    cache.flush()
+    assert cache.count() == 0
+    assert cache.bytes == 0
+
+
+def test_twitter_file_cache(tmpdir):
+    """
+    API: NotifyTwitter tweepy FileCache
+
+    """
+    cache = plugins.tweepy.FileCache(str(tmpdir.join('cache')), timeout=60)
+    cache.store('a', {'id': 1})
+    cache.store('b', {'id': 2})
+    cache.store('b', {'id': 3})
+    assert cache.count() == 2
+
+    assert cache.get('a') == {'id': 1}
+    assert cache.get('b') == {'id': 3}
+    assert cache.get('c') is None
+
+    # Our entries are kept in a single database shared by all instances
+    # pointing to the same directory
+    other = plugins.tweepy.FileCache(str(tmpdir.join('cache')), timeout=60)
+    assert other.get('a') == {'id': 1}
+
+    # Expired entries are removed when accessed
+    assert cache.get('a', timeout=-1) == {'id': 1}
+    with mock.patch('time.time', return_value=time.time() + 120):
+        assert cache.get('a') is None
+        assert cache.count() == 1
+
+        # and in a single batch when we clean up
+        cache.cleanup()
+        assert cache.count() == 0
+
+    assert cache.stats() == {'hits': 3, 'misses': 2, 'evictions': 2}
+
+    # Python can be built without SQLite; we're unavailable (but the rest of
+    # tweepy, and in turn Apprise, isn't)
+    with mock.patch.object(plugins.tweepy.cache, 'sqlite3', None):
+        with pytest.raises(ImportError):
+            plugins.tweepy.FileCache(str(tmpdir.join('cache')))
+
+    cache.store('a', 'value')
+    cache.flush()
+    assert cache.count() == 0